@@ -0,0 +1,525 @@
+import hashlib
+from typing import NamedTuple
+import numpy as np
+import pandas as pd
+
+from data_store import COLUMN_DTYPES, SEGMENT_KEY, TABLE_COLUMNS
+
+# ============================================================================
+# AGGREGATE STATES
+# ============================================================================
+#
+# An AggState summarizes a set of values by count, mean, M2 (the sum of squared
+# deviations from the mean), min and max. States of disjoint sets merge with
+# Chan et al.'s parallel update, so per-partition, per-cell or per-process
+# states combine into the state of the union without revisiting rows, and the
+# variance and confidence interval follow from the merged state. Unlike a sum
+# of squares, M2 does not cancel catastrophically when the mean is large
+# against the spread. Fields may be scalars or aligned arrays/Series, i.e. one
+# state per group.
+
+# How the extremes merge; counts, means and M2 merge by Chan's update
+_MERGE_UFUNCS = {'min': np.fmin, 'max': np.fmax}
+
+# Two-sided 95% normal quantile
+Z_95 = 1.959964
+
+# Every summary rounds the means it returns to this many decimals (round_means), far finer than the 1-3
+# the data is given in. Otherwise summation order decides which way a mean on a display tie rounds: 3.515
+# summed row by row is 3.5149999999999992, shown as 3.51 where pandas' groupby shows 3.52. Aggregate
+# states keep their exact means; only the summaries built from them are rounded.
+MEAN_DECIMALS = 9
+
+def round_means(means):
+    """Means (a scalar, array, Series or frame) as summaries return them"""
+    return np.round(means, MEAN_DECIMALS)
+
+def _ratio(numerator, denominator):
+    # NaN (rather than a warning or ZeroDivisionError) for empty states
+    with np.errstate(divide='ignore', invalid='ignore'):
+        return np.divide(numerator, denominator)
+
+def _weighted(count, value):
+    # count * value, where an empty state's (NaN) value counts as nothing
+    return count * np.nan_to_num(value)
+
+class AggState(NamedTuple):
+    """Mergeable count, mean, M2 (sum of squared deviations from the mean), min and max of a set of values"""
+    count: int = 0
+    mean: float = np.nan
+    m2: float = 0.0
+    min: float = np.inf
+    max: float = -np.inf
+
+    @classmethod
+    def of(cls, values):
+        """State of an array of values"""
+        values = np.asarray(values, dtype=np.float64)
+        mean = values.mean() if len(values) else np.nan
+        deviations = values - mean
+        return cls(len(values), mean, np.dot(deviations, deviations), values.min(initial=np.inf),
+                   values.max(initial=-np.inf))
+
+    def merge(self, other):
+        """State of the union of both states' values"""
+        # Chan's update: n = Σn, mean = Σ(n·mean)/n, M2 = Σ[M2 + n·(mean_i - mean)²]
+        count = self.count + other.count
+        mean = _ratio(_weighted(self.count, self.mean) + _weighted(other.count, other.mean), count)
+        m2 = (self.m2 + other.m2 + _weighted(self.count, (self.mean - mean) ** 2)
+              + _weighted(other.count, (other.mean - mean) ** 2))
+        return AggState(count, mean, m2, _MERGE_UFUNCS['min'](self.min, other.min),
+                        _MERGE_UFUNCS['max'](self.max, other.max))
+
+    @property
+    def var(self):
+        """Sample variance (ddof=1)"""
+        return _ratio(self.m2, self.count - 1)
+
+    @property
+    def std(self):
+        return np.sqrt(self.var)
+
+    def ci(self, z=Z_95):
+        """(low, high) confidence interval of the mean, by the normal approximation"""
+        half_width = z * _ratio(self.std, np.sqrt(self.count))
+        return self.mean - half_width, self.mean + half_width
+
+# ============================================================================
+# AGGREGATE CUBE
+# ============================================================================
+#
+# One row (cell) per distinct combination of a table's filter dimensions, e.g.
+# (Year, AI_Restriction_Status, Department) for professors, holding the row
+# Count and, for every numeric metric, the rest of its AggState. The state of
+# any set of cells, grouped by any of the dimensions, comes from merging cells
+# instead of rescanning rows: a cube has at most years x 3 x 5 cells however
+# many rows the table has.
+
+CUBE_DIMENSIONS = SEGMENT_KEY + ['Department', 'Learning_Style']
+CUBE_STATS = ['mean', 'm2', 'min', 'max']
+
+def cube_dimensions(table):
+    """Dimensions of a table's cube: the filter columns it has"""
+    return [name for name in CUBE_DIMENSIONS if name in TABLE_COLUMNS[table]]
+
+def cube_metrics(table):
+    """Metrics a table's cube holds states for: its numeric columns other than the dimensions"""
+    return [
+        name for name in TABLE_COLUMNS[table]
+        if name not in CUBE_DIMENSIONS
+        and pd.api.types.is_numeric_dtype(pd.api.types.pandas_dtype(COLUMN_DTYPES[name]))
+    ]
+
+def stat_column(metric, stat):
+    """Cube column holding one statistic of a metric"""
+    return f'{metric}__{stat}'
+
+def cube_name(table, version):
+    """Cache name of a table's cube; it changes with the table's content and with the cube's layout"""
+    layout = repr((cube_dimensions(table), cube_metrics(table), CUBE_STATS))
+    return f'{table}.cube-{hashlib.sha256((version + layout).encode()).hexdigest()[:16]}'
+
+def build_cube(keys, columns):
+    """Cube cells for the distinct rows of `keys`, with Count and the AggState of each of `columns`"""
+    grouped = keys.groupby(list(keys.columns), observed=True, sort=True)
+    cell = grouped.ngroup().to_numpy()
+    cube = grouped.size().rename('Count').reset_index()
+    count = cube['Count'].to_numpy()
+    for name, values in columns.items():
+        values = np.asarray(values, dtype=np.float64)
+        extremes = pd.Series(values).groupby(cell, sort=True).agg(['min', 'max'])
+        # Two passes: each cell's mean, then the squared deviations from it
+        mean = np.bincount(cell, weights=values, minlength=len(cube)) / count
+        deviations = values - mean[cell]
+        cube[stat_column(name, 'mean')] = mean
+        cube[stat_column(name, 'm2')] = np.bincount(cell, weights=deviations * deviations, minlength=len(cube))
+        cube[stat_column(name, 'min')] = extremes['min'].to_numpy()
+        cube[stat_column(name, 'max')] = extremes['max'].to_numpy()
+    return cube
+
+def cell_states(cells, metric):
+    """AggState of a metric with one entry per cube cell"""
+    return AggState(cells['Count'], *(cells[stat_column(metric, stat)] for stat in CUBE_STATS))
+
+def merge_cells(cells, metrics, by):
+    """Cube cells of the given metrics merged into one cell per group of `by`, or a single cell if by=()"""
+    if by:
+        grouped = cells.groupby(list(by), observed=True, sort=True)
+        group, index = grouped.ngroup().to_numpy(), grouped.size().index
+    else:
+        group, index = np.zeros(len(cells), np.intp), pd.RangeIndex(1)
+    # Chan's update over every cell of a group at once: n = Σn, mean = Σ(n·mean)/n, M2 = Σ[M2 + n·(mean_i - mean)²]
+    count = cells['Count'].to_numpy(np.float64)
+    total = np.bincount(group, weights=count, minlength=len(index))
+    merged = pd.DataFrame({'Count': total.astype(np.int64)}, index=index)
+    for metric in metrics:
+        state = cell_states(cells, metric)
+        means = state.mean.to_numpy(np.float64)
+        mean = _ratio(np.bincount(group, weights=count * means, minlength=len(index)), total)
+        spread = state.m2.to_numpy(np.float64) + count * (means - mean[group]) ** 2
+        merged[stat_column(metric, 'mean')] = round_means(mean)
+        merged[stat_column(metric, 'm2')] = np.bincount(group, weights=spread, minlength=len(index))
+        for stat in ('min', 'max'):
+            # With no cells at all (by=() over an empty selection) the extremes stay NaN, as pandas gives them
+            extreme = np.full(len(index), np.nan)
+            _MERGE_UFUNCS[stat].at(extreme, group, getattr(state, stat).to_numpy(np.float64))
+            merged[stat_column(metric, stat)] = extreme
+    return merged
+
+def rollup(cells, metrics, by):
+    """Mean of each metric and the Count per group of `by`, merged from cube cells; one row if by=()"""
+    merged = merge_cells(cells, metrics, by)
+    summary = pd.DataFrame({metric: cell_states(merged, metric).mean for metric in metrics},
+                           index=merged.index, columns=metrics)
+    summary['Count'] = merged['Count'].astype(np.int64)
+    return summary
+
+def rollup_stats(cells, metric, by, z=Z_95):
+    """Count, mean, std, min, max and confidence interval of a metric per group of `by`, merged from cube cells"""
+    state = cell_states(merge_cells(cells, [metric], by), metric)
+    ci_low, ci_high = state.ci(z)
+    return pd.DataFrame({
+        'Count': state.count.astype(np.int64), 'mean': state.mean, 'std': state.std,
+        'min': state.min, 'max': state.max, 'ci_low': ci_low, 'ci_high': ci_high,
+    })
+
+# ============================================================================
+# GROUP-BY KERNEL
+# ============================================================================
+#
+# Every dashboard grouping key (Year, AI_Restriction_Status, Department,
+# Learning_Style, Major, Year_of_Study) takes a handful of values, so a row's
+# group is a small integer: its key codes in mixed radix. Counts and sums of
+# any number of metrics then come from one np.bincount each, with no hashing
+# and no sort, and the groups come out in groupby(sort=True) order. Keys that
+# are not categorical/integer, or whose combinations exceed KERNEL_MAX_GROUPS,
+# go through pandas groupby as before.
+
+KERNEL_MAX_GROUPS = 1 << 16
+KERNEL_REDUCERS = {'mean', 'sum', 'count'}
+
+def _key_codes(key):
+    # (codes, labels of codes 0..n-1) of one key column; codes < 0 are missing keys
+    if isinstance(key.dtype, pd.CategoricalDtype):
+        return key.cat.codes.to_numpy(), key.cat.categories
+    values = key.to_numpy()
+    if values.dtype.kind not in 'iu':
+        return None
+    low, high = int(values.min()), int(values.max())
+    return np.subtract(values, low, dtype=np.intp), pd.Index(np.arange(low, high + 1), dtype=values.dtype)
+
+def group_codes(keys):
+    """(group number per row, index of the groups) for low-cardinality key columns, or None when they don't fit.
+
+    Group numbers are dense (0..n_groups-1) and ordered as groupby(sort=True) orders the groups; rows with a
+    missing key get -1, as groupby drops them.
+    """
+    if not len(keys) or not len(keys.columns):
+        return None
+    columns = [_key_codes(keys[name]) for name in keys.columns]
+    if any(column is None for column in columns):
+        return None
+    sizes = [len(labels) for _, labels in columns]
+    if np.prod(sizes, dtype=np.float64) > KERNEL_MAX_GROUPS:
+        return None
+
+    # Mixed-radix cell number of each row's key combination
+    cell = None
+    missing = None
+    for name, (codes, _), size in zip(keys.columns, columns, sizes):
+        if isinstance(keys[name].dtype, pd.CategoricalDtype):
+            # Categorical code -1 marks a missing key
+            absent = codes < 0
+            if absent.any():
+                missing = absent if missing is None else missing | absent
+        cell = codes.astype(np.intp) if cell is None else cell * size + codes
+
+    # Number the cells that have rows in order; when every cell has rows, the cell is the group
+    n_cells = int(np.prod(sizes))
+    present = np.bincount(cell if missing is None else cell[~missing], minlength=n_cells) > 0
+    if present.all():
+        group = cell
+    else:
+        group = (np.cumsum(present) - 1)[cell if missing is None else np.maximum(cell, 0)]
+    if missing is not None:
+        group[missing] = -1
+
+    cells = np.unravel_index(np.flatnonzero(present), sizes)
+    levels = [
+        pd.Categorical.from_codes(codes, dtype=keys[name].dtype) if isinstance(keys[name].dtype, pd.CategoricalDtype)
+        else labels[codes]
+        for name, codes, (_, labels) in zip(keys.columns, cells, columns)
+    ]
+    if len(levels) == 1:
+        return group, pd.Index(levels[0], name=keys.columns[0])
+    return group, pd.MultiIndex.from_arrays(levels, names=list(keys.columns))
+
+def group_sums(df, metrics, by):
+    """(group index, row Count, {metric: (sum, non-null count)}) per group of `by`, or None if the keys don't fit"""
+    codes = group_codes(df[list(by)])
+    if codes is None:
+        return None
+    group, index = codes
+    rows = group >= 0
+    rows = slice(None) if rows.all() else rows
+    group = group[rows]
+    count = np.bincount(group, minlength=len(index))
+    sums = {}
+    for metric in metrics:
+        values = df[metric].to_numpy()[rows]
+        if values.dtype.kind != 'f' or not np.isnan(values).any():
+            sums[metric] = (np.bincount(group, weights=values, minlength=len(index)), count)
+        else:
+            valid = ~np.isnan(values)
+            sums[metric] = (np.bincount(group[valid], weights=values[valid], minlength=len(index)),
+                            np.bincount(group[valid], minlength=len(index)))
+    return index, count, sums
+
+def _reduce(dtype, sums, reducer):
+    # One kernel reducer of a metric; float32 metrics stay float32, as pandas' groupby returns them
+    total, count = sums
+    if reducer == 'count':
+        return count.astype(np.int64)
+    value = total if reducer == 'sum' else round_means(_ratio(total, count))
+    return value.astype(dtype if dtype.kind == 'f' else np.float64)
+
+def summarize_frame(df, metrics, by):
+    """Mean of each metric and a Count of rows per group of `by`, in one grouped pass over a frame"""
+    metrics = list(metrics)
+    sums = group_sums(df, metrics, by)
+    if sums is None:
+        grouped = df.groupby(list(by), observed=True, sort=True)
+        summary = round_means(grouped[metrics].mean())
+        summary['Count'] = grouped.size()
+        return summary
+    index, count, sums = sums
+    summary = pd.DataFrame({metric: _reduce(df[metric].dtype, sums[metric], 'mean') for metric in metrics},
+                           index=index, columns=metrics)
+    summary['Count'] = count.astype(np.int64)
+    return summary
+
+# ============================================================================
+# QUANTILE SKETCHES
+# ============================================================================
+#
+# A t-digest style sketch keeps the distribution of a set of values as a few
+# weighted centroids (mean, weight), small near the tails and large in the
+# middle, plus the exact min and max. Sketches merge by pooling centroids, so
+# quantiles of any set of cube cells come from the cells' sketches without
+# revisiting or sorting rows. Persisted, a table's sketches are one row per
+# centroid (cell dimensions, Metric, Mean, Weight); each cell's min and max are
+# stored as zero-weight centroids.
+
+# Centroids per sketch are at most about half the compression
+SKETCH_COMPRESSION = 200
+DEFAULT_QUANTILES = (0.05, 0.25, 0.5, 0.75, 0.95)
+
+def _centroid_numbers(position, total, compression):
+    # t-digest k1 scale: a centroid spans one unit of k(q) = compression/(2 pi) * asin(2q - 1),
+    # numbered from 0 at q=0; `position` is a value's weight midpoint within its sketch of `total` weight
+    q = np.clip(position / total, 0, 1)
+    return np.floor(compression / (2 * np.pi) * np.arcsin(2 * q - 1) + compression / 4).astype(np.intp)
+
+def quantile_column(q):
+    """Column name of a quantile in sketch_quantiles() results, e.g. p50"""
+    return f'p{q * 100:g}'
+
+class QuantileSketch(NamedTuple):
+    """Mergeable approximate distribution: centroids sorted by mean, with the exact min and max"""
+    means: np.ndarray
+    weights: np.ndarray
+    min: float = np.nan
+    max: float = np.nan
+
+    @classmethod
+    def of(cls, values, compression=SKETCH_COMPRESSION):
+        """Sketch of an array of values"""
+        values = np.sort(np.asarray(values, dtype=np.float64))
+        values = values[~np.isnan(values)]
+        if not len(values):
+            return cls(np.zeros(0), np.zeros(0))
+        return cls.compress(values, np.ones(len(values)), compression)
+
+    @classmethod
+    def compress(cls, means, weights, compression=SKETCH_COMPRESSION):
+        """Sketch of weighted points (sorted by mean), neighbours pooled into centroids along the k1 scale"""
+        cumulative = np.cumsum(weights)
+        number = _centroid_numbers(cumulative - weights / 2, cumulative[-1], compression)
+        weight = np.bincount(number, weights=weights)
+        kept = weight > 0
+        return cls(np.bincount(number, weights=means * weights)[kept] / weight[kept], weight[kept],
+                   means[0], means[-1])
+
+    @classmethod
+    def from_centroids(cls, means, weights):
+        """Sketch of persisted centroids, pooled from any number of cells; zero-weight ones are the extremes"""
+        means, weights = np.asarray(means, dtype=np.float64), np.asarray(weights, dtype=np.float64)
+        order = np.argsort(means, kind='stable')
+        means, weights = means[order], weights[order]
+        if not len(means):
+            return cls(means, weights)
+        return cls(means[weights > 0], weights[weights > 0], means[0], means[-1])
+
+    def merge(self, other, compression=SKETCH_COMPRESSION):
+        """Sketch of the union of both sketches' values"""
+        if not len(other.means):
+            return self
+        if not len(self.means):
+            return other
+        means = np.concatenate([self.means, other.means])
+        order = np.argsort(means, kind='stable')
+        merged = self.compress(means[order], np.concatenate([self.weights, other.weights])[order], compression)
+        return merged._replace(min=min(self.min, other.min), max=max(self.max, other.max))
+
+    def quantile(self, q):
+        """Approximate quantile(s) q in [0, 1], interpolated between centroid midpoints and the extremes"""
+        if not len(self.means):
+            return np.full(np.shape(q), np.nan)
+        cumulative = np.cumsum(self.weights)
+        positions = np.concatenate([[0], cumulative - self.weights / 2, [cumulative[-1]]])
+        return np.interp(np.asarray(q) * cumulative[-1], positions, np.concatenate([[self.min], self.means, [self.max]]))
+
+def build_sketches(keys, columns, compression=SKETCH_COMPRESSION):
+    """Sketch rows (the key columns, Metric, Mean, Weight) of each of `columns` per distinct row of `keys`"""
+    grouped = keys.groupby(list(keys.columns), observed=True, sort=True)
+    cells = grouped.size().index.to_frame(index=False)
+    group = grouped.ngroup().to_numpy()
+    width = compression // 2 + 1
+    parts = []
+    for name, values in columns.items():
+        values = np.asarray(values, dtype=np.float64)
+        rows = (group >= 0) & ~np.isnan(values)
+        cell, values = group[rows], values[rows]
+        # Sorted by cell, then value: each cell's values are contiguous and in order
+        order = np.lexsort((values, cell))
+        cell, values = cell[order], values[order]
+        size = np.bincount(cell, minlength=len(cells))
+        start = np.cumsum(size) - size
+        rank = np.arange(len(values)) - start[cell]
+        centroid = cell * width + _centroid_numbers(rank + 0.5, size[cell], compression)
+
+        weight = np.bincount(centroid, minlength=len(cells) * width)
+        kept = np.flatnonzero(weight)
+        means = np.bincount(centroid, weights=values, minlength=len(cells) * width)[kept] / weight[kept]
+        filled = np.flatnonzero(size)
+        extremes = np.concatenate([values[start[filled]], values[start[filled] + size[filled] - 1]])
+        part = cells.iloc[np.concatenate([kept // width, filled, filled])].reset_index(drop=True)
+        part['Metric'] = name
+        part['Mean'] = np.concatenate([means, extremes])
+        part['Weight'] = np.concatenate([weight[kept], np.zeros(2 * len(filled))])
+        parts.append(part)
+    sketches = pd.concat(parts, ignore_index=True)
+    sketches['Metric'] = pd.Categorical(sketches['Metric'], categories=list(columns))
+    return sketches
+
+def sketch_name(table, version):
+    """Cache name of a table's sketches; it changes with the table's content and with the sketch layout"""
+    layout = repr((cube_dimensions(table), cube_metrics(table), SKETCH_COMPRESSION))
+    return f'{table}.sketch-{hashlib.sha256((version + layout).encode()).hexdigest()[:16]}'
+
+def sketch_quantiles(sketches, metric, by, q=DEFAULT_QUANTILES):
+    """Quantiles of a metric per group of `by` (columns p5, p50, ...), merged from cell sketches; one row if by=()"""
+    rows = sketches[sketches['Metric'] == metric]
+    columns = [quantile_column(value) for value in q]
+    if not by:
+        return pd.DataFrame([QuantileSketch.from_centroids(rows['Mean'], rows['Weight']).quantile(q)], columns=columns)
+    groups = rows.groupby(list(by), observed=True, sort=True)
+    quantiles = [QuantileSketch.from_centroids(group['Mean'], group['Weight']).quantile(q) for _, group in groups]
+    return pd.DataFrame(np.reshape(quantiles, (-1, len(q))), index=groups.size().index, columns=columns)
+
+# ============================================================================
+# AGGREGATION PLANS
+# ============================================================================
+#
+# For dashboards that aggregate a frame directly (streamlit_app.py): a page
+# declares every (group key, metric, reducer) it shows, and the first lookup
+# for a key computes all of that key's aggregates in one grouped pass, so the
+# rows are grouped once per key rather than once per chart.
+
+class AggregationPlan:
+    """The grouped aggregates a page needs from one frame, computed with one grouped pass per key"""
+
+    def __init__(self, df):
+        self.df = df
+        self._needs = {}
+        self._results = {}
+
+    def need(self, by, metrics, reducers=('mean',)):
+        """Declare aggregates of metrics per group of `by` (a column or tuple of columns); returns the plan"""
+        by = (by,) if isinstance(by, str) else tuple(by)
+        needs = self._needs.setdefault(by, {})
+        for metric in metrics:
+            for reducer in reducers:
+                needs[(metric, reducer)] = None
+        # A key declared after its pass ran is computed again, with everything declared so far
+        self._results.pop(by, None)
+        return self
+
+    def get(self, by, metric, reducer='mean'):
+        """One declared aggregate as a Series indexed by the groups of `by`"""
+        by = (by,) if isinstance(by, str) else tuple(by)
+        if (metric, reducer) not in self._needs.get(by, {}):
+            raise KeyError(f'{reducer}({metric}) by {list(by)} was not declared with need()')
+        if by not in self._results:
+            self._results[by] = self._aggregate(by)
+        return self._results[by][(metric, reducer)].rename(metric)
+
+    def _aggregate(self, by):
+        needs = list(self._needs[by])
+        if {reducer for _, reducer in needs} <= KERNEL_REDUCERS:
+            sums = group_sums(self.df, list(dict.fromkeys(metric for metric, _ in needs)), by)
+            if sums is not None:
+                index, _, sums = sums
+                return pd.DataFrame({(metric, reducer): _reduce(self.df[metric].dtype, sums[metric], reducer)
+                                     for metric, reducer in needs}, index=index)
+        reducers = {}
+        for metric, reducer in needs:
+            reducers.setdefault(metric, []).append(reducer)
+        result = self.df.groupby(list(by), observed=True, sort=True).agg(reducers)
+        means = [name for name in result.columns if name[1] == 'mean']
+        result[means] = round_means(result[means])
+        return result
+
+# ============================================================================
+# CROSSTABS
+# ============================================================================
+#
+# Count and mean tables of a dimension against the years, e.g. rows per
+# (AI_Restriction_Status, Year), taken from one summary grouped by both
+# columns: the rows are scanned once, not once per year or category.
+
+class Crosstab(NamedTuple):
+    """Row counts and metric means with one row per dimension value and one column per year"""
+    counts: pd.DataFrame
+    means: dict
+
+    @classmethod
+    def of(cls, summary, metrics, column='Year'):
+        """Crosstab of a summary (Count and metric means) grouped by (dimension, column)"""
+        return cls(summary['Count'].unstack(column, fill_value=0),
+                   {metric: summary[metric].unstack(column) for metric in metrics})
+
+    def row(self, value, years=None):
+        """Count and means of one dimension value per year (all years by default); Count 0 where it has no rows"""
+        years = self.counts.columns if years is None else years
+        table = {'Count': self.counts.reindex(index=[value], columns=years, fill_value=0).iloc[0]}
+        table.update({metric: means.reindex(index=[value], columns=years).iloc[0] for metric, means in self.means.items()})
+        return pd.DataFrame(table)
+
+    def column(self, year, values=None):
+        """Count and means per dimension value in one year; `values` picks and orders the rows (default: values with rows)"""
+        if year in self.counts.columns:
+            counts = self.counts[year]
+        else:
+            counts = pd.Series(0, index=self.counts.index[:0], dtype=np.int64)
+        counts = counts[counts > 0] if values is None else counts.reindex(values, fill_value=0)
+        table = {'Count': counts}
+        table.update({
+            metric: means.get(year, pd.Series(np.nan, index=means.index)).reindex(counts.index)
+            for metric, means in self.means.items()
+        })
+        return pd.DataFrame(table, index=counts.index)
+
+def frame_crosstab(df, dimension, metrics=(), column='Year'):
+    """Crosstab of a frame's dimension against `column`, from one grouped pass"""
+    return Crosstab.of(summarize_frame(df, metrics, (dimension, column)), metrics, column)
@@ -0,0 +1,169 @@
+import argparse
+import json
+import os
+import platform
+import subprocess
+import sys
+import tempfile
+import time
+import numpy as np
+import pandas as pd
+
+from generate_data import OUTPUT_FORMATS
+
+# ============================================================================
+# BENCHMARK SETTINGS
+# ============================================================================
+
+GENERATOR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'generate_data.py')
+DEFAULT_RESULTS = 'benchmark_results.json'
+
+# Total entities per run, split between professors and students in the default 40:100 ratio
+DEFAULT_SCALES = [140, 10_000, 100_000, 1_000_000]
+PROFESSOR_SHARE = 40 / 140
+YEARS_PER_RUN = 4
+
+# Generator modes: the reference loop only makes sense at small scales
+MODES = {
+    'loop': [],
+    'vectorized': ['--vectorized'],
+    'stream': ['--stream'],
+}
+
+# Direction each metric should move in; a change the other way beyond --threshold is a regression
+HIGHER_IS_BETTER = {'rows_per_sec': True, 'peak_rss_mb': False, 'output_bytes': False}
+
+# ============================================================================
+# MEASUREMENT
+# ============================================================================
+
+def split_scale(n_entities):
+    """Professor/student counts for a total entity count"""
+    n_professors = round(n_entities * PROFESSOR_SHARE)
+    return n_professors, n_entities - n_professors
+
+def dir_bytes(path):
+    """Total size of every file under path"""
+    return sum(
+        os.path.getsize(os.path.join(root, name))
+        for root, _, files in os.walk(path)
+        for name in files
+    )
+
+def run_generator(n_entities, fmt, mode, seed):
+    """Run generate_data.py once in a child process and measure it"""
+    n_professors, n_students = split_scale(n_entities)
+    with tempfile.TemporaryDirectory(prefix='bench-') as output_dir:
+        cmd = [sys.executable, GENERATOR, '--professors', str(n_professors), '--students', str(n_students),
+               '--end-year', str(2022 + YEARS_PER_RUN - 1), '--seed', str(seed),
+               '--output-dir', output_dir, '--format', fmt] + MODES[mode]
+
+        with tempfile.TemporaryFile() as stderr:
+            start = time.perf_counter()
+            proc = subprocess.Popen(cmd, stdout=subprocess.DEVNULL, stderr=stderr)
+            # wait4 gives this child's own rusage, so peak RSS is not shared across runs
+            _, status, usage = os.wait4(proc.pid, 0)
+            elapsed = time.perf_counter() - start
+            proc.returncode = os.waitstatus_to_exitcode(status)
+            if proc.returncode != 0:
+                stderr.seek(0)
+                raise RuntimeError(f'generator failed ({" ".join(cmd)}):\n{stderr.read().decode()}')
+
+        output_bytes = dir_bytes(output_dir)
+
+    # ru_maxrss is kilobytes on Linux, bytes on macOS
+    rss_bytes = usage.ru_maxrss if sys.platform == 'darwin' else usage.ru_maxrss * 1024
+    rows = n_entities * YEARS_PER_RUN
+    return {
+        'rows': rows,
+        'seconds': round(elapsed, 3),
+        'rows_per_sec': round(rows / elapsed, 1),
+        'peak_rss_mb': round(rss_bytes / 2**20, 1),
+        'output_bytes': output_bytes,
+    }
+
+def run_benchmarks(scales, formats, mode, repeat, seed):
+    """Benchmark every scale x format, keeping the best of `repeat` runs"""
+    results = []
+    for n_entities in scales:
+        for fmt in formats:
+            runs = [run_generator(n_entities, fmt, mode, seed) for _ in range(repeat)]
+            best = max(runs, key=lambda run: run['rows_per_sec'])
+            best['peak_rss_mb'] = min(run['peak_rss_mb'] for run in runs)
+            results.append({'entities': n_entities, 'format': fmt, 'mode': mode, **best})
+            print(f"{n_entities:>10,} entities  {fmt:<8} {best['rows_per_sec']:>12,.0f} rows/s  "
+                  f"{best['peak_rss_mb']:>8,.1f} MB RSS  {best['output_bytes']:>14,} bytes")
+    return results
+
+# ============================================================================
+# REGRESSION CHECK
+# ============================================================================
+
+def find_regressions(results, baseline, threshold):
+    """Metrics that moved the wrong way by more than `threshold` (a fraction) versus the baseline"""
+    previous = {(r['entities'], r['format'], r['mode']): r for r in baseline['results']}
+    regressions = []
+    for result in results:
+        base = previous.get((result['entities'], result['format'], result['mode']))
+        if base is None:
+            continue
+        for metric, higher_is_better in HIGHER_IS_BETTER.items():
+            if not base[metric]:
+                continue
+            change = (result[metric] - base[metric]) / base[metric]
+            if (-change if higher_is_better else change) > threshold:
+                regressions.append(f"{result['entities']:,} entities / {result['format']} / {result['mode']}: "
+                                   f"{metric} {base[metric]:,} -> {result[metric]:,} ({change:+.0%})")
+    return regressions
+
+def environment():
+    """Interpreter and library versions, recorded with every results file"""
+    return {
+        'python': platform.python_version(),
+        'numpy': np.__version__,
+        'pandas': pd.__version__,
+        'machine': platform.machine(),
+        'cpus': os.cpu_count(),
+    }
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark generate_data.py throughput, memory and output size.')
+    parser.add_argument('--scales', type=int, nargs='+', default=DEFAULT_SCALES,
+                        help='Total entities per run, split 40:100 professors:students (default: 140 10000 100000 1000000)')
+    parser.add_argument('--format', nargs='+', choices=OUTPUT_FORMATS, default=OUTPUT_FORMATS,
+                        help='Output formats to benchmark, one run each (default: all)')
+    parser.add_argument('--mode', choices=MODES, default='stream',
+                        help='Generator mode to benchmark (default: stream)')
+    parser.add_argument('--repeat', type=int, default=1, help='Runs per scale x format; the best is kept (default: 1)')
+    parser.add_argument('--seed', type=int, default=42, help='Master random seed (default: 42)')
+    parser.add_argument('--output', default=DEFAULT_RESULTS,
+                        help=f'JSON file the results are written to (default: {DEFAULT_RESULTS})')
+    parser.add_argument('--baseline', help='Earlier results file to compare against')
+    parser.add_argument('--threshold', type=float, default=0.2,
+                        help='Allowed relative change in the wrong direction before failing (default: 0.2 = 20%%)')
+    args = parser.parse_args()
+
+    if min(args.scales) < 1 or args.repeat < 1 or args.threshold < 0:
+        parser.error('--scales and --repeat must be >= 1, --threshold >= 0')
+
+    baseline = None
+    if args.baseline:
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+
+    results = run_benchmarks(args.scales, args.format, args.mode, args.repeat, args.seed)
+    with open(args.output, 'w') as f:
+        json.dump({'environment': environment(), 'results': results}, f, indent=1)
+    print('✓ Results written to', args.output)
+
+    if baseline is not None:
+        regressions = find_regressions(results, baseline, args.threshold)
+        if regressions:
+            print(f'✗ {len(regressions)} regression(s) beyond {args.threshold:.0%}:')
+            for line in regressions:
+                print('  -', line)
+            sys.exit(1)
+        print(f'✓ No regressions beyond {args.threshold:.0%} against', args.baseline)
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,100 @@
+import argparse
+import json
+import time
+import numpy as np
+import pandas as pd
+
+from aggregates import summarize_frame
+from benchmark_generator import environment
+from data_store import COLUMN_DTYPES, DEPARTMENTS, RESTRICTION_LEVELS
+
+# ============================================================================
+# BENCHMARK SETTINGS
+# ============================================================================
+
+DEFAULT_RESULTS = 'benchmark_groupby_results.json'
+DEFAULT_SCALES = [1_000, 100_000, 10_000_000]
+YEARS = [2022, 2023, 2024, 2025]
+
+# Groupings the dashboards run, from one key to the full filter cell
+GROUPINGS = [
+    ('Year',),
+    ('AI_Restriction_Status', 'Year'),
+    ('Department', 'AI_Restriction_Status', 'Year'),
+]
+
+# ============================================================================
+# MEASUREMENT
+# ============================================================================
+
+def make_frame(n_rows, n_metrics, seed):
+    """Random professor-shaped rows: the dashboard's key dtypes and float64 metrics"""
+    rng = np.random.default_rng(seed)
+    df = pd.DataFrame({
+        'Year': rng.choice(YEARS, n_rows).astype(COLUMN_DTYPES['Year']),
+        'AI_Restriction_Status': pd.Categorical.from_codes(
+            rng.integers(0, len(RESTRICTION_LEVELS), n_rows), dtype=COLUMN_DTYPES['AI_Restriction_Status']),
+        'Department': pd.Categorical.from_codes(
+            rng.integers(0, len(DEPARTMENTS), n_rows), dtype=COLUMN_DTYPES['Department']),
+    })
+    for i in range(n_metrics):
+        df[f'metric_{i}'] = rng.normal(50, 10, n_rows)
+    return df
+
+def pandas_summary(df, metrics, by):
+    """Means and Count per group through pandas groupby, as the dashboards computed them before"""
+    grouped = df.groupby(list(by), observed=True, sort=True)
+    summary = grouped[metrics].mean()
+    summary['Count'] = grouped.size()
+    return summary
+
+def best_time(func, repeat):
+    """Fastest of `repeat` calls, in seconds, and the last result"""
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func()
+        times.append(time.perf_counter() - start)
+    return min(times), result
+
+def run_benchmarks(scales, n_metrics, repeat, seed):
+    """Time the bincount kernel against pandas groupby for every scale x grouping"""
+    results = []
+    for n_rows in scales:
+        df = make_frame(n_rows, n_metrics, seed)
+        metrics = [name for name in df.columns if name.startswith('metric_')]
+        for by in GROUPINGS:
+            pandas_seconds, expected = best_time(lambda: pandas_summary(df, metrics, by), repeat)
+            kernel_seconds, summary = best_time(lambda: summarize_frame(df, metrics, by), repeat)
+            # Both accumulate in float64, so they agree up to summation order
+            pd.testing.assert_frame_equal(summary, expected, check_exact=False, rtol=1e-5)
+            results.append({
+                'rows': n_rows, 'by': list(by), 'metrics': n_metrics,
+                'pandas_seconds': round(pandas_seconds, 6), 'kernel_seconds': round(kernel_seconds, 6),
+                'speedup': round(pandas_seconds / kernel_seconds, 2),
+            })
+            print(f"{n_rows:>12,} rows  {' x '.join(by):<40} pandas {pandas_seconds * 1000:>10,.2f} ms  "
+                  f"kernel {kernel_seconds * 1000:>10,.2f} ms  {pandas_seconds / kernel_seconds:>6.1f}x")
+    return results
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark the bincount group-by kernel against pandas groupby.')
+    parser.add_argument('--scales', type=int, nargs='+', default=DEFAULT_SCALES,
+                        help='Rows per run (default: 1000 100000 10000000)')
+    parser.add_argument('--metrics', type=int, default=8, help='Metric columns averaged per grouping (default: 8)')
+    parser.add_argument('--repeat', type=int, default=3, help='Runs per measurement; the fastest is kept (default: 3)')
+    parser.add_argument('--seed', type=int, default=42, help='Random seed (default: 42)')
+    parser.add_argument('--output', default=DEFAULT_RESULTS,
+                        help=f'JSON file the results are written to (default: {DEFAULT_RESULTS})')
+    args = parser.parse_args()
+
+    if min(args.scales) < 1 or args.metrics < 1 or args.repeat < 1:
+        parser.error('--scales, --metrics and --repeat must be >= 1')
+
+    results = run_benchmarks(args.scales, args.metrics, args.repeat, args.seed)
+    with open(args.output, 'w') as f:
+        json.dump({'environment': environment(), 'results': results}, f, indent=1)
+    print('✓ Results written to', args.output)
+
+if __name__ == '__main__':
+    main()
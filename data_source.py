@@ -0,0 +1,512 @@
+import os
+import pathlib
+import sqlite3
+import threading
+from contextlib import closing
+from functools import lru_cache
+from typing import NamedTuple
+import numpy as np
+import pandas as pd
+
+from aggregates import (
+    CUBE_STATS, DEFAULT_QUANTILES, Z_95, Crosstab, build_cube, build_sketches, cube_dimensions,
+    cube_metrics, cube_name, rollup, rollup_stats, round_means, sketch_name, sketch_quantiles, stat_column,
+    summarize_frame,
+)
+from data_store import (
+    CACHE_DIR, FALLBACK_CACHE_DIR, PROFESSOR_TABLE, SEGMENT_KEY, STUDENT_TABLE, TABLE_COLUMNS, apply_schema,
+    cached_columns, load_table, read_columns, read_segments, table_path, table_version,
+)
+
+# ============================================================================
+# FILTERS
+# ============================================================================
+
+class Filters(NamedTuple):
+    """Sidebar selection; None leaves a dimension unfiltered"""
+    years: tuple = None
+    department: str = None
+    restriction: str = None
+    learning_style: str = None
+
+# Filter field -> column it constrains. A filter only applies to tables that have
+# the column, so Department narrows professors and Learning_Style narrows students.
+FILTER_COLUMNS = {
+    'department': 'Department',
+    'restriction': 'AI_Restriction_Status',
+    'learning_style': 'Learning_Style',
+}
+
+def normalize_filters(filters, table):
+    """Canonical form of filters for one table: years sorted, filters the table lacks dropped"""
+    return Filters(
+        years=None if filters.years is None else tuple(sorted(int(year) for year in filters.years)),
+        **{field: getattr(filters, field) if column in TABLE_COLUMNS[table] else None
+           for field, column in FILTER_COLUMNS.items()},
+    )
+
+def _equality_filters(filters, table):
+    return [
+        (column, getattr(filters, field))
+        for field, column in FILTER_COLUMNS.items()
+        if getattr(filters, field) is not None and column in TABLE_COLUMNS[table]
+    ]
+
+# ============================================================================
+# BITMAP INDEXES
+# ============================================================================
+#
+# Year and restriction filters pick segments of the sorted tables, i.e. row
+# ranges (see SEGMENTED LAYOUT in data_store.py). For the other filter columns,
+# one packed bitmap (1 bit per row) per distinct value is AND-ed over just the
+# bytes covering those ranges, so no full-length boolean mask or intermediate
+# frame is built per filter step. Year and restriction need no bitmaps: the
+# segment offset table already maps each of their values to row ranges.
+
+BITMAP_COLUMNS = ['Department', 'Learning_Style']
+
+def build_bitmaps(values):
+    """Packed bitmap of matching rows for every distinct value of a column"""
+    codes, uniques = pd.factorize(values)
+    return {value: np.packbits(codes == code) for code, value in enumerate(uniques)}
+
+def empty_bitmap(n_rows):
+    """Packed bitmap with no rows set"""
+    return np.zeros((n_rows + 7) // 8, np.uint8)
+
+def segment_ranges(segments):
+    """Row ranges [start, stop) covering the given segments, adjacent ones merged"""
+    ranges = []
+    for start, stop in zip(segments['start'].tolist(), segments['stop'].tolist()):
+        if ranges and ranges[-1][1] == start:
+            ranges[-1][1] = stop
+        else:
+            ranges.append([start, stop])
+    return ranges
+
+def bitmap_rows(bitmaps, ranges):
+    """Positions, within the row ranges, of the rows set in every one of the bitmaps"""
+    parts = [np.arange(0)]
+    for start, stop in ranges:
+        first, end = start // 8, -(-stop // 8)
+        selected = bitmaps[0][first:end].copy()
+        for bitmap in bitmaps[1:]:
+            np.bitwise_and(selected, bitmap[first:end], out=selected)
+        bits = np.unpackbits(selected)[start - first * 8:stop - first * 8]
+        parts.append(np.flatnonzero(bits) + start)
+    return np.concatenate(parts)
+
+# ============================================================================
+# DATA SOURCES
+# ============================================================================
+#
+# The dashboard asks its data source for aggregates only: the distinct values
+# behind the sidebar widgets, and per-group means and row counts for charts and
+# KPIs. FrameSource answers with pandas over memory-mapped columns; SQLiteSource
+# compiles the same questions to SQL so only aggregated rows reach Python.
+#
+# Summaries whose metrics and groups the aggregate cube covers (every one the
+# dashboard asks for) are rolled up from cube cells; the backend only builds
+# the cube, once per dataset version, and answers anything else directly.
+# Quantiles are merged the same way from per-cell quantile sketches.
+#
+# Every widget touch reruns the page, usually with a filter state it has seen
+# before, so summaries are kept in a bounded LRU cache keyed on the normalized
+# filter state: switching pages or going back to earlier filters is a lookup.
+
+# Summaries are a few rows each; matched row positions are up to one int per row, so fewer are kept
+SUMMARY_CACHE_SIZE = 256
+ROWS_CACHE_SIZE = 16
+
+# The fact tables the dashboard queries
+SOURCE_TABLES = [PROFESSOR_TABLE, STUDENT_TABLE]
+
+class DataSource:
+    """Aggregate queries the dashboard runs, answered by a backend subclass"""
+
+    def __init__(self, data_dir):
+        self.data_dir = data_dir
+        self._values = {}
+        self._cubes = {}
+        self._sketches = {}
+        self._summaries = lru_cache(maxsize=SUMMARY_CACHE_SIZE)(self._answer)
+        self._stats = lru_cache(maxsize=SUMMARY_CACHE_SIZE)(self._rollup_stats)
+        self._quantiles = lru_cache(maxsize=SUMMARY_CACHE_SIZE)(self._sketch_quantiles)
+
+    def columns(self, table):
+        """Columns of a table"""
+        return TABLE_COLUMNS[table]
+
+    def values(self, table, column):
+        """Sorted distinct values of a column (cached; the data is read-only)"""
+        key = (table, column)
+        if key not in self._values:
+            if column in cube_dimensions(table):
+                self._values[key] = sorted(self.cube(table)[column].unique().tolist())
+            else:
+                self._values[key] = self._distinct(table, column)
+        return self._values[key]
+
+    def cube(self, table):
+        """Aggregate cube of a table, built once per dataset version and kept in the cache directory"""
+        if table not in self._cubes:
+            cache_name = cube_name(table, table_version(self.data_dir, table))
+            path = cached_columns(self.data_dir, cache_name, lambda: self._build_cube(table))
+            self._cubes[table] = read_columns(path)
+        return self._cubes[table]
+
+    def sketches(self, table):
+        """Quantile sketches of a table's metrics per cube cell, built once per dataset version and cached"""
+        if table not in self._sketches:
+            cache_name = sketch_name(table, table_version(self.data_dir, table))
+            path = cached_columns(self.data_dir, cache_name, lambda: self._build_sketches(table))
+            self._sketches[table] = read_columns(path)
+        return self._sketches[table]
+
+    def summarize(self, table, metrics, filters=Filters(), by=('Year',)):
+        """Mean of each metric and a Count of rows per group of `by`, over rows matching filters.
+
+        Groups are sorted. With by=() the result is a single row over every matching row.
+        """
+        summary = self._summaries(table, tuple(metrics), normalize_filters(filters, table), tuple(by))
+        # Callers get their own copy, so the cached frame stays as computed
+        return summary.copy()
+
+    def totals(self, table, metrics, filters=Filters()):
+        """summarize() over every matching row, as a Series"""
+        return self.summarize(table, metrics, filters, by=()).iloc[0]
+
+    def describe(self, table, metric, filters=Filters(), by=('Year',), z=Z_95):
+        """Count, mean, std, min, max and confidence interval (ci_low, ci_high) of a metric per group of `by`.
+
+        Merged from cube cells, so `by` must be cube dimensions. z=Z_95 gives a 95% interval.
+        """
+        if metric not in cube_metrics(table) or not set(by) <= set(cube_dimensions(table)):
+            raise ValueError(f'The {table} cube cannot describe {metric!r} by {list(by)}')
+        return self._stats(table, metric, normalize_filters(filters, table), tuple(by), z).copy()
+
+    def quantiles(self, table, metric, filters=Filters(), by=('Year',), q=DEFAULT_QUANTILES):
+        """Approximate quantiles of a metric per group of `by`, as columns p5, p25, ... for q=0.05, 0.25, ...
+
+        Merged from the cells' quantile sketches, so `by` must be cube dimensions.
+        """
+        if metric not in cube_metrics(table) or not set(by) <= set(cube_dimensions(table)):
+            raise ValueError(f'The {table} sketches cannot give quantiles of {metric!r} by {list(by)}')
+        return self._quantiles(table, metric, normalize_filters(filters, table), tuple(by), tuple(q)).copy()
+
+    def crosstab(self, table, dimension, metrics=(), filters=Filters(), column='Year'):
+        """Count and mean tables of a dimension against `column` (the years), from one summary"""
+        metrics = list(metrics)
+        return Crosstab.of(self.summarize(table, metrics, filters, by=(dimension, column)), metrics, column)
+
+    def cache_stats(self):
+        """Hits, misses and size of the query caches"""
+        return {
+            'summaries': self._summaries.cache_info()._asdict(),
+            'stats': self._stats.cache_info()._asdict(),
+            'quantiles': self._quantiles.cache_info()._asdict(),
+        }
+
+    def _cells(self, table, filters, cells=None):
+        # Cube cells (or the rows of another per-cell frame, e.g. sketches) matching filters
+        cells = self.cube(table) if cells is None else cells
+        selected = np.ones(len(cells), bool)
+        if filters.years is not None:
+            selected &= cells['Year'].isin(filters.years).to_numpy()
+        for column, value in _equality_filters(filters, table):
+            selected &= (cells[column] == value).to_numpy()
+        return cells[selected]
+
+    def _answer(self, table, metrics, filters, by):
+        if set(metrics) <= set(cube_metrics(table)) and set(by) <= set(cube_dimensions(table)):
+            return rollup(self._cells(table, filters), metrics, by)
+        return self._summarize(table, metrics, filters, by)
+
+    def _rollup_stats(self, table, metric, filters, by, z):
+        return rollup_stats(self._cells(table, filters), metric, by, z)
+
+    def _sketch_quantiles(self, table, metric, filters, by, q):
+        return sketch_quantiles(self._cells(table, filters, self.sketches(table)), metric, by, q)
+
+    def _build_sketches(self, table):
+        # Both backends sketch the memory-mapped columnar table, one segment (year x restriction) at a time,
+        # so only one segment's rows of one metric are sorted in memory at once
+        dimensions = cube_dimensions(table)
+        df = load_table(self.data_dir, table, dimensions + cube_metrics(table))
+        segments = read_segments(table_path(self.data_dir, table))
+        bounds = [(0, len(df))] if segments is None else zip(segments['start'].tolist(), segments['stop'].tolist())
+        return pd.concat([
+            build_sketches(df[dimensions].iloc[start:stop],
+                           {metric: df[metric].to_numpy()[start:stop] for metric in cube_metrics(table)})
+            for start, stop in bounds
+        ], ignore_index=True)
+
+    def _build_cube(self, table):
+        raise NotImplementedError
+
+    def _summarize(self, table, metrics, filters, by):
+        raise NotImplementedError
+
+    def _distinct(self, table, column):
+        raise NotImplementedError
+
+class FrameSource(DataSource):
+    """Aggregates computed with numpy and pandas over memory-mapped columns.
+
+    Every column is mapped and the bitmap indexes are built when the source is opened, so no dashboard
+    query pays for them, and regenerating the data or dropping an older cached copy, which unlinks the
+    files, never pulls a column from under a running source.
+    """
+
+    def __init__(self, data_dir):
+        super().__init__(data_dir)
+        self._paths = {}
+        self._segments = {}
+        self._rows = lru_cache(maxsize=ROWS_CACHE_SIZE)(self._match_rows)
+        self._columns = {}
+        for table in SOURCE_TABLES:
+            self.segments(table)
+            self._columns.update(((table, name), values)
+                                 for name, values in read_columns(self.path(table), mmap=True).items())
+        self._bitmaps = {
+            (table, column): build_bitmaps(self.column(table, column))
+            for table in SOURCE_TABLES for column in BITMAP_COLUMNS if column in TABLE_COLUMNS[table]
+        }
+
+    def path(self, table):
+        """Segmented columnar table read for a table, resolved once"""
+        if table not in self._paths:
+            self._paths[table] = table_path(self.data_dir, table)
+        return self._paths[table]
+
+    def segments(self, table):
+        """Offset table of the (Year, AI_Restriction_Status) segments the table is sorted into"""
+        if table not in self._segments:
+            self._segments[table] = read_segments(self.path(table))
+        return self._segments[table]
+
+    def column(self, table, name):
+        """One read-only column"""
+        return self._columns[table, name]
+
+    def frame(self, table, names):
+        """Frame of the given columns, without copying them"""
+        return pd.DataFrame({name: self.column(table, name) for name in names}, copy=False)
+
+    def bitmap(self, table, column, value):
+        """Packed bitmap of the rows where column == value"""
+        bitmaps = self._bitmaps[table, column]
+        return bitmaps[value] if value in bitmaps else empty_bitmap(len(self.column(table, column)))
+
+    def rows(self, table, filters):
+        """Rows matching filters as a slice or positions, or None when no filter applies"""
+        return self._rows(table, normalize_filters(filters, table))
+
+    def cache_stats(self):
+        return {**super().cache_stats(), 'rows': self._rows.cache_info()._asdict()}
+
+    def _selected_segments(self, table, filters):
+        segments = self.segments(table)
+        selected = np.ones(len(segments), bool)
+        if filters.years is not None:
+            selected &= segments['Year'].isin(filters.years).to_numpy()
+        if filters.restriction is not None:
+            selected &= (segments['AI_Restriction_Status'] == filters.restriction).to_numpy()
+        return segments[selected]
+
+    def _bitmap_filters(self, filters, table):
+        return [(column, value) for column, value in _equality_filters(filters, table) if column not in SEGMENT_KEY]
+
+    def _match_rows(self, table, filters):
+        ranges = segment_ranges(self._selected_segments(table, filters))
+        bitmaps = [self.bitmap(table, column, value) for column, value in self._bitmap_filters(filters, table)]
+        if not bitmaps:
+            if ranges == [[0, len(self.column(table, 'Year'))]]:
+                return None
+            if len(ranges) <= 1:
+                # One contiguous range: a slice, so selecting it is a view rather than a gather
+                return slice(*(ranges[0] if ranges else (0, 0)))
+            rows = np.concatenate([np.arange(start, stop) for start, stop in ranges])
+        else:
+            rows = bitmap_rows(bitmaps, ranges)
+        # Cached positions are shared by later lookups, so they must not change
+        rows.flags.writeable = False
+        return rows
+
+    def _segment_summary(self, table, metrics, filters, by):
+        # Sum each metric over each selected segment's contiguous rows, then roll the segments up to `by`
+        segments = self._selected_segments(table, filters)
+        cells = segments[SEGMENT_KEY].copy()
+        cells['Count'] = (segments['stop'] - segments['start']).to_numpy()
+        for metric in metrics:
+            values = self.column(table, metric).to_numpy()
+            cells[metric] = [values[start:stop].sum(dtype=np.float64)
+                             for start, stop in zip(segments['start'].tolist(), segments['stop'].tolist())]
+
+        if not by:
+            totals = cells[metrics + ['Count']].sum()
+            return pd.DataFrame([{**round_means(totals[metrics] / totals['Count']).to_dict(),
+                                  'Count': int(totals['Count'])}], columns=metrics + ['Count'])
+        sums = cells.groupby(by, observed=True, sort=True)[metrics + ['Count']].sum()
+        summary = round_means(sums[metrics].div(sums['Count'], axis=0))
+        summary['Count'] = sums['Count']
+        return summary
+
+    def _build_cube(self, table):
+        metrics = cube_metrics(table)
+        return build_cube(self.frame(table, cube_dimensions(table)),
+                          {metric: self.column(table, metric) for metric in metrics})
+
+    def _summarize(self, table, metrics, filters, by):
+        metrics, by = list(metrics), list(by)
+        if set(by) <= set(SEGMENT_KEY) and not self._bitmap_filters(filters, table):
+            return self._segment_summary(table, metrics, filters, by)
+
+        # Year is read even when nothing else is, so the frame knows its row count
+        df = self.frame(table, list(dict.fromkeys(by + metrics)) or ['Year'])
+        rows = self.rows(table, filters)
+        if rows is not None:
+            # A slice is a view; positions gather the matching rows of every needed column in one pass
+            df = df.iloc[rows]
+
+        if not by:
+            return pd.DataFrame([{**df[metrics].mean().to_dict(), 'Count': len(df)}], columns=metrics + ['Count'])
+        return summarize_frame(df, metrics, by)
+
+    def _distinct(self, table, column):
+        return sorted(self.column(table, column).unique().tolist())
+
+class SQLiteSource(DataSource):
+    """Filters and aggregations pushed down to an embedded SQLite copy of the tables"""
+
+    def __init__(self, data_dir):
+        super().__init__(data_dir)
+        self.path = sqlite_database(data_dir)
+        self._uri = pathlib.Path(self.path).absolute().as_uri() + '?mode=ro'
+
+    def _execute(self, sql, params=()):
+        # A short-lived read-only connection per query, so sessions on different threads never share one
+        with closing(sqlite3.connect(self._uri, uri=True)) as conn:
+            cursor = conn.execute(sql, params)
+            return [d[0] for d in cursor.description], cursor.fetchall()
+
+    def _summarize(self, table, metrics, filters, by):
+        metrics, by = list(metrics), list(by)
+        clauses, params = [], []
+        if filters.years is not None:
+            clauses.append(f"Year IN ({', '.join('?' * len(filters.years))})")
+            params += [int(year) for year in filters.years]
+        for column, value in _equality_filters(filters, table):
+            clauses.append(f'{_quote(table, column)} = ?')
+            params.append(value)
+
+        group = ', '.join(_quote(table, column) for column in by)
+        select = ([_quote(table, column) for column in by]
+                  + [f'AVG({_quote(table, metric)}) AS {_quote(table, metric)}' for metric in metrics]
+                  + ['COUNT(*) AS Count'])
+        sql = f"SELECT {', '.join(select)} FROM {table}"
+        if clauses:
+            sql += ' WHERE ' + ' AND '.join(clauses)
+        if by:
+            sql += f' GROUP BY {group} ORDER BY {group}'
+
+        names, rows = self._execute(sql, params)
+        summary = pd.DataFrame(rows, columns=names).astype({metric: float for metric in metrics} | {'Count': int})
+        summary[metrics] = round_means(summary[metrics])
+        return summary.set_index(by) if by else summary
+
+    def _build_cube(self, table):
+        dimensions = [_quote(table, column) for column in cube_dimensions(table)]
+        group = ', '.join(dimensions)
+        # Each row carries its cell's means (a window over the cell), so M2 sums squared deviations from them
+        cell_means = [f'AVG({_quote(table, metric)}) OVER (PARTITION BY {group}) AS "{stat_column(metric, "cell")}"'
+                      for metric in cube_metrics(table)]
+        select = dimensions + ['COUNT(*) AS Count']
+        for metric in cube_metrics(table):
+            column, cell_mean = _quote(table, metric), f'"{stat_column(metric, "cell")}"'
+            expressions = {'mean': f'AVG({column})',
+                           'm2': f'SUM(({column} - {cell_mean}) * ({column} - {cell_mean}))',
+                           'min': f'MIN({column})', 'max': f'MAX({column})'}
+            select += [f'{expressions[stat]} AS "{stat_column(metric, stat)}"' for stat in CUBE_STATS]
+        rows_with_means = f"SELECT *, {', '.join(cell_means)} FROM {table}"
+        names, rows = self._execute(
+            f"SELECT {', '.join(select)} FROM ({rows_with_means}) GROUP BY {group} ORDER BY {group}")
+        cube = apply_schema(pd.DataFrame(rows, columns=names))
+        return cube.astype({name: float for name in names if '__' in name})
+
+    def _distinct(self, table, column):
+        column = _quote(table, column)
+        _, rows = self._execute(f'SELECT DISTINCT {column} FROM {table} ORDER BY {column}')
+        return [value for (value,) in rows]
+
+def _quote(table, column):
+    # Only declared column names ever reach the SQL text
+    if column not in TABLE_COLUMNS[table]:
+        raise KeyError(f'{table} has no column {column!r}')
+    return f'"{column}"'
+
+# ============================================================================
+# SQLITE DATABASE
+# ============================================================================
+#
+# Built once per dataset version next to the parsed-CSV cache, as
+# <data_dir>/.cache/ai_education-<hash>.sqlite, from the same memory-mapped
+# tables the in-memory source reads. Rows are inserted in chunks, so building it
+# never needs a whole table in Python objects.
+
+SQLITE_TABLES = SOURCE_TABLES
+SQLITE_CHUNK_ROWS = 100_000
+
+def sqlite_database(data_dir):
+    """Path of the SQLite copy of the dashboard tables, building it on first use"""
+    version = '-'.join(table_version(data_dir, table)[:8] for table in SQLITE_TABLES)
+    name = f'ai_education-{version}.sqlite'
+    try:
+        return _build_sqlite(data_dir, os.path.join(data_dir, CACHE_DIR), name)
+    except OSError:
+        return _build_sqlite(data_dir, FALLBACK_CACHE_DIR, name)
+
+def _build_sqlite(data_dir, cache_dir, name):
+    path = os.path.join(cache_dir, name)
+    if os.path.isfile(path):
+        return path
+
+    os.makedirs(cache_dir, exist_ok=True)
+    # Build under a private name and rename into place, so readers never open a partial database
+    # (per process and thread, so concurrent sessions never write into the same file)
+    tmp_path = os.path.join(cache_dir, f'.tmp-{name}-{os.getpid()}-{threading.get_ident()}')
+    # A file left by a crashed build would make the first CREATE TABLE fail
+    _remove_database(tmp_path)
+    try:
+        with closing(sqlite3.connect(tmp_path)) as conn:
+            for table in SQLITE_TABLES:
+                df = load_table(data_dir, table)
+                df.iloc[:0].to_sql(table, conn, index=False)
+                for start in range(0, len(df), SQLITE_CHUNK_ROWS):
+                    df.iloc[start:start + SQLITE_CHUNK_ROWS].to_sql(table, conn, if_exists='append', index=False)
+                conn.execute(f'CREATE INDEX {table}_year_restriction ON {table} (Year, AI_Restriction_Status)')
+            conn.commit()
+        os.replace(tmp_path, path)
+    except BaseException:
+        _remove_database(tmp_path)
+        raise
+
+    # Drop databases built from earlier versions of the tables
+    for other in os.listdir(cache_dir):
+        if other.startswith('ai_education-') and other.endswith('.sqlite') and other != name:
+            os.remove(os.path.join(cache_dir, other))
+    return path
+
+def _remove_database(path):
+    # The database file and its rollback journal, if present
+    for leftover in (path, path + '-journal'):
+        if os.path.exists(leftover):
+            os.remove(leftover)
+
+DATA_SOURCES = {'memory': FrameSource, 'sqlite': SQLiteSource}
+
+def open_source(kind, data_dir):
+    """Data source of the given kind ('memory' or 'sqlite') over the tables in data_dir"""
+    if kind not in DATA_SOURCES:
+        raise ValueError(f'Unknown data source {kind!r}; expected one of {list(DATA_SOURCES)}')
+    return DATA_SOURCES[kind](data_dir)
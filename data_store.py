@@ -0,0 +1,368 @@
+import hashlib
+import json
+import os
+import shutil
+import tempfile
+import threading
+from functools import lru_cache
+import numpy as np
+import pandas as pd
+
+# ============================================================================
+# SCHEMA (shared by generate_data.py and the dashboards)
+# ============================================================================
+
+ENTITY_TYPES = ['Professor', 'Student']
+TECH_ADOPTION_LEVELS = ['Early Adopter', 'Moderate', 'Traditional']
+RESTRICTION_LEVELS = ['Full Adoption', 'Partial Restriction', 'Full Restriction']
+DEPARTMENTS = ['Computer Science', 'Business', 'Engineering', 'Liberal Arts', 'Data Science']
+YEARS_OF_STUDY = ['Year 1', 'Year 2', 'Year 3', 'Year 4']
+LEARNING_STYLES = ['Visual', 'Auditory', 'Reading-Writing', 'Kinesthetic']
+
+def _categories(values):
+    # Sorted, so groupby/pivot output keeps the alphabetical order of plain string columns
+    return pd.CategoricalDtype(sorted(values))
+
+# Low-cardinality strings are categoricals, years and counts are small ints and
+# scores are float64. ID repeats once per year, so it is categorical as well.
+# Scores stay float64 because float32 cannot hold values like 3.52 exactly: the
+# means the dashboards show to 1-2 decimals would drift a digit off the CSV's.
+COLUMN_DTYPES = {
+    'Entity_Type': _categories(ENTITY_TYPES),
+    'ID': 'category',
+    'AI_Restriction_Status': _categories(RESTRICTION_LEVELS),
+    'Year': 'int16',
+
+    # Professor traits & metrics
+    'Department': _categories(DEPARTMENTS),
+    'Tenure_Years': 'int16',
+    'Tech_Adoption_Level': _categories(TECH_ADOPTION_LEVELS),
+    'Hours_Saved_Lesson_Planning_Per_Week': 'float64',
+    'PPTs_Created_Per_Month': 'int32',
+    'Assignments_Graded_Per_Semester': 'int32',
+    'Grading_Quality_Score': 'float64',
+    'Grading_Time_Hours_Per_Semester': 'float64',
+    'Hours_Saved_Admin_Per_Week': 'float64',
+    'Students_Monitored': 'int32',
+    'At_Risk_Students_Identified': 'int32',
+    'Intervention_Success_Rate': 'float64',
+
+    # Student traits & metrics
+    'Major': _categories(DEPARTMENTS),
+    'Year_of_Study': _categories(YEARS_OF_STUDY),
+    'Learning_Style': _categories(LEARNING_STYLES),
+    'AI_Literacy_Score': 'float64',
+    'Responsible_Use_Awareness': 'float64',
+    'Creativity_Preservation_Score': 'float64',
+    'AI_Tool_Adoption_Rate': 'float64',
+    'Uses_AI_For_Brainstorming': 'float64',
+    'Uses_AI_For_Assessment': 'float64',
+    'Uses_AI_For_Collaboration': 'float64',
+    'Hours_Per_Assignment': 'float64',
+    'GPA': 'float64',
+    'Assignment_Completion_Rate': 'float64',
+    'Performance_Improvement_Percent': 'float64',
+    'Skill_Awareness_Level': 'float64',
+    'Skill_Beginner_Level': 'float64',
+    'Skill_Intermediate_Level': 'float64',
+    'Skill_Advanced_Level': 'float64',
+    'Uses_AI_Collaboration_Tools': 'float64',
+    'Language_Barrier_Reduction_Percent': 'float64',
+    'Team_Project_Success_Rate': 'float64',
+
+    # Entity dimension
+    'First_Year': 'int16',
+    'Last_Year': 'int16',
+}
+
+# Columns every fact table shares; the entity dimension holds one row per entity
+ENTITY_COLUMNS = ['Entity_Type', 'ID', 'AI_Restriction_Status']
+
+PROFESSOR_TABLE = 'ai_education_professor_data'
+STUDENT_TABLE = 'ai_education_student_data'
+ENTITY_TABLE = 'ai_education_entities'
+
+# Declared column order of each table, as written by generate_data.py
+TABLE_COLUMNS = {
+    PROFESSOR_TABLE: [
+        'Entity_Type', 'ID', 'Department', 'Tenure_Years', 'Tech_Adoption_Level', 'AI_Restriction_Status', 'Year',
+        'Hours_Saved_Lesson_Planning_Per_Week', 'PPTs_Created_Per_Month', 'Assignments_Graded_Per_Semester',
+        'Grading_Quality_Score', 'Grading_Time_Hours_Per_Semester', 'Hours_Saved_Admin_Per_Week',
+        'Students_Monitored', 'At_Risk_Students_Identified', 'Intervention_Success_Rate',
+    ],
+    STUDENT_TABLE: [
+        'Entity_Type', 'ID', 'Major', 'Year_of_Study', 'Learning_Style', 'AI_Restriction_Status', 'Year',
+        'AI_Literacy_Score', 'Responsible_Use_Awareness', 'Creativity_Preservation_Score', 'AI_Tool_Adoption_Rate',
+        'Uses_AI_For_Brainstorming', 'Uses_AI_For_Assessment', 'Uses_AI_For_Collaboration', 'Hours_Per_Assignment',
+        'GPA', 'Assignment_Completion_Rate', 'Performance_Improvement_Percent', 'Skill_Awareness_Level',
+        'Skill_Beginner_Level', 'Skill_Intermediate_Level', 'Skill_Advanced_Level', 'Uses_AI_Collaboration_Tools',
+        'Language_Barrier_Reduction_Percent', 'Team_Project_Success_Rate',
+    ],
+    ENTITY_TABLE: ENTITY_COLUMNS + ['First_Year', 'Last_Year'],
+}
+
+def apply_schema(df):
+    """Cast a frame's columns to their declared storage dtypes"""
+    return df.astype({name: COLUMN_DTYPES[name] for name in df.columns if name in COLUMN_DTYPES})
+
+def entity_dimension(*tables):
+    """One row per entity across fact tables, with the shared columns and the years covered.
+
+    Replaces the old combined dataset (the sparse union of every table's columns):
+    cross-entity questions join this dimension with the per-entity fact tables.
+    """
+    frames = [
+        df.groupby(ENTITY_COLUMNS, observed=True, sort=False)['Year']
+          .agg(First_Year='min', Last_Year='max')
+          .reset_index()
+        for df in tables
+    ]
+    return apply_schema(pd.concat(frames, ignore_index=True))
+
+# ============================================================================
+# TYPED COLUMNAR FORMAT
+# ============================================================================
+#
+# A table is a directory <name>.columns/ holding one .npy file per column and a
+# _schema.json with the column order, dtypes and category labels. Categoricals
+# are stored as their integer codes. _schema.json is written last, so a table
+# counts as present only once every column file is complete.
+#
+# Readers memory-map the column files, and rewriting a mapped file in place
+# kills them with SIGBUS. A table is therefore written to a temporary directory
+# beside it and swapped in by renames: the old files are only unlinked, and
+# stay valid for every process that still has them mapped.
+
+COLUMNS_SUFFIX = '.columns'
+SCHEMA_FILE = '_schema.json'
+
+def has_columns(path):
+    """True if a complete columnar table exists at <path>.columns"""
+    return os.path.isfile(os.path.join(path + COLUMNS_SUFFIX, SCHEMA_FILE))
+
+def write_columns(df, path, segment_by=()):
+    """Write a frame as a typed columnar table at <path>.columns, optionally sorted into segments"""
+    segments = None
+    if segment_by:
+        df, segments = sort_segments(df, segment_by)
+    table_dir = path + COLUMNS_SUFFIX
+    # Hidden, and private to this process and thread, so neither readers nor concurrent writers pick it up
+    tmp_dir = os.path.join(os.path.dirname(table_dir) or '.',
+                           f'.tmp-{os.path.basename(table_dir)}-{os.getpid()}-{threading.get_ident()}')
+    shutil.rmtree(tmp_dir, ignore_errors=True)
+    os.makedirs(tmp_dir)
+    try:
+        columns = {}
+        for name, col in apply_schema(df).items():
+            if isinstance(col.dtype, pd.CategoricalDtype):
+                values = col.cat.codes.to_numpy()
+                columns[name] = {'dtype': 'category', 'categories': col.cat.categories.tolist()}
+            else:
+                values = col.to_numpy()
+                columns[name] = {'dtype': str(values.dtype)}
+            np.save(os.path.join(tmp_dir, f'{name}.npy'), values, allow_pickle=False)
+
+        schema = {'rows': len(df), 'columns': columns}
+        if segments is not None:
+            schema['segments'] = segments
+        with open(os.path.join(tmp_dir, SCHEMA_FILE), 'w') as f:
+            json.dump(schema, f, indent=1)
+        _swap_directory(tmp_dir, table_dir)
+    except BaseException:
+        shutil.rmtree(tmp_dir, ignore_errors=True)
+        raise
+
+def _swap_directory(new_dir, target_dir):
+    # Rename new_dir to target_dir; a directory already there is moved aside first and then removed
+    old_dir = None
+    if os.path.exists(target_dir):
+        old_dir = f'{new_dir}-old'
+        os.rename(target_dir, old_dir)
+    os.rename(new_dir, target_dir)
+    if old_dir is not None:
+        shutil.rmtree(old_dir, ignore_errors=True)
+
+def read_columns(path, columns=None, mmap=False):
+    """Read a typed columnar table written by write_columns(), optionally memory-mapped read-only"""
+    table_dir = path + COLUMNS_SUFFIX
+    with open(os.path.join(table_dir, SCHEMA_FILE)) as f:
+        schema = json.load(f)['columns']
+
+    data = {}
+    for name in columns or schema:
+        values = np.load(os.path.join(table_dir, f'{name}.npy'), mmap_mode='r' if mmap else None, allow_pickle=False)
+        if schema[name]['dtype'] == 'category':
+            data[name] = pd.Categorical.from_codes(values, categories=schema[name]['categories'])
+        else:
+            data[name] = values
+    return pd.DataFrame(data, copy=False)
+
+# ============================================================================
+# SEGMENTED LAYOUT
+# ============================================================================
+#
+# The dashboards read the fact tables stably sorted by (Year, AI_Restriction_Status),
+# with an offset table giving the first and last row of each segment, i.e. each
+# distinct (year, restriction) pair. Selecting years or restrictions is then
+# slicing contiguous rows, and per-year aggregates reduce contiguous memory.
+# _schema.json stores the offsets as {'by': [...], 'keys': [[...], ...], 'offsets': [...]},
+# where segment i spans rows offsets[i]:offsets[i + 1].
+
+SEGMENT_KEY = ['Year', 'AI_Restriction_Status']
+
+def segment_key(table):
+    """Columns a table is segmented by: SEGMENT_KEY if the table has all of them, else none"""
+    return SEGMENT_KEY if all(name in TABLE_COLUMNS[table] for name in SEGMENT_KEY) else []
+
+def sort_segments(df, by):
+    """Frame stably sorted by the `by` columns, and its segments as stored in _schema.json"""
+    df = apply_schema(df)
+    codes = [df[name].cat.codes.to_numpy() if isinstance(df[name].dtype, pd.CategoricalDtype) else df[name].to_numpy()
+             for name in by]
+    # lexsort is stable and treats its last key as the primary one
+    order = np.lexsort(codes[::-1])
+    df = df.take(order).reset_index(drop=True)
+
+    starts = np.zeros(len(df), bool)
+    starts[:1] = True
+    for code in codes:
+        code = code[order]
+        starts[1:] |= code[1:] != code[:-1]
+    starts = np.flatnonzero(starts)
+    keys = [list(key) for key in zip(*(df[name].take(starts).tolist() for name in by))]
+    return df, {'by': list(by), 'keys': keys, 'offsets': starts.tolist() + [len(df)]}
+
+def segmented_by(path):
+    """Columns the columnar table at <path>.columns is segmented by (empty if it is not)"""
+    with open(os.path.join(path + COLUMNS_SUFFIX, SCHEMA_FILE)) as f:
+        return json.load(f).get('segments', {}).get('by', [])
+
+def read_segments(path):
+    """Offset table of a segmented columnar table: the key columns plus each segment's start and stop row"""
+    with open(os.path.join(path + COLUMNS_SUFFIX, SCHEMA_FILE)) as f:
+        segments = json.load(f).get('segments')
+    if segments is None:
+        return None
+    table = apply_schema(pd.DataFrame(segments['keys'], columns=segments['by']))
+    table['start'] = segments['offsets'][:-1]
+    table['stop'] = segments['offsets'][1:]
+    return table
+
+# ============================================================================
+# LOADING (used by the dashboards)
+# ============================================================================
+
+# Searched in order; the first directory holding every requested table is used
+DATA_DIRS = ['data', '/mnt/user-data/outputs', '.']
+
+def table_exists(path):
+    """True if the table at path exists as a columnar table or a CSV"""
+    return has_columns(path) or os.path.isfile(path + '.csv')
+
+def resolve_data_dir(tables=(PROFESSOR_TABLE, STUDENT_TABLE), search=DATA_DIRS):
+    """First directory in `search` that holds every one of `tables`"""
+    for data_dir in search:
+        if all(table_exists(os.path.join(data_dir, table)) for table in tables):
+            return data_dir
+    raise FileNotFoundError(f"No directory in {search} holds all of {list(tables)}; run generate_data.py first")
+
+def _read_csv(path, table, columns=None):
+    # Parse straight into the declared dtypes instead of inferring them from text
+    usecols = list(columns or TABLE_COLUMNS[table])
+    df = pd.read_csv(path, usecols=usecols, dtype={name: COLUMN_DTYPES[name] for name in usecols})
+    return df if list(df.columns) == usecols else df[usecols]
+
+# ============================================================================
+# TABLE CACHE
+# ============================================================================
+#
+# The first process to load a CSV-only table, or a columnar table not yet in
+# segment order, stores it segmented in <data_dir>/.cache/<table>-<hash>.columns/,
+# where <hash> covers the stored bytes (and, for CSVs, the declared schema and
+# segment key). Later processes memory-map that copy instead of parsing or
+# sorting, and workers on one host share its pages. Editing or regenerating the
+# table changes the hash, so a stale copy is never read.
+
+CACHE_DIR = '.cache'
+# Used instead when the data directory is read-only
+FALLBACK_CACHE_DIR = os.path.join(tempfile.gettempdir(), 'ai_education_cache')
+
+# Digests already computed in this process, per set of file paths and stats
+DIGEST_CACHE_SIZE = 64
+
+def _file_digest(paths, prefix=b''):
+    # Hashed once per process for as long as no file's path, mtime, size or inode changes; every cube,
+    # sketch and database lookup asks for the version again, and hashing reads the whole table
+    files = []
+    for path in paths:
+        stat = os.stat(path)
+        files.append((path, stat.st_mtime_ns, stat.st_size, stat.st_ino))
+    return _hash_files(tuple(files), prefix)
+
+@lru_cache(maxsize=DIGEST_CACHE_SIZE)
+def _hash_files(files, prefix):
+    digest = hashlib.sha256(prefix)
+    for path, *_ in files:
+        with open(path, 'rb') as f:
+            for block in iter(lambda: f.read(1 << 20), b''):
+                digest.update(block)
+    return digest.hexdigest()[:16]
+
+def content_hash(csv_path, table):
+    """Short SHA-256 of a CSV's bytes plus the table's declared columns, dtypes and segment key"""
+    layout = ([(name, COLUMN_DTYPES[name]) for name in TABLE_COLUMNS[table]], segment_key(table))
+    return _file_digest([csv_path], repr(layout).encode())
+
+def table_version(data_dir, table):
+    """Content hash of a table as stored: its columnar files if present, else its CSV (cached per process)"""
+    path = os.path.join(data_dir, table)
+    if has_columns(path):
+        table_dir = path + COLUMNS_SUFFIX
+        return _file_digest([os.path.join(table_dir, name) for name in sorted(os.listdir(table_dir))])
+    return content_hash(path + '.csv', table)
+
+def cached_columns(data_dir, cache_name, build, segment_by=()):
+    """Path of the columnar table <cache_name> in the cache, writing the frame build() returns on first use.
+
+    Cache entries named like cache_name up to its last '-' are earlier versions and are removed.
+    """
+    try:
+        return _cached_columns(os.path.join(data_dir, CACHE_DIR), cache_name, build, segment_by)
+    except OSError:
+        return _cached_columns(FALLBACK_CACHE_DIR, cache_name, build, segment_by)
+
+def _cached_columns(cache_dir, cache_name, build, segment_by):
+    cache_path = os.path.join(cache_dir, cache_name)
+    if has_columns(cache_path):
+        return cache_path
+
+    # Build under a private name and rename into place, so concurrent workers never see a partial table
+    tmp_path = os.path.join(cache_dir, f'.tmp-{cache_name}-{os.getpid()}-{threading.get_ident()}')
+    write_columns(build(), tmp_path, segment_by)
+    try:
+        os.rename(tmp_path + COLUMNS_SUFFIX, cache_path + COLUMNS_SUFFIX)
+    except OSError:
+        # Another process finished first; its copy is identical
+        shutil.rmtree(tmp_path + COLUMNS_SUFFIX, ignore_errors=True)
+
+    # Drop copies of earlier versions; readers map or load a copy's files when they open it, and unlinking
+    # them leaves those mappings valid
+    prefix = cache_name.rsplit('-', 1)[0] + '-'
+    for name in os.listdir(cache_dir):
+        if name.startswith(prefix) and name != cache_name + COLUMNS_SUFFIX:
+            shutil.rmtree(os.path.join(cache_dir, name), ignore_errors=True)
+    return cache_path
+
+def table_path(data_dir, table):
+    """Columnar table the dashboards read: the stored one if already segmented, else a cached copy"""
+    path = os.path.join(data_dir, table)
+    if has_columns(path) and segmented_by(path) == segment_key(table):
+        return path
+
+    def parse():
+        return read_columns(path) if has_columns(path) else _read_csv(path + '.csv', table)
+    return cached_columns(data_dir, f'{table}-{table_version(data_dir, table)}', parse, segment_key(table))
+
+def load_table(data_dir, table, columns=None):
+    """Read a table with its declared schema as read-only, memory-mapped columns, in segment order"""
+    return read_columns(table_path(data_dir, table), columns, mmap=True)
@@ -1,354 +1,556 @@
+import argparse
+import os
+import shutil
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from typing import NamedTuple
 import pandas as pd
 import numpy as np
-from datetime import datetime, timedelta
 import random
+from data_store import (
+    DEPARTMENTS, ENTITY_TABLE, LEARNING_STYLES, PROFESSOR_TABLE, RESTRICTION_LEVELS, STUDENT_TABLE,
+    TECH_ADOPTION_LEVELS, YEARS_OF_STUDY, entity_dimension, read_columns, segment_key, write_columns,
+)
 
-# Set seed for reproducibility
-np.random.seed(42)
-random.seed(42)
+DEFAULT_OUTPUT_DIR = 'data'
+OUTPUT_FORMATS = ['csv', 'csv.gz', 'columns']
+YEARS = range(2022, 2026)
 
 # ============================================================================
-# SECTION 1: PROFESSOR DATA (40 professors with unique characteristics)
+# SECTION 1: METRIC SPECIFICATION
 # ============================================================================
+#
+# Each entity type is described by a table rather than by branching code:
+#   - traits are drawn once per entity, in the listed order
+#   - metrics are drawn once per entity and year, in the listed order, from the
+#     (low, high) range of that year; years outside the table use the nearest year
+#   - effects then adjust a metric by the entity's trait value, as
+#     x * scale + offset clipped to [floor, cap]
+# Integer metrics (decimals=None) are truncated after the draw and after each effect.
+# Adding a year or a metric is a table edit; both samplers below read only this spec.
 
-professor_data = []
-
-for prof_id in range(1, 41):
-    # Unique characteristics for each professor
-    tenure_years = np.random.randint(2, 25)
-    tech_adoption_level = np.random.choice(['Early Adopter', 'Moderate', 'Traditional'], p=[0.35, 0.45, 0.20])
-    ai_restriction = np.random.choice(['Full Adoption', 'Partial Restriction', 'Full Restriction'], p=[0.60, 0.25, 0.15])
-    department = np.random.choice(['Computer Science', 'Business', 'Engineering', 'Liberal Arts', 'Data Science'])
-    
-    # 2022-2025 Timeline Data
-    for year in range(2022, 2026):
-        # Lesson Planning & Content Creation (hours saved per week)
-        if year == 2022:  # Pre-AI adoption
-            hours_saved_lesson_planning = np.random.uniform(0, 1)
-            ppts_created_per_month = np.random.randint(2, 5)
-        elif year == 2023:  # Early adoption
-            hours_saved_lesson_planning = np.random.uniform(1, 3)
-            ppts_created_per_month = np.random.randint(4, 8)
-        elif year == 2024:  # Active adoption
-            hours_saved_lesson_planning = np.random.uniform(3, 6)
-            ppts_created_per_month = np.random.randint(7, 12)
-        else:  # 2025
-            hours_saved_lesson_planning = np.random.uniform(5, 8)
-            ppts_created_per_month = np.random.randint(10, 15)
-        
-        # Adjust for AI restriction level
-        if ai_restriction == 'Full Restriction':
-            hours_saved_lesson_planning = hours_saved_lesson_planning * 0.1
-            ppts_created_per_month = max(1, int(ppts_created_per_month * 0.2))
-        elif ai_restriction == 'Partial Restriction':
-            hours_saved_lesson_planning = hours_saved_lesson_planning * 0.5
-            ppts_created_per_month = int(ppts_created_per_month * 0.6)
-        
-        # Automated Grading (assignments graded, quality score, time in hours)
-        if year <= 2022:
-            assignments_graded = np.random.randint(50, 100)
-            grading_quality_score = np.random.uniform(0.75, 0.85)
-            grading_time_hours = np.random.uniform(12, 16)
-        elif year == 2023:
-            assignments_graded = np.random.randint(80, 150)
-            grading_quality_score = np.random.uniform(0.82, 0.90)
-            grading_time_hours = np.random.uniform(8, 12)
-        elif year == 2024:
-            assignments_graded = np.random.randint(120, 200)
-            grading_quality_score = np.random.uniform(0.88, 0.95)
-            grading_time_hours = np.random.uniform(4, 8)
-        else:  # 2025
-            assignments_graded = np.random.randint(150, 250)
-            grading_quality_score = np.random.uniform(0.92, 0.97)
-            grading_time_hours = np.random.uniform(3, 6)
-        
-        # Administrative Task Automation (hours saved per week)
-        if year <= 2022:
-            hours_saved_admin = np.random.uniform(0, 0.5)
-        elif year == 2023:
-            hours_saved_admin = np.random.uniform(0.5, 2)
-        elif year == 2024:
-            hours_saved_admin = np.random.uniform(2, 4)
-        else:  # 2025
-            hours_saved_admin = np.random.uniform(3.5, 6)
-        
-        if ai_restriction == 'Full Restriction':
-            hours_saved_admin = hours_saved_admin * 0.05
-        elif ai_restriction == 'Partial Restriction':
-            hours_saved_admin = hours_saved_admin * 0.4
-        
-        # Student Performance Analytics (students monitored, at-risk identified, intervention success)
-        if year <= 2022:
-            students_monitored = np.random.randint(20, 40)
-            at_risk_identified = int(students_monitored * np.random.uniform(0.1, 0.2))
-            intervention_success_rate = np.random.uniform(0.40, 0.55)
-        elif year == 2023:
-            students_monitored = np.random.randint(40, 80)
-            at_risk_identified = int(students_monitored * np.random.uniform(0.15, 0.25))
-            intervention_success_rate = np.random.uniform(0.55, 0.70)
-        elif year == 2024:
-            students_monitored = np.random.randint(70, 120)
-            at_risk_identified = int(students_monitored * np.random.uniform(0.18, 0.30))
-            intervention_success_rate = np.random.uniform(0.68, 0.80)
-        else:  # 2025
-            students_monitored = np.random.randint(100, 150)
-            at_risk_identified = int(students_monitored * np.random.uniform(0.20, 0.35))
-            intervention_success_rate = np.random.uniform(0.75, 0.88)
-        
-        if ai_restriction == 'Full Restriction':
-            students_monitored = int(students_monitored * 0.3)
-            at_risk_identified = int(at_risk_identified * 0.3)
-            intervention_success_rate = intervention_success_rate * 0.7
-        elif ai_restriction == 'Partial Restriction':
-            students_monitored = int(students_monitored * 0.6)
-            intervention_success_rate = intervention_success_rate * 0.85
-        
-        professor_data.append({
-            'Entity_Type': 'Professor',
-            'ID': f'PROF_{prof_id:03d}',
-            'Department': department,
-            'Tenure_Years': tenure_years,
-            'Tech_Adoption_Level': tech_adoption_level,
-            'AI_Restriction_Status': ai_restriction,
-            'Year': year,
-            'Hours_Saved_Lesson_Planning_Per_Week': round(hours_saved_lesson_planning, 2),
-            'PPTs_Created_Per_Month': ppts_created_per_month,
-            'Assignments_Graded_Per_Semester': assignments_graded,
-            'Grading_Quality_Score': round(grading_quality_score, 3),
-            'Grading_Time_Hours_Per_Semester': round(grading_time_hours, 2),
-            'Hours_Saved_Admin_Per_Week': round(hours_saved_admin, 2),
-            'Students_Monitored': students_monitored,
-            'At_Risk_Students_Identified': at_risk_identified,
-            'Intervention_Success_Rate': round(intervention_success_rate, 3)
-        })
-
-prof_df = pd.DataFrame(professor_data)
-print("✓ Professor Data Created:", prof_df.shape)
+class Effect(NamedTuple):
+    scale: float = 1.0
+    offset: float = 0.0
+    floor: float = -np.inf
+    cap: float = np.inf
 
-# ============================================================================
-# SECTION 2: STUDENT DATA (100 students with unique characteristics)
-# ============================================================================
+class Metric(NamedTuple):
+    name: str
+    draw: str                 # 'uniform' or 'randint' (high is exclusive)
+    ranges: dict              # year -> (low, high)
+    decimals: int = None      # None for integer metrics
+    effects: tuple = ()       # ((trait column, {trait value: Effect}), ...) applied in order
+    times: str = None         # multiply the draw by this earlier metric's unadjusted value
+
+def restricted(partial=None, full=None):
+    """Effect on AI_Restriction_Status; plain numbers are shorthand for a scale"""
+    by_status = {'Partial Restriction': partial, 'Full Restriction': full}
+    return ('AI_Restriction_Status', {
+        status: effect if isinstance(effect, Effect) else Effect(scale=effect)
+        for status, effect in by_status.items() if effect is not None
+    })
+
+PROFESSOR_SPEC = {
+    'entity_type': 'Professor',
+    'id_prefix': 'PROF_',
+    'traits': [
+        ('Tenure_Years', (2, 25), None),
+        ('Tech_Adoption_Level', TECH_ADOPTION_LEVELS, [0.35, 0.45, 0.20]),
+        ('AI_Restriction_Status', RESTRICTION_LEVELS, [0.60, 0.25, 0.15]),
+        ('Department', DEPARTMENTS, None),
+    ],
+    'trait_columns': ['Department', 'Tenure_Years', 'Tech_Adoption_Level', 'AI_Restriction_Status'],
+    'metrics': [
+        # Lesson Planning & Content Creation
+        Metric('Hours_Saved_Lesson_Planning_Per_Week', 'uniform',
+               {2022: (0, 1), 2023: (1, 3), 2024: (3, 6), 2025: (5, 8)}, 2,
+               (restricted(partial=0.5, full=0.1),)),
+        Metric('PPTs_Created_Per_Month', 'randint',
+               {2022: (2, 5), 2023: (4, 8), 2024: (7, 12), 2025: (10, 15)}, None,
+               (restricted(partial=0.6, full=Effect(scale=0.2, floor=1)),)),
+        # Automated Grading
+        Metric('Assignments_Graded_Per_Semester', 'randint',
+               {2022: (50, 100), 2023: (80, 150), 2024: (120, 200), 2025: (150, 250)}),
+        Metric('Grading_Quality_Score', 'uniform',
+               {2022: (0.75, 0.85), 2023: (0.82, 0.90), 2024: (0.88, 0.95), 2025: (0.92, 0.97)}, 3),
+        Metric('Grading_Time_Hours_Per_Semester', 'uniform',
+               {2022: (12, 16), 2023: (8, 12), 2024: (4, 8), 2025: (3, 6)}, 2),
+        # Administrative Task Automation
+        Metric('Hours_Saved_Admin_Per_Week', 'uniform',
+               {2022: (0, 0.5), 2023: (0.5, 2), 2024: (2, 4), 2025: (3.5, 6)}, 2,
+               (restricted(partial=0.4, full=0.05),)),
+        # Student Performance Analytics
+        Metric('Students_Monitored', 'randint',
+               {2022: (20, 40), 2023: (40, 80), 2024: (70, 120), 2025: (100, 150)}, None,
+               (restricted(partial=0.6, full=0.3),)),
+        Metric('At_Risk_Students_Identified', 'uniform',
+               {2022: (0.1, 0.2), 2023: (0.15, 0.25), 2024: (0.18, 0.30), 2025: (0.20, 0.35)}, None,
+               (restricted(full=0.3),), times='Students_Monitored'),
+        Metric('Intervention_Success_Rate', 'uniform',
+               {2022: (0.40, 0.55), 2023: (0.55, 0.70), 2024: (0.68, 0.80), 2025: (0.75, 0.88)}, 3,
+               (restricted(partial=0.85, full=0.7),)),
+    ],
+}
 
-student_data = []
-
-for student_id in range(1, 101):
-    # Unique characteristics for each student
-    year_of_study = np.random.choice(['Year 1', 'Year 2', 'Year 3', 'Year 4'])
-    learning_style = np.random.choice(['Visual', 'Auditory', 'Reading-Writing', 'Kinesthetic'])
-    ai_restriction = np.random.choice(['Full Adoption', 'Partial Restriction', 'Full Restriction'], p=[0.70, 0.20, 0.10])
-    major = np.random.choice(['Computer Science', 'Business', 'Engineering', 'Liberal Arts', 'Data Science'])
-    
-    # 2022-2025 Timeline Data
-    for year in range(2022, 2026):
+STUDENT_SPEC = {
+    'entity_type': 'Student',
+    'id_prefix': 'STU_',
+    'traits': [
+        ('Year_of_Study', YEARS_OF_STUDY, None),
+        ('Learning_Style', LEARNING_STYLES, None),
+        ('AI_Restriction_Status', RESTRICTION_LEVELS, [0.70, 0.20, 0.10]),
+        ('Major', DEPARTMENTS, None),
+    ],
+    'trait_columns': ['Major', 'Year_of_Study', 'Learning_Style', 'AI_Restriction_Status'],
+    'metrics': [
         # AI Literacy & Skill Acquisition (0-100 scale)
-        if year == 2022:
-            ai_literacy_score = np.random.uniform(20, 35)
-            responsible_use_awareness = np.random.uniform(15, 30)
-            creativity_preservation_score = np.random.uniform(75, 90)
-        elif year == 2023:
-            ai_literacy_score = np.random.uniform(35, 55)
-            responsible_use_awareness = np.random.uniform(30, 50)
-            creativity_preservation_score = np.random.uniform(70, 85)
-        elif year == 2024:
-            ai_literacy_score = np.random.uniform(55, 75)
-            responsible_use_awareness = np.random.uniform(55, 75)
-            creativity_preservation_score = np.random.uniform(65, 80)
-        else:  # 2025
-            ai_literacy_score = np.random.uniform(70, 90)
-            responsible_use_awareness = np.random.uniform(75, 92)
-            creativity_preservation_score = np.random.uniform(60, 78)
-        
-        # Adjust for AI restriction
-        if ai_restriction == 'Full Restriction':
-            ai_literacy_score = ai_literacy_score * 0.4
-            responsible_use_awareness = responsible_use_awareness * 0.9
-            creativity_preservation_score = np.min([creativity_preservation_score + 15, 95])
-        elif ai_restriction == 'Partial Restriction':
-            ai_literacy_score = ai_literacy_score * 0.7
-            responsible_use_awareness = responsible_use_awareness * 0.95
-        
+        Metric('AI_Literacy_Score', 'uniform',
+               {2022: (20, 35), 2023: (35, 55), 2024: (55, 75), 2025: (70, 90)}, 2,
+               (restricted(partial=0.7, full=0.4),)),
+        Metric('Responsible_Use_Awareness', 'uniform',
+               {2022: (15, 30), 2023: (30, 50), 2024: (55, 75), 2025: (75, 92)}, 2,
+               (restricted(partial=0.95, full=0.9),)),
+        Metric('Creativity_Preservation_Score', 'uniform',
+               {2022: (75, 90), 2023: (70, 85), 2024: (65, 80), 2025: (60, 78)}, 2,
+               (restricted(full=Effect(offset=15, cap=95)),)),
         # AI Tool Adoption & Usage Patterns
-        if year == 2022:
-            ai_tool_adoption_rate = np.random.uniform(0.05, 0.15)
-            uses_ai_for_brainstorming = np.random.uniform(0.02, 0.10)
-            uses_ai_for_assessment = np.random.uniform(0.01, 0.08)
-            uses_ai_for_collaboration = np.random.uniform(0.01, 0.05)
-        elif year == 2023:
-            ai_tool_adoption_rate = np.random.uniform(0.30, 0.50)
-            uses_ai_for_brainstorming = np.random.uniform(0.25, 0.40)
-            uses_ai_for_assessment = np.random.uniform(0.20, 0.35)
-            uses_ai_for_collaboration = np.random.uniform(0.15, 0.30)
-        elif year == 2024:
-            ai_tool_adoption_rate = np.random.uniform(0.65, 0.82)
-            uses_ai_for_brainstorming = np.random.uniform(0.55, 0.70)
-            uses_ai_for_assessment = np.random.uniform(0.50, 0.65)
-            uses_ai_for_collaboration = np.random.uniform(0.40, 0.55)
-        else:  # 2025
-            ai_tool_adoption_rate = np.random.uniform(0.85, 0.95)
-            uses_ai_for_brainstorming = np.random.uniform(0.80, 0.92)
-            uses_ai_for_assessment = np.random.uniform(0.75, 0.88)
-            uses_ai_for_collaboration = np.random.uniform(0.65, 0.80)
-        
-        if ai_restriction == 'Full Restriction':
-            ai_tool_adoption_rate = ai_tool_adoption_rate * 0.1
-            uses_ai_for_brainstorming = uses_ai_for_brainstorming * 0.15
-            uses_ai_for_assessment = uses_ai_for_assessment * 0.1
-            uses_ai_for_collaboration = uses_ai_for_collaboration * 0.2
-        elif ai_restriction == 'Partial Restriction':
-            ai_tool_adoption_rate = ai_tool_adoption_rate * 0.5
-            uses_ai_for_brainstorming = uses_ai_for_brainstorming * 0.6
-            uses_ai_for_assessment = uses_ai_for_assessment * 0.5
-            uses_ai_for_collaboration = uses_ai_for_collaboration * 0.7
-        
+        Metric('AI_Tool_Adoption_Rate', 'uniform',
+               {2022: (0.05, 0.15), 2023: (0.30, 0.50), 2024: (0.65, 0.82), 2025: (0.85, 0.95)}, 3,
+               (restricted(partial=0.5, full=0.1),)),
+        Metric('Uses_AI_For_Brainstorming', 'uniform',
+               {2022: (0.02, 0.10), 2023: (0.25, 0.40), 2024: (0.55, 0.70), 2025: (0.80, 0.92)}, 3,
+               (restricted(partial=0.6, full=0.15),)),
+        Metric('Uses_AI_For_Assessment', 'uniform',
+               {2022: (0.01, 0.08), 2023: (0.20, 0.35), 2024: (0.50, 0.65), 2025: (0.75, 0.88)}, 3,
+               (restricted(partial=0.5, full=0.1),)),
+        Metric('Uses_AI_For_Collaboration', 'uniform',
+               {2022: (0.01, 0.05), 2023: (0.15, 0.30), 2024: (0.40, 0.55), 2025: (0.65, 0.80)}, 3,
+               (restricted(partial=0.7, full=0.2),)),
         # Study Efficiency & Time Management
-        if year == 2022:
-            hours_per_assignment = np.random.uniform(8, 12)
-            gpa = np.random.uniform(2.5, 3.5)
-            assignment_completion_rate = np.random.uniform(0.75, 0.90)
-        elif year == 2023:
-            hours_per_assignment = np.random.uniform(6, 10)
-            gpa = np.random.uniform(2.7, 3.7)
-            assignment_completion_rate = np.random.uniform(0.82, 0.92)
-        elif year == 2024:
-            hours_per_assignment = np.random.uniform(4, 7)
-            gpa = np.random.uniform(3.0, 3.8)
-            assignment_completion_rate = np.random.uniform(0.88, 0.95)
-        else:  # 2025
-            hours_per_assignment = np.random.uniform(3, 5)
-            gpa = np.random.uniform(3.2, 3.9)
-            assignment_completion_rate = np.random.uniform(0.90, 0.97)
-        
-        if ai_restriction == 'Full Restriction':
-            hours_per_assignment = hours_per_assignment * 1.3
-            gpa = gpa * 0.95
-            assignment_completion_rate = assignment_completion_rate * 0.90
-        elif ai_restriction == 'Partial Restriction':
-            hours_per_assignment = hours_per_assignment * 1.1
-            gpa = gpa * 0.98
-            assignment_completion_rate = assignment_completion_rate * 0.95
-        
+        Metric('Hours_Per_Assignment', 'uniform',
+               {2022: (8, 12), 2023: (6, 10), 2024: (4, 7), 2025: (3, 5)}, 2,
+               (restricted(partial=1.1, full=1.3),)),
+        Metric('GPA', 'uniform',
+               {2022: (2.5, 3.5), 2023: (2.7, 3.7), 2024: (3.0, 3.8), 2025: (3.2, 3.9)}, 2,
+               (restricted(partial=0.98, full=0.95),)),
+        Metric('Assignment_Completion_Rate', 'uniform',
+               {2022: (0.75, 0.90), 2023: (0.82, 0.92), 2024: (0.88, 0.95), 2025: (0.90, 0.97)}, 3,
+               (restricted(partial=0.95, full=0.90),)),
         # Diverse Learning Outcomes by Learning Style
-        learning_style_multiplier = {
-            'Visual': 1.15,
-            'Auditory': 1.10,
-            'Reading-Writing': 1.12,
-            'Kinesthetic': 1.08
-        }
-        
-        if year == 2022:
-            performance_improvement = np.random.uniform(0, 5) * learning_style_multiplier[learning_style]
-        elif year == 2023:
-            performance_improvement = np.random.uniform(5, 12) * learning_style_multiplier[learning_style]
-        elif year == 2024:
-            performance_improvement = np.random.uniform(12, 22) * learning_style_multiplier[learning_style]
-        else:  # 2025
-            performance_improvement = np.random.uniform(18, 30) * learning_style_multiplier[learning_style]
-        
-        if ai_restriction == 'Full Restriction':
-            performance_improvement = performance_improvement * 0.5
-        elif ai_restriction == 'Partial Restriction':
-            performance_improvement = performance_improvement * 0.75
-        
+        Metric('Performance_Improvement_Percent', 'uniform',
+               {2022: (0, 5), 2023: (5, 12), 2024: (12, 22), 2025: (18, 30)}, 2,
+               (('Learning_Style', {'Visual': Effect(1.15), 'Auditory': Effect(1.10),
+                                    'Reading-Writing': Effect(1.12), 'Kinesthetic': Effect(1.08)}),
+                restricted(partial=0.75, full=0.5))),
         # AI Skill Development Pathway (proficiency level %)
-        if year == 2022:
-            skill_awareness_level = np.random.uniform(10, 25)
-            skill_beginner_level = np.random.uniform(5, 15)
-            skill_intermediate_level = np.random.uniform(2, 8)
-            skill_advanced_level = np.random.uniform(0, 3)
-        elif year == 2023:
-            skill_awareness_level = np.random.uniform(50, 75)
-            skill_beginner_level = np.random.uniform(30, 50)
-            skill_intermediate_level = np.random.uniform(10, 25)
-            skill_advanced_level = np.random.uniform(3, 10)
-        elif year == 2024:
-            skill_awareness_level = np.random.uniform(75, 95)
-            skill_beginner_level = np.random.uniform(55, 75)
-            skill_intermediate_level = np.random.uniform(30, 50)
-            skill_advanced_level = np.random.uniform(10, 25)
-        else:  # 2025
-            skill_awareness_level = np.random.uniform(90, 98)
-            skill_beginner_level = np.random.uniform(75, 90)
-            skill_intermediate_level = np.random.uniform(50, 70)
-            skill_advanced_level = np.random.uniform(25, 45)
-        
-        if ai_restriction == 'Full Restriction':
-            skill_awareness_level = skill_awareness_level * 0.3
-            skill_beginner_level = skill_beginner_level * 0.2
-            skill_intermediate_level = skill_intermediate_level * 0.1
-            skill_advanced_level = skill_advanced_level * 0.05
-        elif ai_restriction == 'Partial Restriction':
-            skill_awareness_level = skill_awareness_level * 0.6
-            skill_beginner_level = skill_beginner_level * 0.5
-            skill_intermediate_level = skill_intermediate_level * 0.4
-            skill_advanced_level = skill_advanced_level * 0.3
-        
+        Metric('Skill_Awareness_Level', 'uniform',
+               {2022: (10, 25), 2023: (50, 75), 2024: (75, 95), 2025: (90, 98)}, 2,
+               (restricted(partial=0.6, full=0.3),)),
+        Metric('Skill_Beginner_Level', 'uniform',
+               {2022: (5, 15), 2023: (30, 50), 2024: (55, 75), 2025: (75, 90)}, 2,
+               (restricted(partial=0.5, full=0.2),)),
+        Metric('Skill_Intermediate_Level', 'uniform',
+               {2022: (2, 8), 2023: (10, 25), 2024: (30, 50), 2025: (50, 70)}, 2,
+               (restricted(partial=0.4, full=0.1),)),
+        Metric('Skill_Advanced_Level', 'uniform',
+               {2022: (0, 3), 2023: (3, 10), 2024: (10, 25), 2025: (25, 45)}, 2,
+               (restricted(partial=0.3, full=0.05),)),
         # Collaboration & Communication Using AI
-        if year == 2022:
-            uses_ai_collaboration_tools = np.random.uniform(0.02, 0.10)
-            language_barrier_reduction = np.random.uniform(0, 5)
-            team_project_success_rate = np.random.uniform(0.65, 0.80)
-        elif year == 2023:
-            uses_ai_collaboration_tools = np.random.uniform(0.25, 0.45)
-            language_barrier_reduction = np.random.uniform(10, 25)
-            team_project_success_rate = np.random.uniform(0.75, 0.85)
-        elif year == 2024:
-            uses_ai_collaboration_tools = np.random.uniform(0.55, 0.70)
-            language_barrier_reduction = np.random.uniform(30, 50)
-            team_project_success_rate = np.random.uniform(0.82, 0.92)
-        else:  # 2025
-            uses_ai_collaboration_tools = np.random.uniform(0.75, 0.88)
-            language_barrier_reduction = np.random.uniform(55, 75)
-            team_project_success_rate = np.random.uniform(0.88, 0.97)
-        
-        if ai_restriction == 'Full Restriction':
-            uses_ai_collaboration_tools = uses_ai_collaboration_tools * 0.2
-            language_barrier_reduction = language_barrier_reduction * 0.3
-            team_project_success_rate = team_project_success_rate * 0.90
-        elif ai_restriction == 'Partial Restriction':
-            uses_ai_collaboration_tools = uses_ai_collaboration_tools * 0.6
-            language_barrier_reduction = language_barrier_reduction * 0.65
-            team_project_success_rate = team_project_success_rate * 0.95
-        
-        student_data.append({
-            'Entity_Type': 'Student',
-            'ID': f'STU_{student_id:03d}',
-            'Major': major,
-            'Year_of_Study': year_of_study,
-            'Learning_Style': learning_style,
-            'AI_Restriction_Status': ai_restriction,
-            'Year': year,
-            'AI_Literacy_Score': round(ai_literacy_score, 2),
-            'Responsible_Use_Awareness': round(responsible_use_awareness, 2),
-            'Creativity_Preservation_Score': round(creativity_preservation_score, 2),
-            'AI_Tool_Adoption_Rate': round(ai_tool_adoption_rate, 3),
-            'Uses_AI_For_Brainstorming': round(uses_ai_for_brainstorming, 3),
-            'Uses_AI_For_Assessment': round(uses_ai_for_assessment, 3),
-            'Uses_AI_For_Collaboration': round(uses_ai_for_collaboration, 3),
-            'Hours_Per_Assignment': round(hours_per_assignment, 2),
-            'GPA': round(gpa, 2),
-            'Assignment_Completion_Rate': round(assignment_completion_rate, 3),
-            'Performance_Improvement_Percent': round(performance_improvement, 2),
-            'Skill_Awareness_Level': round(skill_awareness_level, 2),
-            'Skill_Beginner_Level': round(skill_beginner_level, 2),
-            'Skill_Intermediate_Level': round(skill_intermediate_level, 2),
-            'Skill_Advanced_Level': round(skill_advanced_level, 2),
-            'Uses_AI_Collaboration_Tools': round(uses_ai_collaboration_tools, 3),
-            'Language_Barrier_Reduction_Percent': round(language_barrier_reduction, 2),
-            'Team_Project_Success_Rate': round(team_project_success_rate, 3)
-        })
-
-student_df = pd.DataFrame(student_data)
-print("✓ Student Data Created:", student_df.shape)
-
-# Save to output directory
-prof_df.to_csv('/mnt/user-data/outputs/ai_education_professor_data.csv', index=False)
-student_df.to_csv('/mnt/user-data/outputs/ai_education_student_data.csv', index=False)
-
-# Create combined dataset for dashboard
-combined_df = pd.concat([prof_df, student_df], ignore_index=True)
-combined_df.to_csv('/mnt/user-data/outputs/ai_education_combined_data.csv', index=False)
-
-print("\n✓ All synthetic data files created successfully!")
-print(f"  - Professor records: {len(prof_df)}")
-print(f"  - Student records: {len(student_df)}")
-print(f"  - Total combined records: {len(combined_df)}")
+        Metric('Uses_AI_Collaboration_Tools', 'uniform',
+               {2022: (0.02, 0.10), 2023: (0.25, 0.45), 2024: (0.55, 0.70), 2025: (0.75, 0.88)}, 3,
+               (restricted(partial=0.6, full=0.2),)),
+        Metric('Language_Barrier_Reduction_Percent', 'uniform',
+               {2022: (0, 5), 2023: (10, 25), 2024: (30, 50), 2025: (55, 75)}, 2,
+               (restricted(partial=0.65, full=0.3),)),
+        Metric('Team_Project_Success_Rate', 'uniform',
+               {2022: (0.65, 0.80), 2023: (0.75, 0.85), 2024: (0.82, 0.92), 2025: (0.88, 0.97)}, 3,
+               (restricted(partial=0.95, full=0.90),)),
+    ],
+}
+
+SPECS = {'Professor': PROFESSOR_SPEC, 'Student': STUDENT_SPEC}
+
+def _range_year(ranges, year):
+    """Nearest year present in a metric's range table"""
+    table_years = sorted(ranges)
+    return min(max(year, table_years[0]), table_years[-1])
+
+def _columns(spec):
+    return ['Entity_Type', 'ID'] + spec['trait_columns'] + ['Year'] + [m.name for m in spec['metrics']]
+
+# ============================================================================
+# SECTION 2: REFERENCE GENERATION (one scalar draw at a time)
+# ============================================================================
+#
+# Consumes the global np.random stream in exactly the order of the original
+# per-entity loops, so seed 42 reproduces the shipped CSVs byte for byte.
+
+def generate_entities_loop(spec, n_entities, years):
+    """Generate one entity type's records with scalar draws from the global stream"""
+    rows = []
+    for entity_id in range(1, n_entities + 1):
+        # Unique characteristics for each entity
+        traits = {}
+        for name, values, p in spec['traits']:
+            if isinstance(values, tuple):
+                traits[name] = np.random.randint(*values)
+            else:
+                traits[name] = np.random.choice(values, p=p)
+
+        for year in years:
+            raw, adjusted = {}, {}
+            for metric in spec['metrics']:
+                low, high = metric.ranges[_range_year(metric.ranges, year)]
+                x = np.random.uniform(low, high) if metric.draw == 'uniform' else np.random.randint(low, high)
+                if metric.times:
+                    x = raw[metric.times] * x
+                if metric.decimals is None:
+                    x = int(x)
+                raw[metric.name] = x
+                for trait, by_value in metric.effects:
+                    effect = by_value.get(traits[trait])
+                    if effect is None:
+                        continue
+                    x = x * effect.scale + effect.offset
+                    if metric.decimals is None:
+                        x = int(x)
+                    x = min(max(x, effect.floor), effect.cap)
+                adjusted[metric.name] = x if metric.decimals is None else round(x, metric.decimals)
+
+            rows.append({'Entity_Type': spec['entity_type'], 'ID': f"{spec['id_prefix']}{entity_id:03d}",
+                         **{name: traits[name] for name in spec['trait_columns']}, 'Year': year, **adjusted})
+    return pd.DataFrame(rows, columns=_columns(spec))
+
+def generate_professor_data(n_professors=40, years=YEARS):
+    """Generate professor records one scalar draw at a time (reference mode)"""
+    return generate_entities_loop(PROFESSOR_SPEC, n_professors, years)
+
+def generate_student_data(n_students=100, years=YEARS):
+    """Generate student records one scalar draw at a time (reference mode)"""
+    return generate_entities_loop(STUDENT_SPEC, n_students, years)
+
+# ============================================================================
+# SECTION 3: VECTORIZED GENERATION (all entities x years as whole arrays)
+# ============================================================================
+
+@lru_cache(maxsize=None)
+def compile_spec(entity_type, years):
+    """Compile a spec into per-year range arrays and per-trait-code effect lookup tables"""
+    spec = SPECS[entity_type]
+    trait_values = {name: values for name, values, _ in spec['traits']}
+    metrics = []
+    for metric in spec['metrics']:
+        low, high = np.array([metric.ranges[_range_year(metric.ranges, year)] for year in years]).T
+        effects = []
+        for trait, by_value in metric.effects:
+            table = np.array([by_value.get(value, Effect()) for value in trait_values[trait]], dtype=float)
+            effects.append((trait, *(table[:, i][:, None] for i in range(4))))
+        metrics.append((metric, low, high, effects))
+    return metrics
+
+def _entity_ids(spec, first_id, n):
+    ids = pd.Series(np.arange(first_id, first_id + n)).astype(str).str.zfill(3)
+    return (spec['id_prefix'] + ids).to_numpy()
+
+def _assemble(spec, ids, traits, metrics, years):
+    """Lay out per-entity traits and (entities x years) metric blocks as entity-major rows"""
+    n_years = len(years)
+    columns = {
+        'Entity_Type': spec['entity_type'],
+        'ID': np.repeat(ids, n_years),
+    }
+    for name in spec['trait_columns']:
+        columns[name] = np.repeat(traits[name], n_years)
+    columns['Year'] = np.tile(years, len(ids))
+    for metric in spec['metrics']:
+        values = metrics[metric.name].ravel()
+        columns[metric.name] = values if metric.decimals is None else np.round(values, metric.decimals)
+    return pd.DataFrame(columns)
+
+def _draw_traits(spec, rng, n):
+    """Draw per-entity traits; categorical traits are also returned as codes for effect lookups"""
+    codes, traits = {}, {}
+    for name, values, p in spec['traits']:
+        if isinstance(values, tuple):
+            traits[name] = rng.integers(*values, size=n)
+        else:
+            codes[name] = rng.choice(len(values), size=n, p=p)
+            traits[name] = np.asarray(values)[codes[name]]
+    return codes, traits
+
+def _draw_metrics(entity_type, rng, codes, n, years):
+    """Draw every metric as an (entities x years) block and apply the compiled effects"""
+    raw, adjusted = {}, {}
+    for metric, low, high, effects in compile_spec(entity_type, tuple(years.tolist())):
+        if metric.draw == 'uniform':
+            x = rng.uniform(low, high, size=(n, len(years)))
+        else:
+            x = rng.integers(low, high, size=(n, len(years)))
+        if metric.times:
+            x = raw[metric.times] * x
+        if metric.decimals is None:
+            x = x.astype(int)
+        raw[metric.name] = x
+        for trait, scale, offset, floor, cap in effects:
+            code = codes[trait]
+            x = x * scale[code] + offset[code]
+            if metric.decimals is None:
+                x = np.trunc(x)
+            x = np.clip(x, floor[code], cap[code])
+        adjusted[metric.name] = x.astype(int) if metric.decimals is None else x
+    return adjusted
+
+def generate_entities(entity_type, rng, n_entities, years=YEARS, first_id=1):
+    """Generate one entity type with one array draw per metric, evaluated for all rows at once"""
+    spec = SPECS[entity_type]
+    years = np.asarray(list(years))
+    codes, traits = _draw_traits(spec, rng, n_entities)
+    metrics = _draw_metrics(entity_type, rng, codes, n_entities, years)
+    return _assemble(spec, _entity_ids(spec, first_id, n_entities), traits, metrics, years)
+
+def extend_entities(entity_type, rng, existing, years):
+    """Generate further years for entities whose ID and traits are given as a frame"""
+    spec = SPECS[entity_type]
+    years = np.asarray(list(years))
+    traits = {name: existing[name].to_numpy() for name in spec['trait_columns']}
+    codes = {}
+    for name, values, _ in spec['traits']:
+        if isinstance(values, tuple):
+            continue
+        codes[name] = pd.Categorical(existing[name], categories=values).codes
+        if (codes[name] < 0).any():
+            raise ValueError(f'{entity_type} {name} has values outside {values}')
+    metrics = _draw_metrics(entity_type, rng, codes, len(existing), years)
+    return _assemble(spec, existing['ID'].to_numpy(), traits, metrics, years)
+
+def generate_professor_data_vectorized(rng, n_professors=40, years=YEARS, first_id=1):
+    """Generate professor records with one array draw per metric"""
+    return generate_entities('Professor', rng, n_professors, years, first_id)
+
+def generate_student_data_vectorized(rng, n_students=100, years=YEARS, first_id=1):
+    """Generate student records with one array draw per metric"""
+    return generate_entities('Student', rng, n_students, years, first_id)
+
+# ============================================================================
+# SECTION 4: STREAMING PARTITIONED OUTPUT (bounded memory)
+# ============================================================================
+
+def write_table(df, path, formats=('csv',), segment_by=()):
+    """Write a frame to <path>.<format> in each requested format; columnar copies are sorted into segments"""
+    for fmt in formats:
+        if fmt == 'columns':
+            write_columns(df, path, segment_by)
+        else:
+            # Compression is inferred from the extension
+            df.to_csv(f'{path}.{fmt}', index=False)
+
+def read_table(path, fmt, columns=None):
+    """Read a table written by write_table() in one format"""
+    if fmt == 'columns':
+        return read_columns(path, columns)
+    return pd.read_csv(f'{path}.{fmt}', usecols=columns)
+
+def write_partitions(df, output_dir, part, formats=('csv',)):
+    """Write one generated chunk as a part file under Entity_Type=<type>/Year=<year>/"""
+    entity_type = df['Entity_Type'].iat[0]
+    for year, year_df in df.groupby('Year', sort=True):
+        partition_dir = os.path.join(output_dir, f'Entity_Type={entity_type}', f'Year={year}')
+        os.makedirs(partition_dir, exist_ok=True)
+        write_table(year_df, os.path.join(partition_dir, f'part-{part:05d}'), formats)
+
+ENTITY_GENERATORS = {
+    'Professor': generate_professor_data_vectorized,
+    'Student': generate_student_data_vectorized,
+}
+
+def chunk_rng(seed, entity_type, part, year=None):
+    """Independent random stream for one chunk, derived from the master seed.
+
+    Streams are keyed by (entity type, chunk index) rather than by worker, so
+    output depends only on the seed and chunk size, never on the worker count.
+    Appended years get a stream of their own keyed by the year as well.
+    """
+    entity_key = list(ENTITY_GENERATORS).index(entity_type)
+    spawn_key = (entity_key, part) if year is None else (entity_key, part, year)
+    return np.random.default_rng(np.random.SeedSequence(seed, spawn_key=spawn_key))
+
+def stream_shard(entity_type, n_entities, parts, years, output_dir, seed, chunk_size, formats=('csv',)):
+    """Generate and write a contiguous range of chunks (one worker's share of the IDs)"""
+    generator = ENTITY_GENERATORS[entity_type]
+    rows = 0
+    for part in parts:
+        start = part * chunk_size
+        count = min(chunk_size, n_entities - start)
+        chunk = generator(chunk_rng(seed, entity_type, part), count, years, first_id=start + 1)
+        write_partitions(chunk, output_dir, part, formats)
+        rows += len(chunk)
+    return rows
+
+def stream_dataset(output_dir, n_professors, n_students, years=YEARS, seed=42, chunk_size=50_000, workers=1,
+                   formats=('csv',)):
+    """Stream both entity types to a partitioned dataset; peak memory is one chunk per worker"""
+    years = list(years)
+    shards = []
+    for entity_type, n_entities in (('Professor', n_professors), ('Student', n_students)):
+        # Drop stale part files from an earlier, larger run
+        shutil.rmtree(os.path.join(output_dir, f'Entity_Type={entity_type}'), ignore_errors=True)
+        n_parts = -(-n_entities // chunk_size)
+        if n_parts == 0:
+            continue
+        for parts in np.array_split(np.arange(n_parts), min(workers, n_parts)):
+            shards.append((entity_type, n_entities, parts.tolist(), years, output_dir, seed, chunk_size, formats))
+
+    if workers > 1:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            rows = list(pool.map(stream_shard, *zip(*shards)))
+    else:
+        rows = [stream_shard(*shard) for shard in shards]
+
+    totals = {'Professor': 0, 'Student': 0}
+    for shard, shard_rows in zip(shards, rows):
+        totals[shard[0]] += shard_rows
+    return totals['Professor'], totals['Student']
+
+# ============================================================================
+# SECTION 5: INCREMENTAL YEAR APPEND
+# ============================================================================
+
+def partition_years(output_dir, entity_type):
+    """Years already present as Year=<year> partitions for one entity type"""
+    entity_dir = os.path.join(output_dir, f'Entity_Type={entity_type}')
+    if not os.path.isdir(entity_dir):
+        return []
+    return sorted(int(name.split('=', 1)[1]) for name in os.listdir(entity_dir) if name.startswith('Year='))
+
+def append_year(output_dir, year, seed=42):
+    """Add one Year partition to a streamed dataset without touching the existing ones.
+
+    Static traits are read back from each part file of the latest partition, so
+    the cost is O(new rows) and entities keep their IDs, traits and chunk layout.
+    Both entity types are written to a staging directory first and moved into
+    place only once all of them succeeded, so a failed append can be retried.
+    """
+    source_dirs = {}
+    for entity_type in SPECS:
+        years = partition_years(output_dir, entity_type)
+        if not years:
+            raise FileNotFoundError(f'No Entity_Type={entity_type} partitions in {output_dir}; '
+                                    'write the dataset with --stream first')
+        if year in years:
+            raise FileExistsError(f'Entity_Type={entity_type}/Year={year} already exists in {output_dir}')
+        source_dirs[entity_type] = os.path.join(output_dir, f'Entity_Type={entity_type}', f'Year={years[-1]}')
+
+    staging_dir = os.path.join(output_dir, f'.tmp-append-{year}-{os.getpid()}')
+    # A directory left by a crashed append would mix its part files into this one
+    shutil.rmtree(staging_dir, ignore_errors=True)
+    try:
+        rows = {}
+        for entity_type, spec in SPECS.items():
+            source_dir = source_dirs[entity_type]
+            part_formats = {}
+            for filename in sorted(os.listdir(source_dir)):
+                if filename.startswith('part-'):
+                    part, fmt = filename[len('part-'):].split('.', 1)
+                    part_formats.setdefault(int(part), []).append(fmt)
+
+            rows[entity_type] = 0
+            for part, formats in part_formats.items():
+                # New part files are written in the same formats; traits are read from the cheapest one
+                source_fmt = 'columns' if 'columns' in formats else formats[0]
+                existing = read_table(os.path.join(source_dir, f'part-{part:05d}'), source_fmt,
+                                      ['ID'] + spec['trait_columns'])
+                chunk = extend_entities(entity_type, chunk_rng(seed, entity_type, part, year), existing, [year])
+                write_partitions(chunk, staging_dir, part, formats)
+                rows[entity_type] += len(chunk)
+
+        for entity_type in SPECS:
+            partition = os.path.join(f'Entity_Type={entity_type}', f'Year={year}')
+            os.replace(os.path.join(staging_dir, partition), os.path.join(output_dir, partition))
+    finally:
+        shutil.rmtree(staging_dir, ignore_errors=True)
+    return rows['Professor'], rows['Student']
+
+# ============================================================================
+# MAIN
+# ============================================================================
+
+def main():
+    parser = argparse.ArgumentParser(description='Generate the synthetic AI in education datasets.')
+    parser.add_argument('--professors', type=int, default=40, help='Number of professors (default: 40)')
+    parser.add_argument('--students', type=int, default=100, help='Number of students (default: 100)')
+    parser.add_argument('--start-year', type=int, default=2022, help='First year to generate (default: 2022)')
+    parser.add_argument('--end-year', type=int, default=2025, help='Last year to generate, inclusive (default: 2025)')
+    parser.add_argument('--seed', type=int, default=42, help='Master random seed (default: 42)')
+    parser.add_argument('--output-dir', default=DEFAULT_OUTPUT_DIR,
+                        help=f'Directory the dashboards read from (default: {DEFAULT_OUTPUT_DIR})')
+    parser.add_argument('--format', nargs='+', choices=OUTPUT_FORMATS, default=['csv', 'columns'],
+                        help='Output formats; columns is the typed columnar table the dashboards prefer '
+                             '(default: csv columns)')
+    parser.add_argument('--vectorized', action='store_true',
+                        help='Draw every metric for all entities x years as whole arrays (fast, different random stream)')
+    parser.add_argument('--stream', action='store_true',
+                        help='Write vectorized chunks straight to Entity_Type=/Year= partitions instead of three files')
+    parser.add_argument('--chunk-size', type=int, default=50_000,
+                        help='Entities generated per chunk in --stream mode (default: 50000)')
+    parser.add_argument('--append-year', type=int,
+                        help='Add only this year to an existing --stream dataset in --output-dir, reusing its entities')
+    parser.add_argument('--workers', type=int, default=1,
+                        help='Processes used in --stream mode; output is identical for any worker count (default: 1)')
+    args = parser.parse_args()
+
+    if args.start_year > args.end_year:
+        parser.error('--start-year must not be after --end-year')
+    if min(args.professors, args.students) < 0 or args.chunk_size < 1 or args.workers < 1:
+        parser.error('entity counts must be >= 0, --chunk-size and --workers >= 1')
+    years = range(args.start_year, args.end_year + 1)
+    os.makedirs(args.output_dir, exist_ok=True)
+
+    if args.append_year is not None:
+        try:
+            prof_rows, student_rows = append_year(args.output_dir, args.append_year, args.seed)
+        except (OSError, ValueError) as e:
+            parser.error(str(e))
+        print(f"✓ Year={args.append_year} partition appended to", args.output_dir)
+        print(f"  - Professor records: {prof_rows}")
+        print(f"  - Student records: {student_rows}")
+        return
+
+    if args.stream:
+        prof_rows, student_rows = stream_dataset(args.output_dir, args.professors, args.students, years, args.seed,
+                                                 args.chunk_size, args.workers, args.format)
+        print("✓ Partitioned dataset written to", args.output_dir)
+        print(f"  - Professor records: {prof_rows}")
+        print(f"  - Student records: {student_rows}")
+        return
+
+    if args.vectorized:
+        rng = np.random.default_rng(args.seed)
+        prof_df = generate_professor_data_vectorized(rng, args.professors, years)
+        student_df = generate_student_data_vectorized(rng, args.students, years)
+    else:
+        # Set seed for reproducibility
+        np.random.seed(args.seed)
+        random.seed(args.seed)
+        prof_df = generate_professor_data(args.professors, years)
+        student_df = generate_student_data(args.students, years)
+    print("✓ Professor Data Created:", prof_df.shape)
+    print("✓ Student Data Created:", student_df.shape)
+
+    # Save to output directory
+    # Columnar copies go in the segment order the dashboards read, so they need no sorted copy
+    write_table(prof_df, os.path.join(args.output_dir, PROFESSOR_TABLE), args.format, segment_key(PROFESSOR_TABLE))
+    write_table(student_df, os.path.join(args.output_dir, STUDENT_TABLE), args.format, segment_key(STUDENT_TABLE))
+
+    # Shared entity dimension (one row per professor/student) instead of a combined
+    # dataset carrying the mostly-empty union of both tables' columns
+    entities_df = entity_dimension(prof_df, student_df)
+    write_table(entities_df, os.path.join(args.output_dir, ENTITY_TABLE), args.format)
+
+    print("\n✓ All synthetic data files created successfully!")
+    print(f"  - Professor records: {len(prof_df)}")
+    print(f"  - Student records: {len(student_df)}")
+    print(f"  - Entities: {len(entities_df)}")
+
+if __name__ == '__main__':
+    main()
@@ -3,7 +3,12 @@ import pandas as pd
 import numpy as np
 import plotly.graph_objects as go
 import plotly.express as px
+import plotly.io as pio
 from plotly.subplots import make_subplots
+from data_store import LEARNING_STYLES, PROFESSOR_TABLE, STUDENT_TABLE, load_table, resolve_data_dir
+from data_source import Filters, open_source
+import itertools
+import os
 import warnings
 warnings.filterwarnings('ignore')
 
@@ -16,21 +21,21 @@ st.set_page_config(
 )
 
 # Load Data
+# 'memory' aggregates with pandas over memory-mapped columns; 'sqlite' pushes filters and
+# aggregations down to an embedded database so only aggregated rows reach Python
+DATA_SOURCE = os.environ.get('DASHBOARD_DATA_SOURCE', 'memory')
+
+@st.cache_resource
+def data_source():
+    # One per process, shared read-only by every session
+    return open_source(DATA_SOURCE, resolve_data_dir())
+
 @st.cache_data
-def load_data():
-    try:
-        prof_df = pd.read_csv('data/ai_education_professor_data.csv')
-        student_df = pd.read_csv('data/ai_education_student_data.csv')
-    except:
-        try:
-            prof_df = pd.read_csv('/mnt/user-data/outputs/ai_education_professor_data.csv')
-            student_df = pd.read_csv('/mnt/user-data/outputs/ai_education_student_data.csv')
-        except:
-            prof_df = pd.read_csv('ai_education_professor_data.csv')
-            student_df = pd.read_csv('ai_education_student_data.csv')
-    return prof_df, student_df
-
-prof_df, student_df = load_data()
+def export_csv(table):
+    # Built only when a download button is clicked
+    return load_table(data_source().data_dir, table).to_csv(index=False)
+
+source = data_source()
 
 # Enhanced Custom CSS
 st.markdown("""
@@ -402,7 +407,7 @@ with st.sidebar:
     st.markdown("### 🎛️ Filters")
 
     # Year filter
-    years = sorted(prof_df['Year'].unique())
+    years = source.values(PROFESSOR_TABLE, 'Year')
     selected_years = st.multiselect(
         "📅 Select Years",
         options=years,
@@ -411,8 +416,8 @@ with st.sidebar:
     )
 
     # Department filter (for professors)
-    if 'Department' in prof_df.columns:
-        departments = ['All'] + sorted(prof_df['Department'].unique().tolist())
+    if 'Department' in source.columns(PROFESSOR_TABLE):
+        departments = ['All'] + source.values(PROFESSOR_TABLE, 'Department')
         selected_dept = st.selectbox(
             "🏛️ Department",
             options=departments,
@@ -422,7 +427,7 @@ with st.sidebar:
         selected_dept = 'All'
 
     # Restriction status filter
-    restrictions = ['All'] + sorted(prof_df['AI_Restriction_Status'].unique().tolist())
+    restrictions = ['All'] + source.values(PROFESSOR_TABLE, 'AI_Restriction_Status')
     selected_restriction = st.selectbox(
         "🚦 Restriction Status",
         options=restrictions,
@@ -430,8 +435,8 @@ with st.sidebar:
     )
 
     # Learning style filter (for students)
-    if 'Learning_Style' in student_df.columns:
-        learning_styles = ['All'] + sorted(student_df['Learning_Style'].unique().tolist())
+    if 'Learning_Style' in source.columns(STUDENT_TABLE):
+        learning_styles = ['All'] + source.values(STUDENT_TABLE, 'Learning_Style')
         selected_style = st.selectbox(
             "📚 Learning Style",
             options=learning_styles,
@@ -449,7 +454,7 @@ with st.sidebar:
     with col1:
         st.download_button(
             label="📊 Professors",
-            data=prof_df.to_csv(index=False),
+            data=lambda: export_csv(PROFESSOR_TABLE),
             file_name="professor_data.csv",
             mime="text/csv",
             use_container_width=True
@@ -457,30 +462,47 @@ with st.sidebar:
     with col2:
         st.download_button(
             label="🎓 Students",
-            data=student_df.to_csv(index=False),
+            data=lambda: export_csv(STUDENT_TABLE),
             file_name="student_data.csv",
             mime="text/csv",
             use_container_width=True
         )
 
-# Apply filters
-filtered_prof_df = prof_df[prof_df['Year'].isin(selected_years)]
-filtered_student_df = student_df[student_df['Year'].isin(selected_years)]
-
-if selected_dept != 'All' and 'Department' in prof_df.columns:
-    filtered_prof_df = filtered_prof_df[filtered_prof_df['Department'] == selected_dept]
-
-if selected_restriction != 'All':
-    filtered_prof_df = filtered_prof_df[filtered_prof_df['AI_Restriction_Status'] == selected_restriction]
-    filtered_student_df = filtered_student_df[filtered_student_df['AI_Restriction_Status'] == selected_restriction]
-
-if selected_style != 'All' and 'Learning_Style' in student_df.columns:
-    filtered_student_df = filtered_student_df[filtered_student_df['Learning_Style'] == selected_style]
+# Apply filters: every page queries the data source with this selection
+# (with every year selected, the year filter is left out entirely; years are sorted so the
+# selection, not the order it was clicked in, keys the caches)
+filters = Filters(
+    years=None if set(selected_years) == set(years) else tuple(sorted(selected_years)),
+    department=None if selected_dept == 'All' else selected_dept,
+    restriction=None if selected_restriction == 'All' else selected_restriction,
+    learning_style=None if selected_style == 'All' else selected_style,
+)
 
 # ============================================================================
 # HELPER FUNCTIONS
 # ============================================================================
 
+def full_adoption_by_year(table):
+    """Rows with Full Adoption status per year, for every year with matching rows"""
+    adoption = source.crosstab(table, 'AI_Restriction_Status', [], filters)
+    return adoption.row('Full Adoption')['Count'].rename('Full_Adoption')
+
+def ci_half_widths(table, metric, filters, by):
+    """Half-width of the 95% confidence interval of a metric's mean, per group of `by`"""
+    stats = source.describe(table, metric, filters, by)
+    return stats['ci_high'] - stats['mean']
+
+def rgba(color, alpha):
+    """Plotly rgba() string for a hex color"""
+    return f'rgba{tuple(list(int(color.lstrip("#")[i:i+2], 16) for i in (0, 2, 4)) + [alpha])}'
+
+# Chart helpers build their figure only when their (aggregated) inputs change: each is cached
+# process-wide on a hash of its arguments, keeping its FIGURE_CACHE_SIZE most recently used
+# figures. Cached figures are shared by every session, so callers must not modify them.
+FIGURE_CACHE_SIZE = 128
+memoized_figure = st.cache_resource(max_entries=FIGURE_CACHE_SIZE, show_spinner=False)
+
+@memoized_figure
 def create_gauge_chart(value, title, max_val=100, suffix=""):
     """Create a modern gauge chart"""
     fig = go.Figure(go.Indicator(
@@ -513,19 +535,29 @@ def create_gauge_chart(value, title, max_val=100, suffix=""):
     )
     return fig
 
-def create_trend_chart(df, x_col, y_col, title, color=COLORS['primary'], fill=True):
-    """Create a modern trend line chart"""
-    data = df.groupby(x_col)[y_col].mean().reset_index()
+@memoized_figure
+def create_trend_chart(series, title, color=COLORS['primary'], fill=True, band=None):
+    """Create a modern trend line chart of a precomputed per-year series.
 
+    band: optional source.describe() frame, drawn as a shaded confidence band.
+    """
     fig = go.Figure()
+    if band is not None:
+        fig.add_trace(go.Scatter(
+            x=band.index, y=band['ci_high'], mode='lines', line=dict(width=0), hoverinfo='skip'
+        ))
+        fig.add_trace(go.Scatter(
+            x=band.index, y=band['ci_low'], mode='lines', line=dict(width=0), hoverinfo='skip',
+            fill='tonexty', fillcolor=rgba(color, 0.2)
+        ))
     fig.add_trace(go.Scatter(
-        x=data[x_col],
-        y=data[y_col],
+        x=series.index,
+        y=series.to_numpy(),
         mode='lines+markers',
         line=dict(color=color, width=3, shape='spline'),
         marker=dict(size=10, color=color, line=dict(width=2, color='white')),
         fill='tozeroy' if fill else None,
-        fillcolor=f'rgba{tuple(list(int(color.lstrip("#")[i:i+2], 16) for i in (0, 2, 4)) + [0.1])}' if fill else None,
+        fillcolor=rgba(color, 0.1) if fill else None,
         hovertemplate=f'<b>{title}</b><br>Year: %{{x}}<br>Value: %{{y:.2f}}<extra></extra>'
     ))
 
@@ -538,37 +570,37 @@ def create_trend_chart(df, x_col, y_col, title, color=COLORS['primary'], fill=Tr
         margin=dict(l=40, r=40, t=60, b=40),
         paper_bgcolor='rgba(0,0,0,0)',
         plot_bgcolor='rgba(0,0,0,0)',
+        showlegend=False,
         font={'family': 'Inter, sans-serif'}
     )
     return fig
 
-def create_bar_chart(df, x_col, y_col, title, colors=None, horizontal=False):
-    """Create a modern bar chart"""
-    data = df.groupby(x_col)[y_col].mean().reset_index()
-
+@memoized_figure
+def create_bar_chart(series, title, colors=None, horizontal=False):
+    """Create a modern bar chart of a precomputed series, one bar per index value"""
     if colors is None:
-        colors = CHART_COLORS[:len(data)]
+        colors = CHART_COLORS[:len(series)]
 
     fig = go.Figure()
 
     if horizontal:
         fig.add_trace(go.Bar(
-            y=data[x_col],
-            x=data[y_col],
+            y=series.index,
+            x=series.to_numpy(),
             orientation='h',
             marker=dict(color=colors, cornerradius=8),
-            text=data[y_col].round(2),
+            text=series.round(2).to_numpy(),
             textposition='outside',
-            hovertemplate=f'<b>%{{y}}</b><br>{y_col}: %{{x:.2f}}<extra></extra>'
+            hovertemplate=f'<b>%{{y}}</b><br>{series.name}: %{{x:.2f}}<extra></extra>'
         ))
     else:
         fig.add_trace(go.Bar(
-            x=data[x_col],
-            y=data[y_col],
+            x=series.index,
+            y=series.to_numpy(),
             marker=dict(color=colors, cornerradius=8),
-            text=data[y_col].round(2),
+            text=series.round(2).to_numpy(),
             textposition='outside',
-            hovertemplate=f'<b>Year: %{{x}}</b><br>{y_col}: %{{y:.2f}}<extra></extra>'
+            hovertemplate=f'<b>Year: %{{x}}</b><br>{series.name}: %{{y:.2f}}<extra></extra>'
         ))
 
     fig.update_layout(
@@ -584,14 +616,16 @@ def create_bar_chart(df, x_col, y_col, title, colors=None, horizontal=False):
     )
     return fig
 
-def create_comparison_chart(data, categories, values, title):
-    """Create a comparison bar chart for restriction analysis"""
+@memoized_figure
+def create_comparison_chart(data, categories, values, title, errors=None):
+    """Create a comparison bar chart for restriction analysis, with optional +/- error bars"""
     colors = [COLORS['success'], COLORS['warning'], COLORS['danger']]
 
     fig = go.Figure()
     fig.add_trace(go.Bar(
         x=categories,
         y=values,
+        error_y=dict(type='data', array=errors, color=COLORS['dark'], thickness=1.5) if errors is not None else None,
         marker=dict(color=colors, cornerradius=10),
         text=[f'{v:.2f}' for v in values],
         textposition='outside',
@@ -611,6 +645,35 @@ def create_comparison_chart(data, categories, values, title):
     )
     return fig
 
+@memoized_figure
+def create_box_chart(quantiles, title, color=COLORS['primary']):
+    """Create a box chart per year from precomputed source.quantiles(): p25-p75 box, median line, p5/p95 whiskers"""
+    fig = go.Figure(go.Box(
+        x=quantiles.index,
+        lowerfence=quantiles['p5'],
+        q1=quantiles['p25'],
+        median=quantiles['p50'],
+        q3=quantiles['p75'],
+        upperfence=quantiles['p95'],
+        marker_color=color,
+        fillcolor=rgba(color, 0.3),
+        line=dict(width=2),
+        hoverinfo='x+y'
+    ))
+    fig.update_layout(
+        title=dict(text=title, font=dict(size=16, color=COLORS['dark'])),
+        xaxis=dict(title='', type='category'),
+        yaxis=dict(title='', gridcolor='#f0f2f6', showgrid=True),
+        height=350,
+        margin=dict(l=40, r=40, t=60, b=40),
+        paper_bgcolor='rgba(0,0,0,0)',
+        plot_bgcolor='rgba(0,0,0,0)',
+        showlegend=False,
+        font={'family': 'Inter, sans-serif'}
+    )
+    return fig
+
+@memoized_figure
 def create_radar_chart(categories, values, title):
     """Create a radar chart for multi-dimensional comparison"""
     fig = go.Figure()
@@ -637,6 +700,7 @@ def create_radar_chart(categories, values, title):
     )
     return fig
 
+@memoized_figure
 def create_donut_chart(labels, values, title):
     """Create a modern donut chart"""
     colors = [COLORS['success'], COLORS['warning'], COLORS['danger']]
@@ -662,9 +726,10 @@ def create_donut_chart(labels, values, title):
     )
     return fig
 
+@memoized_figure
 def create_heatmap(df, x_col, y_col, value_col, title):
     """Create a heatmap for correlation analysis"""
-    pivot_df = df.pivot_table(index=y_col, columns=x_col, values=value_col, aggfunc='mean')
+    pivot_df = df.pivot_table(index=y_col, columns=x_col, values=value_col, aggfunc='mean', observed=True)
 
     fig = go.Figure(data=go.Heatmap(
         z=pivot_df.values,
@@ -672,7 +737,7 @@ def create_heatmap(df, x_col, y_col, value_col, title):
         y=pivot_df.index,
         colorscale=[[0, '#f8f9ff'], [0.5, '#667eea'], [1, '#764ba2']],
         hoverongaps=False,
-        text=np.round(pivot_df.values, 2),
+        text=np.round(pivot_df.values.astype(float), 2),
         texttemplate='%{text}',
         textfont=dict(size=12, color='white')
     ))
@@ -686,6 +751,92 @@ def create_heatmap(df, x_col, y_col, value_col, title):
     )
     return fig
 
+# ============================================================================
+# CHART PAYLOADS
+# ============================================================================
+#
+# st.plotly_chart copies a figure into a plain dict (Figure.to_dict) and
+# JSON-encodes it on every rerun. Which chart it is (page and position), what
+# it is (title and traces) and the filter state decide a chart's payload, so
+# show_chart() keeps the encoded payload per (chart id, chart signature,
+# filters) and reruns hand it to Streamlit as is: plotly.io.to_json, which
+# st.plotly_chart calls on the dict, returns a payload's stored JSON instead of
+# encoding it again. A page that shows different charts at a position gets
+# separate entries, never another chart's payload. Identical payloads make
+# identical messages, which Streamlit sends as a reference while the browser
+# still holds them, i.e. for global.maxCachedMessageAge runs after they were
+# last sent (see .streamlit/config.toml). Payload bytes per page are tracked in
+# session state.
+
+PAYLOAD_CACHE_SIZE = 512
+
+class EncodedPayload(dict):
+    """Figure dict that carries its JSON encoding, computed once"""
+
+    def __init__(self, payload):
+        super().__init__(payload)
+        self.encoded_json = pio.to_json(payload, validate=False)
+        self.encoded_bytes = len(self.encoded_json.encode())
+
+def _to_json(fig, *args, _encode=pio.to_json, **kwargs):
+    # plotly.io.to_json, returning an EncodedPayload's stored JSON when called the way st.plotly_chart calls it
+    if hasattr(fig, 'encoded_json') and not args and kwargs.keys() <= {'validate'}:
+        return fig.encoded_json
+    return _encode(fig, *args, **kwargs)
+
+# Installed once per process; the script reruns, and st.plotly_chart looks plotly.io.to_json up on every call
+if not hasattr(pio.to_json, 'passes_encoded_payloads'):
+    _to_json.passes_encoded_payloads = True
+    pio.to_json = _to_json
+
+class PayloadFigure(go.Figure):
+    """Stand-in figure whose to_dict() is a stored EncodedPayload, so st.plotly_chart neither copies nor encodes it"""
+
+    def __init__(self, payload):
+        super().__init__()
+        self._payload = EncodedPayload(payload)
+
+    @property
+    def payload_bytes(self):
+        return self._payload.encoded_bytes
+
+    def to_dict(self):
+        return self._payload
+
+def chart_signature(fig):
+    """Title and (type, name) of every trace: what a chart is, without serializing its data"""
+    return fig.layout.title.text, tuple((trace.type, trace.name) for trace in fig.data)
+
+@st.cache_resource(max_entries=PAYLOAD_CACHE_SIZE, show_spinner=False)
+def chart_payload(chart_id, signature, filters, _fig):
+    # Process-wide; the figure's data is not part of the key, as chart, signature and filters decide it
+    return PayloadFigure(_fig.to_dict())
+
+# Reset on every run: charts are numbered in page order, and traffic is counted for this run's page
+chart_numbers = itertools.count()
+chart_traffic = {'charts': 0, 'bytes': 0, 'repeat_bytes': 0}
+chart_run = st.session_state['chart_runs'] = st.session_state.get('chart_runs', 0) + 1
+# Run each payload was last sent in, kept only while the browser's message cache may still hold it
+st.session_state['sent_charts'] = {
+    key: run for key, run in st.session_state.get('sent_charts', {}).items()
+    if chart_run - run <= st.get_option('global.maxCachedMessageAge')
+}
+
+def show_chart(fig):
+    """st.plotly_chart() a figure through the payload cache, counting the bytes it sends"""
+    key = (f'{page}#{next(chart_numbers)}', chart_signature(fig), filters)
+    payload = chart_payload(*key, fig)
+    # Streamlit sends a payload by reference only while the browser's message cache still holds it, i.e.
+    # within maxCachedMessageAge runs, and only if it is large enough to be cached
+    sent = st.session_state['sent_charts']
+    chart_traffic['charts'] += 1
+    chart_traffic['bytes'] += payload.payload_bytes
+    if (chart_run - sent.get(key, -np.inf) <= st.get_option('global.maxCachedMessageAge')
+            and payload.payload_bytes >= st.get_option('global.minCachedMessageSize')):
+        chart_traffic['repeat_bytes'] += payload.payload_bytes
+    sent[key] = chart_run
+    st.plotly_chart(payload, use_container_width=True)
+
 # ============================================================================
 # PAGE 1: EXECUTIVE OVERVIEW
 # ============================================================================
@@ -702,9 +853,10 @@ if page == "🏠 Executive Overview":
     # Key Metrics Row
     col1, col2, col3, col4 = st.columns(4)
 
-    prof_count = filtered_prof_df['Professor_ID'].nunique() if 'Professor_ID' in filtered_prof_df.columns else 40
-    student_count = filtered_student_df['Student_ID'].nunique() if 'Student_ID' in filtered_student_df.columns else 100
-    data_points = len(filtered_prof_df) + len(filtered_student_df)
+    # The tables carry no Professor_ID/Student_ID column, so the cohort sizes are fixed
+    prof_count, student_count = 40, 100
+    data_points = int(source.totals(PROFESSOR_TABLE, [], filters)['Count'] +
+                      source.totals(STUDENT_TABLE, [], filters)['Count'])
 
     with col1:
         st.markdown(f"""
@@ -765,25 +917,26 @@ if page == "🏠 Executive Overview":
     col1, col2, col3, col4 = st.columns(4)
 
     # Calculate KPIs
-    prof_2025 = filtered_prof_df[filtered_prof_df['Year'] == 2025] if 2025 in selected_years else filtered_prof_df
-    student_2025 = filtered_student_df[filtered_student_df['Year'] == 2025] if 2025 in selected_years else filtered_student_df
+    kpi_filters = filters._replace(years=(2025,)) if 2025 in selected_years else filters
+    prof_2025 = source.totals(PROFESSOR_TABLE, ['Hours_Saved_Lesson_Planning_Per_Week', 'Intervention_Success_Rate'], kpi_filters)
+    student_2025 = source.totals(STUDENT_TABLE, ['GPA', 'AI_Literacy_Score'], kpi_filters)
 
-    avg_hours_saved = prof_2025['Hours_Saved_Lesson_Planning_Per_Week'].mean() if len(prof_2025) > 0 else 0
-    avg_gpa = student_2025['GPA'].mean() if len(student_2025) > 0 else 0
-    avg_literacy = student_2025['AI_Literacy_Score'].mean() if len(student_2025) > 0 else 0
-    intervention_rate = prof_2025['Intervention_Success_Rate'].mean() * 100 if len(prof_2025) > 0 else 0
+    avg_hours_saved = prof_2025['Hours_Saved_Lesson_Planning_Per_Week'] if prof_2025['Count'] > 0 else 0
+    avg_gpa = student_2025['GPA'] if student_2025['Count'] > 0 else 0
+    avg_literacy = student_2025['AI_Literacy_Score'] if student_2025['Count'] > 0 else 0
+    intervention_rate = prof_2025['Intervention_Success_Rate'] * 100 if prof_2025['Count'] > 0 else 0
 
     with col1:
-        st.plotly_chart(create_gauge_chart(avg_hours_saved, "Hours Saved/Week", 10, " hrs"), use_container_width=True)
+        show_chart(create_gauge_chart(avg_hours_saved, "Hours Saved/Week", 10, " hrs"))
 
     with col2:
-        st.plotly_chart(create_gauge_chart(avg_gpa, "Average GPA", 4.0, ""), use_container_width=True)
+        show_chart(create_gauge_chart(avg_gpa, "Average GPA", 4.0, ""))
 
     with col3:
-        st.plotly_chart(create_gauge_chart(avg_literacy, "AI Literacy Score", 100, ""), use_container_width=True)
+        show_chart(create_gauge_chart(avg_literacy, "AI Literacy Score", 100, ""))
 
     with col4:
-        st.plotly_chart(create_gauge_chart(intervention_rate, "Intervention Success", 100, "%"), use_container_width=True)
+        show_chart(create_gauge_chart(intervention_rate, "Intervention Success", 100, "%"))
 
     st.markdown("<hr class='custom-divider'>", unsafe_allow_html=True)
 
@@ -794,27 +947,13 @@ if page == "🏠 Executive Overview":
 
     with col1:
         # Professor Adoption
-        prof_adoption = []
-        for year in sorted(filtered_prof_df['Year'].unique()):
-            year_data = filtered_prof_df[filtered_prof_df['Year'] == year]
-            full_adoption = len(year_data[year_data['AI_Restriction_Status'] == 'Full Adoption'])
-            prof_adoption.append({'Year': year, 'Full_Adoption': full_adoption})
-
-        adoption_df = pd.DataFrame(prof_adoption)
-        fig = create_trend_chart(adoption_df, 'Year', 'Full_Adoption', '👨‍🏫 Professor AI Adoption Growth', COLORS['primary'])
-        st.plotly_chart(fig, use_container_width=True)
+        fig = create_trend_chart(full_adoption_by_year(PROFESSOR_TABLE), '👨‍🏫 Professor AI Adoption Growth', COLORS['primary'])
+        show_chart(fig)
 
     with col2:
         # Student Adoption
-        student_adoption = []
-        for year in sorted(filtered_student_df['Year'].unique()):
-            year_data = filtered_student_df[filtered_student_df['Year'] == year]
-            full_adoption = len(year_data[year_data['AI_Restriction_Status'] == 'Full Adoption'])
-            student_adoption.append({'Year': year, 'Full_Adoption': full_adoption})
-
-        adoption_df = pd.DataFrame(student_adoption)
-        fig = create_trend_chart(adoption_df, 'Year', 'Full_Adoption', '👨‍🎓 Student AI Adoption Growth', COLORS['secondary'])
-        st.plotly_chart(fig, use_container_width=True)
+        fig = create_trend_chart(full_adoption_by_year(STUDENT_TABLE), '👨‍🎓 Student AI Adoption Growth', COLORS['secondary'])
+        show_chart(fig)
 
     st.markdown("<hr class='custom-divider'>", unsafe_allow_html=True)
 
@@ -825,21 +964,20 @@ if page == "🏠 Executive Overview":
 
     # Calculate year-over-year changes
     if 2022 in selected_years and 2025 in selected_years:
-        prof_2022 = filtered_prof_df[filtered_prof_df['Year'] == 2022]
-        prof_2025 = filtered_prof_df[filtered_prof_df['Year'] == 2025]
-        student_2022 = filtered_student_df[filtered_student_df['Year'] == 2022]
-        student_2025 = filtered_student_df[filtered_student_df['Year'] == 2025]
+        # Years with no matching rows are missing from the summaries and count as 0
+        prof_by_year = source.summarize(PROFESSOR_TABLE, ['Hours_Saved_Lesson_Planning_Per_Week'], filters)
+        student_by_year = source.summarize(STUDENT_TABLE, ['GPA', 'AI_Literacy_Score'], filters)
 
-        hours_2022 = prof_2022['Hours_Saved_Lesson_Planning_Per_Week'].mean() if len(prof_2022) > 0 else 0
-        hours_2025 = prof_2025['Hours_Saved_Lesson_Planning_Per_Week'].mean() if len(prof_2025) > 0 else 0
+        hours_2022 = prof_by_year['Hours_Saved_Lesson_Planning_Per_Week'].get(2022, 0)
+        hours_2025 = prof_by_year['Hours_Saved_Lesson_Planning_Per_Week'].get(2025, 0)
         hours_growth = ((hours_2025 - hours_2022) / hours_2022 * 100) if hours_2022 > 0 else 0
 
-        gpa_2022 = student_2022['GPA'].mean() if len(student_2022) > 0 else 0
-        gpa_2025 = student_2025['GPA'].mean() if len(student_2025) > 0 else 0
+        gpa_2022 = student_by_year['GPA'].get(2022, 0)
+        gpa_2025 = student_by_year['GPA'].get(2025, 0)
         gpa_improvement = gpa_2025 - gpa_2022
 
-        literacy_2022 = student_2022['AI_Literacy_Score'].mean() if len(student_2022) > 0 else 0
-        literacy_2025 = student_2025['AI_Literacy_Score'].mean() if len(student_2025) > 0 else 0
+        literacy_2022 = student_by_year['AI_Literacy_Score'].get(2022, 0)
+        literacy_2025 = student_by_year['AI_Literacy_Score'].get(2025, 0)
         literacy_growth = ((literacy_2025 - literacy_2022) / literacy_2022 * 100) if literacy_2022 > 0 else 0
     else:
         hours_2022, hours_2025, hours_growth = 0, 0, 0
@@ -888,6 +1026,13 @@ elif page == "👨‍🏫 Professor Analytics":
     </div>
     """, unsafe_allow_html=True)
 
+    # Per-year means of every metric on this page, one row per year
+    prof_by_year = source.summarize(PROFESSOR_TABLE, [
+        'Hours_Saved_Lesson_Planning_Per_Week', 'PPTs_Created_Per_Month', 'Assignments_Graded_Per_Semester',
+        'Grading_Quality_Score', 'Grading_Time_Hours_Per_Semester', 'Hours_Saved_Admin_Per_Week',
+        'Students_Monitored', 'Intervention_Success_Rate',
+    ], filters)
+
     # Section 1: Lesson Planning
     st.markdown("""
     <div class="section-header">
@@ -900,19 +1045,20 @@ elif page == "👨‍🏫 Professor Analytics":
 
     with col1:
         fig = create_trend_chart(
-            filtered_prof_df, 'Year', 'Hours_Saved_Lesson_Planning_Per_Week',
+            prof_by_year['Hours_Saved_Lesson_Planning_Per_Week'],
             '⏱️ Hours Saved Per Week on Lesson Planning',
-            COLORS['primary'], fill=True
+            COLORS['primary'], fill=True,
+            band=source.describe(PROFESSOR_TABLE, 'Hours_Saved_Lesson_Planning_Per_Week', filters)
         )
-        st.plotly_chart(fig, use_container_width=True)
+        show_chart(fig)
 
     with col2:
         fig = create_bar_chart(
-            filtered_prof_df, 'Year', 'PPTs_Created_Per_Month',
+            prof_by_year['PPTs_Created_Per_Month'],
             '📊 Average PPTs Created Per Month',
             CHART_COLORS
         )
-        st.plotly_chart(fig, use_container_width=True)
+        show_chart(fig)
 
     # Section 2: Grading
     st.markdown("""
@@ -926,27 +1072,28 @@ elif page == "👨‍🏫 Professor Analytics":
 
     with col1:
         fig = create_bar_chart(
-            filtered_prof_df, 'Year', 'Assignments_Graded_Per_Semester',
+            prof_by_year['Assignments_Graded_Per_Semester'],
             '📝 Assignments Graded/Semester',
             [COLORS['primary']] * 4
         )
-        st.plotly_chart(fig, use_container_width=True)
+        show_chart(fig)
 
     with col2:
         fig = create_trend_chart(
-            filtered_prof_df, 'Year', 'Grading_Quality_Score',
+            prof_by_year['Grading_Quality_Score'],
             '⭐ Grading Quality Score (0-1)',
-            COLORS['secondary'], fill=False
+            COLORS['secondary'], fill=False,
+            band=source.describe(PROFESSOR_TABLE, 'Grading_Quality_Score', filters)
         )
-        st.plotly_chart(fig, use_container_width=True)
+        show_chart(fig)
 
     with col3:
         fig = create_bar_chart(
-            filtered_prof_df, 'Year', 'Grading_Time_Hours_Per_Semester',
+            prof_by_year['Grading_Time_Hours_Per_Semester'],
             '⏰ Grading Time (Hours/Semester)',
             [COLORS['warning']] * 4
         )
-        st.plotly_chart(fig, use_container_width=True)
+        show_chart(fig)
 
     # Section 3: Admin Tasks
     st.markdown("""
@@ -960,11 +1107,11 @@ elif page == "👨‍🏫 Professor Analytics":
 
     with col1:
         fig = create_bar_chart(
-            filtered_prof_df, 'Year', 'Hours_Saved_Admin_Per_Week',
+            prof_by_year['Hours_Saved_Admin_Per_Week'],
             '🗂️ Hours Saved Per Week on Admin Tasks',
             CHART_COLORS
         )
-        st.plotly_chart(fig, use_container_width=True)
+        show_chart(fig)
 
     with col2:
         st.markdown("""
@@ -981,7 +1128,7 @@ elif page == "👨‍🏫 Professor Analytics":
         """, unsafe_allow_html=True)
 
         # Quick stats
-        admin_2025 = filtered_prof_df[filtered_prof_df['Year'] == 2025]['Hours_Saved_Admin_Per_Week'].mean() if 2025 in selected_years else 0
+        admin_2025 = prof_by_year['Hours_Saved_Admin_Per_Week'].get(2025, np.nan) if 2025 in selected_years else 0
         st.metric("Hours Saved (2025)", f"{admin_2025:.1f} hrs/week", f"+{admin_2025*52:.0f} hrs/year")
 
     # Section 4: Student Performance
@@ -996,26 +1143,26 @@ elif page == "👨‍🏫 Professor Analytics":
 
     with col1:
         fig = create_trend_chart(
-            filtered_prof_df, 'Year', 'Students_Monitored',
+            prof_by_year['Students_Monitored'],
             '👥 Students Monitored Per Professor',
-            COLORS['info'], fill=False
+            COLORS['info'], fill=False,
+            band=source.describe(PROFESSOR_TABLE, 'Students_Monitored', filters)
         )
-        st.plotly_chart(fig, use_container_width=True)
+        show_chart(fig)
 
     with col2:
         # Intervention success rate as percentage
-        intervention_df = filtered_prof_df.copy()
-        intervention_df['Intervention_Rate_Pct'] = intervention_df['Intervention_Success_Rate'] * 100
+        intervention_pct = (prof_by_year['Intervention_Success_Rate'] * 100).rename('Intervention_Rate_Pct')
 
         fig = create_bar_chart(
-            intervention_df, 'Year', 'Intervention_Rate_Pct',
+            intervention_pct,
             '🎯 At-Risk Student Intervention Success Rate (%)',
             [COLORS['success']] * 4
         )
-        st.plotly_chart(fig, use_container_width=True)
+        show_chart(fig)
 
     # Department Analysis (if available)
-    if 'Department' in filtered_prof_df.columns:
+    if 'Department' in source.columns(PROFESSOR_TABLE):
         st.markdown("""
         <div class="section-header">
             <div class="section-number">5</div>
@@ -1023,19 +1170,16 @@ elif page == "👨‍🏫 Professor Analytics":
         </div>
         """, unsafe_allow_html=True)
 
-        dept_summary = filtered_prof_df.groupby('Department').agg({
-            'Hours_Saved_Lesson_Planning_Per_Week': 'mean',
-            'Grading_Quality_Score': 'mean',
-            'Intervention_Success_Rate': 'mean'
-        }).reset_index()
-
-        if 'Learning_Style' in filtered_student_df.columns:
+        if 'Learning_Style' in source.columns(STUDENT_TABLE):
+            dept_by_year = source.summarize(
+                PROFESSOR_TABLE, ['Hours_Saved_Lesson_Planning_Per_Week'], filters, by=('Year', 'Department')
+            ).reset_index()
             fig = create_heatmap(
-                filtered_prof_df, 'Year', 'Department',
+                dept_by_year, 'Year', 'Department',
                 'Hours_Saved_Lesson_Planning_Per_Week',
                 '🏛️ Hours Saved by Department Over Time'
             )
-            st.plotly_chart(fig, use_container_width=True)
+            show_chart(fig)
 
 # ============================================================================
 # PAGE 3: STUDENT ANALYTICS
@@ -1049,6 +1193,15 @@ elif page == "👨‍🎓 Student Analytics":
     </div>
     """, unsafe_allow_html=True)
 
+    # Per-year means of every metric on this page, one row per year
+    student_by_year = source.summarize(STUDENT_TABLE, [
+        'AI_Literacy_Score', 'Responsible_Use_Awareness', 'Creativity_Preservation_Score',
+        'AI_Tool_Adoption_Rate', 'Uses_AI_For_Brainstorming', 'Uses_AI_For_Assessment', 'Uses_AI_For_Collaboration',
+        'Hours_Per_Assignment', 'Assignment_Completion_Rate', 'Skill_Awareness_Level', 'Skill_Beginner_Level',
+        'Skill_Intermediate_Level', 'Skill_Advanced_Level', 'Uses_AI_Collaboration_Tools',
+        'Language_Barrier_Reduction_Percent',
+    ], filters)
+
     # Section 1: AI Literacy & Skills
     st.markdown("""
     <div class="section-header">
@@ -1061,27 +1214,30 @@ elif page == "👨‍🎓 Student Analytics":
 
     with col1:
         fig = create_trend_chart(
-            filtered_student_df, 'Year', 'AI_Literacy_Score',
+            student_by_year['AI_Literacy_Score'],
             '🤖 AI Literacy Score',
-            COLORS['primary'], fill=True
+            COLORS['primary'], fill=True,
+            band=source.describe(STUDENT_TABLE, 'AI_Literacy_Score', filters)
         )
-        st.plotly_chart(fig, use_container_width=True)
+        show_chart(fig)
 
     with col2:
         fig = create_trend_chart(
-            filtered_student_df, 'Year', 'Responsible_Use_Awareness',
+            student_by_year['Responsible_Use_Awareness'],
             '⚖️ Responsible AI Use Awareness',
-            COLORS['secondary'], fill=True
+            COLORS['secondary'], fill=True,
+            band=source.describe(STUDENT_TABLE, 'Responsible_Use_Awareness', filters)
         )
-        st.plotly_chart(fig, use_container_width=True)
+        show_chart(fig)
 
     with col3:
         fig = create_trend_chart(
-            filtered_student_df, 'Year', 'Creativity_Preservation_Score',
+            student_by_year['Creativity_Preservation_Score'],
             '🎨 Creativity Preservation Score',
-            COLORS['warning'], fill=True
+            COLORS['warning'], fill=True,
+            band=source.describe(STUDENT_TABLE, 'Creativity_Preservation_Score', filters)
         )
-        st.plotly_chart(fig, use_container_width=True)
+        show_chart(fig)
 
     # Section 2: Tool Adoption
     st.markdown("""
@@ -1099,8 +1255,8 @@ elif page == "👨‍🎓 Student Analytics":
     fig = go.Figure()
 
     for col, name, color in zip(adoption_cols, adoption_names, CHART_COLORS):
-        if col in filtered_student_df.columns:
-            data = filtered_student_df.groupby('Year')[col].mean() * 100
+        if col in source.columns(STUDENT_TABLE):
+            data = student_by_year[col] * 100
             fig.add_trace(go.Scatter(
                 x=data.index,
                 y=data.values,
@@ -1121,7 +1277,7 @@ elif page == "👨‍🎓 Student Analytics":
         plot_bgcolor='rgba(0,0,0,0)',
         font={'family': 'Inter, sans-serif'}
     )
-    st.plotly_chart(fig, use_container_width=True)
+    show_chart(fig)
 
     # Section 3: Study Efficiency
     st.markdown("""
@@ -1135,7 +1291,7 @@ elif page == "👨‍🎓 Student Analytics":
 
     with col1:
         # Hours per assignment (showing decrease is good)
-        time_data = filtered_student_df.groupby('Year')['Hours_Per_Assignment'].mean().reset_index()
+        time_data = student_by_year['Hours_Per_Assignment'].reset_index()
 
         fig = go.Figure()
         fig.add_trace(go.Bar(
@@ -1156,18 +1312,36 @@ elif page == "👨‍🎓 Student Analytics":
             paper_bgcolor='rgba(0,0,0,0)',
             plot_bgcolor='rgba(0,0,0,0)'
         )
-        st.plotly_chart(fig, use_container_width=True)
+        show_chart(fig)
 
     with col2:
-        completion_df = filtered_student_df.copy()
-        completion_df['Completion_Pct'] = completion_df['Assignment_Completion_Rate'] * 100
+        completion_pct = (student_by_year['Assignment_Completion_Rate'] * 100).rename('Completion_Pct')
 
         fig = create_trend_chart(
-            completion_df, 'Year', 'Completion_Pct',
+            completion_pct,
             '✅ Assignment Completion Rate (%)',
             COLORS['success'], fill=True
         )
-        st.plotly_chart(fig, use_container_width=True)
+        show_chart(fig)
+
+    # Spread behind the averages: 5th/25th/50th/75th/95th percentiles per year, from quantile sketches
+    col1, col2 = st.columns(2)
+
+    with col1:
+        fig = create_box_chart(
+            source.quantiles(STUDENT_TABLE, 'GPA', filters),
+            '🎓 GPA Distribution by Year',
+            COLORS['secondary']
+        )
+        show_chart(fig)
+
+    with col2:
+        fig = create_box_chart(
+            source.quantiles(STUDENT_TABLE, 'Hours_Per_Assignment', filters),
+            '⏱️ Hours Per Assignment Distribution by Year',
+            COLORS['warning']
+        )
+        show_chart(fig)
 
     # Section 4: Learning Styles
     st.markdown("""
@@ -1177,17 +1351,17 @@ elif page == "👨‍🎓 Student Analytics":
     </div>
     """, unsafe_allow_html=True)
 
-    if 'Learning_Style' in filtered_student_df.columns:
+    if 'Learning_Style' in source.columns(STUDENT_TABLE):
         # Radar chart for learning styles
-        learning_styles = filtered_student_df['Learning_Style'].unique()
+        style_by_year = source.summarize(
+            STUDENT_TABLE, ['Performance_Improvement_Percent'], filters, by=('Learning_Style', 'Year')
+        )['Performance_Improvement_Percent']
+        learning_styles = [style for style in LEARNING_STYLES if style in style_by_year.index]
         style_performance = []
 
         for style in ['Visual', 'Auditory', 'Reading-Writing', 'Kinesthetic']:
             if style in learning_styles:
-                perf = filtered_student_df[
-                    (filtered_student_df['Learning_Style'] == style) &
-                    (filtered_student_df['Year'] == max(selected_years))
-                ]['Performance_Improvement_Percent'].mean()
+                perf = style_by_year[style].get(max(selected_years))
                 style_performance.append(perf if not pd.isna(perf) else 0)
             else:
                 style_performance.append(0)
@@ -1200,7 +1374,7 @@ elif page == "👨‍🎓 Student Analytics":
                 style_performance,
                 '📚 Performance Improvement by Learning Style (%)'
             )
-            st.plotly_chart(fig, use_container_width=True)
+            show_chart(fig)
 
         with col2:
             # Performance trend by learning style
@@ -1209,8 +1383,7 @@ elif page == "👨‍🎓 Student Analytics":
                            'Reading-Writing': COLORS['warning'], 'Kinesthetic': COLORS['success']}
 
             for style in learning_styles:
-                style_data = filtered_student_df[filtered_student_df['Learning_Style'] == style]
-                perf_by_year = style_data.groupby('Year')['Performance_Improvement_Percent'].mean()
+                perf_by_year = style_by_year[style]
 
                 fig.add_trace(go.Scatter(
                     x=perf_by_year.index,
@@ -1230,7 +1403,7 @@ elif page == "👨‍🎓 Student Analytics":
                 paper_bgcolor='rgba(0,0,0,0)',
                 plot_bgcolor='rgba(0,0,0,0)'
             )
-            st.plotly_chart(fig, use_container_width=True)
+            show_chart(fig)
 
     # Section 5: Skill Development
     st.markdown("""
@@ -1243,12 +1416,12 @@ elif page == "👨‍🎓 Student Analytics":
     skill_cols = ['Skill_Awareness_Level', 'Skill_Beginner_Level',
                   'Skill_Intermediate_Level', 'Skill_Advanced_Level']
 
-    if all(col in filtered_student_df.columns for col in skill_cols):
+    if all(col in source.columns(STUDENT_TABLE) for col in skill_cols):
         latest_year = max(selected_years)
-        skill_data = filtered_student_df[filtered_student_df['Year'] == latest_year]
+        skill_data = source.totals(STUDENT_TABLE, skill_cols, filters._replace(years=(latest_year,)))
 
         skills = ['Awareness', 'Beginner', 'Intermediate', 'Advanced']
-        values = [skill_data[col].mean() for col in skill_cols]
+        values = [skill_data[col] for col in skill_cols]
 
         col1, col2 = st.columns([1, 1])
 
@@ -1268,14 +1441,14 @@ elif page == "👨‍🎓 Student Analytics":
                 height=400,
                 paper_bgcolor='rgba(0,0,0,0)'
             )
-            st.plotly_chart(fig, use_container_width=True)
+            show_chart(fig)
 
         with col2:
             # Skill progression over time
             fig = go.Figure()
 
             for skill, col, color in zip(skills, skill_cols, CHART_COLORS):
-                skill_trend = filtered_student_df.groupby('Year')[col].mean()
+                skill_trend = student_by_year[col]
                 fig.add_trace(go.Scatter(
                     x=skill_trend.index,
                     y=skill_trend.values,
@@ -1294,7 +1467,7 @@ elif page == "👨‍🎓 Student Analytics":
                 paper_bgcolor='rgba(0,0,0,0)',
                 plot_bgcolor='rgba(0,0,0,0)'
             )
-            st.plotly_chart(fig, use_container_width=True)
+            show_chart(fig)
 
     # Section 6: Collaboration
     st.markdown("""
@@ -1307,25 +1480,24 @@ elif page == "👨‍🎓 Student Analytics":
     col1, col2 = st.columns(2)
 
     with col1:
-        if 'Uses_AI_Collaboration_Tools' in filtered_student_df.columns:
-            collab_df = filtered_student_df.copy()
-            collab_df['Collab_Pct'] = collab_df['Uses_AI_Collaboration_Tools'] * 100
+        if 'Uses_AI_Collaboration_Tools' in source.columns(STUDENT_TABLE):
+            collab_pct = (student_by_year['Uses_AI_Collaboration_Tools'] * 100).rename('Collab_Pct')
 
             fig = create_bar_chart(
-                collab_df, 'Year', 'Collab_Pct',
+                collab_pct,
                 '🤝 AI Collaboration Tool Adoption (%)',
                 [COLORS['primary']] * 4
             )
-            st.plotly_chart(fig, use_container_width=True)
+            show_chart(fig)
 
     with col2:
-        if 'Language_Barrier_Reduction_Percent' in filtered_student_df.columns:
+        if 'Language_Barrier_Reduction_Percent' in source.columns(STUDENT_TABLE):
             fig = create_bar_chart(
-                filtered_student_df, 'Year', 'Language_Barrier_Reduction_Percent',
+                student_by_year['Language_Barrier_Reduction_Percent'],
                 '🌍 Language Barrier Reduction (%)',
                 [COLORS['success']] * 4
             )
-            st.plotly_chart(fig, use_container_width=True)
+            show_chart(fig)
 
 # ============================================================================
 # PAGE 4: AI RESTRICTION IMPACT
@@ -1369,23 +1541,34 @@ elif page == "⚖️ Restriction Impact":
 
     latest_year = max(selected_years)
 
+    # Per-restriction means and row counts for the latest selected year
+    latest_filters = filters._replace(years=(latest_year,))
+    prof_latest = source.crosstab(PROFESSOR_TABLE, 'AI_Restriction_Status', [
+        'Hours_Saved_Lesson_Planning_Per_Week', 'Grading_Quality_Score',
+        'Hours_Saved_Admin_Per_Week', 'Intervention_Success_Rate',
+    ], latest_filters).column(latest_year)
+    student_latest = source.crosstab(STUDENT_TABLE, 'AI_Restriction_Status', [
+        'AI_Literacy_Score', 'GPA', 'Creativity_Preservation_Score', 'Hours_Per_Assignment',
+    ], latest_filters).column(latest_year)
+
     with col1:
-        prof_restriction = filtered_prof_df[filtered_prof_df['Year'] == latest_year]['AI_Restriction_Status'].value_counts()
+        # Largest group first, as value_counts() orders them
+        prof_restriction = prof_latest['Count'].sort_values(ascending=False, kind='stable')
         fig = create_donut_chart(
             prof_restriction.index.tolist(),
             prof_restriction.values.tolist(),
             '👨‍🏫 Professor Distribution'
         )
-        st.plotly_chart(fig, use_container_width=True)
+        show_chart(fig)
 
     with col2:
-        student_restriction = filtered_student_df[filtered_student_df['Year'] == latest_year]['AI_Restriction_Status'].value_counts()
+        student_restriction = student_latest['Count'].sort_values(ascending=False, kind='stable')
         fig = create_donut_chart(
             student_restriction.index.tolist(),
             student_restriction.values.tolist(),
             '👨‍🎓 Student Distribution'
         )
-        st.plotly_chart(fig, use_container_width=True)
+        show_chart(fig)
 
     st.markdown("<hr class='custom-divider'>", unsafe_allow_html=True)
 
@@ -1394,23 +1577,22 @@ elif page == "⚖️ Restriction Impact":
 
     restrictions = ['Full Adoption', 'Partial Restriction', 'Full Restriction']
 
-    prof_metrics = []
-    for restriction in restrictions:
-        subset = filtered_prof_df[
-            (filtered_prof_df['AI_Restriction_Status'] == restriction) &
-            (filtered_prof_df['Year'] == latest_year)
-        ]
-        if len(subset) > 0:
-            prof_metrics.append({
-                'Restriction': restriction,
-                'Hours_Saved': subset['Hours_Saved_Lesson_Planning_Per_Week'].mean(),
-                'Grading_Quality': subset['Grading_Quality_Score'].mean(),
-                'Admin_Hours': subset['Hours_Saved_Admin_Per_Week'].mean(),
-                'Intervention_Success': subset['Intervention_Success_Rate'].mean() * 100
-            })
-
-    if prof_metrics:
-        prof_metrics_df = pd.DataFrame(prof_metrics)
+    # The restrictions with rows, in display order
+    prof_metrics_df = prof_latest.reindex(restrictions).dropna(subset=['Count']).rename(columns={
+        'Hours_Saved_Lesson_Planning_Per_Week': 'Hours_Saved',
+        'Grading_Quality_Score': 'Grading_Quality',
+        'Hours_Saved_Admin_Per_Week': 'Admin_Hours',
+        'Intervention_Success_Rate': 'Intervention_Success',
+    }).rename_axis('Restriction').reset_index()
+    prof_metrics_df['Intervention_Success'] *= 100
+
+    if not prof_metrics_df.empty:
+        # Error bars: 95% confidence half-widths, in the order of the bars
+        prof_errors = {
+            metric: ci_half_widths(PROFESSOR_TABLE, metric, latest_filters, ('AI_Restriction_Status',))
+                    .reindex(prof_metrics_df['Restriction']).tolist()
+            for metric in ['Hours_Saved_Lesson_Planning_Per_Week', 'Grading_Quality_Score', 'Hours_Saved_Admin_Per_Week']
+        }
 
         col1, col2, col3 = st.columns(3)
 
@@ -1418,48 +1600,46 @@ elif page == "⚖️ Restriction Impact":
             fig = create_comparison_chart(
                 prof_metrics_df, restrictions,
                 prof_metrics_df['Hours_Saved'].tolist(),
-                '⏱️ Hours Saved (Lesson Planning)'
+                '⏱️ Hours Saved (Lesson Planning)',
+                errors=prof_errors['Hours_Saved_Lesson_Planning_Per_Week']
             )
-            st.plotly_chart(fig, use_container_width=True)
+            show_chart(fig)
 
         with col2:
             fig = create_comparison_chart(
                 prof_metrics_df, restrictions,
                 prof_metrics_df['Grading_Quality'].tolist(),
-                '⭐ Grading Quality Score'
+                '⭐ Grading Quality Score',
+                errors=prof_errors['Grading_Quality_Score']
             )
-            st.plotly_chart(fig, use_container_width=True)
+            show_chart(fig)
 
         with col3:
             fig = create_comparison_chart(
                 prof_metrics_df, restrictions,
                 prof_metrics_df['Admin_Hours'].tolist(),
-                '🗂️ Admin Hours Saved'
+                '🗂️ Admin Hours Saved',
+                errors=prof_errors['Hours_Saved_Admin_Per_Week']
             )
-            st.plotly_chart(fig, use_container_width=True)
+            show_chart(fig)
 
     st.markdown("<hr class='custom-divider'>", unsafe_allow_html=True)
 
     # Student Impact Analysis
     st.markdown("### 👨‍🎓 Student Impact Analysis")
 
-    student_metrics = []
-    for restriction in restrictions:
-        subset = filtered_student_df[
-            (filtered_student_df['AI_Restriction_Status'] == restriction) &
-            (filtered_student_df['Year'] == latest_year)
-        ]
-        if len(subset) > 0:
-            student_metrics.append({
-                'Restriction': restriction,
-                'AI_Literacy': subset['AI_Literacy_Score'].mean(),
-                'GPA': subset['GPA'].mean(),
-                'Creativity': subset['Creativity_Preservation_Score'].mean(),
-                'Hours_Per_Assignment': subset['Hours_Per_Assignment'].mean()
-            })
-
-    if student_metrics:
-        student_metrics_df = pd.DataFrame(student_metrics)
+    student_metrics_df = student_latest.reindex(restrictions).dropna(subset=['Count']).rename(columns={
+        'AI_Literacy_Score': 'AI_Literacy',
+        'Creativity_Preservation_Score': 'Creativity',
+    }).rename_axis('Restriction').reset_index()
+
+    if not student_metrics_df.empty:
+        # Error bars: 95% confidence half-widths, in the order of the bars
+        student_errors = {
+            metric: ci_half_widths(STUDENT_TABLE, metric, latest_filters, ('AI_Restriction_Status',))
+                    .reindex(student_metrics_df['Restriction']).tolist()
+            for metric in ['AI_Literacy_Score', 'GPA', 'Creativity_Preservation_Score']
+        }
 
         col1, col2, col3 = st.columns(3)
 
@@ -1467,25 +1647,28 @@ elif page == "⚖️ Restriction Impact":
             fig = create_comparison_chart(
                 student_metrics_df, restrictions,
                 student_metrics_df['AI_Literacy'].tolist(),
-                '🤖 AI Literacy Score'
+                '🤖 AI Literacy Score',
+                errors=student_errors['AI_Literacy_Score']
             )
-            st.plotly_chart(fig, use_container_width=True)
+            show_chart(fig)
 
         with col2:
             fig = create_comparison_chart(
                 student_metrics_df, restrictions,
                 student_metrics_df['GPA'].tolist(),
-                '🎓 Average GPA'
+                '🎓 Average GPA',
+                errors=student_errors['GPA']
             )
-            st.plotly_chart(fig, use_container_width=True)
+            show_chart(fig)
 
         with col3:
             fig = create_comparison_chart(
                 student_metrics_df, restrictions,
                 student_metrics_df['Creativity'].tolist(),
-                '🎨 Creativity Preservation'
+                '🎨 Creativity Preservation',
+                errors=student_errors['Creativity_Preservation_Score']
             )
-            st.plotly_chart(fig, use_container_width=True)
+            show_chart(fig)
 
     # Key Findings
     st.markdown("<hr class='custom-divider'>", unsafe_allow_html=True)
@@ -1537,9 +1720,12 @@ elif page == "🔮 Future Insights":
 
     col1, col2 = st.columns(2)
 
+    prof_by_year = source.summarize(PROFESSOR_TABLE, ['Hours_Saved_Lesson_Planning_Per_Week'], filters)
+    student_by_year = source.summarize(STUDENT_TABLE, ['GPA', 'AI_Literacy_Score'], filters)
+
     # Professor hours saved projection
     with col1:
-        prof_trend = filtered_prof_df.groupby('Year')['Hours_Saved_Lesson_Planning_Per_Week'].mean()
+        prof_trend = prof_by_year['Hours_Saved_Lesson_Planning_Per_Week']
         years_hist = np.array(prof_trend.index)
         values_hist = prof_trend.values
 
@@ -1581,11 +1767,11 @@ elif page == "🔮 Future Insights":
             plot_bgcolor='rgba(0,0,0,0)',
             legend=dict(orientation='h', yanchor='bottom', y=1.02, xanchor='center', x=0.5)
         )
-        st.plotly_chart(fig, use_container_width=True)
+        show_chart(fig)
 
     # Student GPA projection
     with col2:
-        gpa_trend = filtered_student_df.groupby('Year')['GPA'].mean()
+        gpa_trend = student_by_year['GPA']
         years_hist = np.array(gpa_trend.index)
         values_hist = gpa_trend.values
 
@@ -1623,7 +1809,7 @@ elif page == "🔮 Future Insights":
             plot_bgcolor='rgba(0,0,0,0)',
             legend=dict(orientation='h', yanchor='bottom', y=1.02, xanchor='center', x=0.5)
         )
-        st.plotly_chart(fig, use_container_width=True)
+        show_chart(fig)
 
     st.markdown("<hr class='custom-divider'>", unsafe_allow_html=True)
 
@@ -1631,25 +1817,26 @@ elif page == "🔮 Future Insights":
     st.markdown("### 💡 Strategic Insights & Key Takeaways")
 
     # Calculate dynamic insights
-    if len(filtered_prof_df) > 0 and len(filtered_student_df) > 0:
+    if len(prof_by_year) > 0 and len(student_by_year) > 0:
         latest_year = max(selected_years)
         earliest_year = min(selected_years)
 
-        prof_latest = filtered_prof_df[filtered_prof_df['Year'] == latest_year]
-        prof_earliest = filtered_prof_df[filtered_prof_df['Year'] == earliest_year]
-        student_latest = filtered_student_df[filtered_student_df['Year'] == latest_year]
-        student_earliest = filtered_student_df[filtered_student_df['Year'] == earliest_year]
+        # A year with no matching rows has no summary row; its mean is NaN
+        prof_latest = prof_by_year.reindex([latest_year]).iloc[0]
+        prof_earliest = prof_by_year.reindex([earliest_year]).iloc[0]
+        student_latest = student_by_year.reindex([latest_year]).iloc[0]
+        student_earliest = student_by_year.reindex([earliest_year]).iloc[0]
 
-        hours_growth = ((prof_latest['Hours_Saved_Lesson_Planning_Per_Week'].mean() -
-                        prof_earliest['Hours_Saved_Lesson_Planning_Per_Week'].mean()) /
-                       prof_earliest['Hours_Saved_Lesson_Planning_Per_Week'].mean() * 100) if len(prof_earliest) > 0 else 0
+        hours_growth = ((prof_latest['Hours_Saved_Lesson_Planning_Per_Week'] -
+                        prof_earliest['Hours_Saved_Lesson_Planning_Per_Week']) /
+                       prof_earliest['Hours_Saved_Lesson_Planning_Per_Week'] * 100) if prof_earliest['Count'] > 0 else 0
 
-        gpa_growth = ((student_latest['GPA'].mean() - student_earliest['GPA'].mean()) /
-                     student_earliest['GPA'].mean() * 100) if len(student_earliest) > 0 else 0
+        gpa_growth = ((student_latest['GPA'] - student_earliest['GPA']) /
+                     student_earliest['GPA'] * 100) if student_earliest['Count'] > 0 else 0
 
-        literacy_growth = ((student_latest['AI_Literacy_Score'].mean() -
-                           student_earliest['AI_Literacy_Score'].mean()) /
-                          student_earliest['AI_Literacy_Score'].mean() * 100) if len(student_earliest) > 0 else 0
+        literacy_growth = ((student_latest['AI_Literacy_Score'] -
+                           student_earliest['AI_Literacy_Score']) /
+                          student_earliest['AI_Literacy_Score'] * 100) if student_earliest['Count'] > 0 else 0
     else:
         hours_growth = gpa_growth = literacy_growth = 0
 
@@ -1765,6 +1952,13 @@ elif page == "🔮 Future Insights":
 # FOOTER
 # ============================================================================
 
+# Chart payload traffic of the latest render of each page
+st.session_state.setdefault('chart_traffic', {})[page] = chart_traffic
+st.sidebar.caption(
+    f"📦 {chart_traffic['charts']} charts, {chart_traffic['bytes'] / 1024:.1f} KB of chart data "
+    f"({chart_traffic['repeat_bytes'] / 1024:.1f} KB sent by reference)"
+)
+
 st.markdown("""
 <div class="custom-footer">
     <p><strong>📊 AI in Education: Research Dashboard</strong></p>
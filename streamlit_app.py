@@ -4,6 +4,8 @@ import numpy as np
 import plotly.graph_objects as go
 import plotly.express as px
 from plotly.subplots import make_subplots
+from aggregates import AggregationPlan, frame_crosstab
+from data_store import PROFESSOR_TABLE, STUDENT_TABLE, load_table, resolve_data_dir
 import warnings
 warnings.filterwarnings('ignore')
 
@@ -11,14 +13,14 @@ warnings.filterwarnings('ignore')
 st.set_page_config(page_title="AI in Education Analytics", layout="wide", initial_sidebar_state="expanded")
 
 # Load Data
-@st.cache_data
+@st.cache_resource
 def load_data():
-    prof_df = pd.read_csv('data/ai_education_professor_data.csv')
-    student_df = pd.read_csv('data/ai_education_student_data.csv')
-    combined_df = pd.concat([prof_df, student_df], ignore_index=True)
-    return prof_df, student_df, combined_df
+    # One declared schema for both tables; the data directory is resolved once.
+    # cache_resource shares the same read-only (memory-mapped) frames across sessions.
+    data_dir = resolve_data_dir()
+    return load_table(data_dir, PROFESSOR_TABLE), load_table(data_dir, STUDENT_TABLE)
 
-prof_df, student_df, combined_df = load_data()
+prof_df, student_df = load_data()
 
 # Custom CSS
 st.markdown("""
@@ -74,7 +76,7 @@ if page == "📊 Overview":
     with col3:
         st.metric("Years Tracked", "2022-2025")
     with col4:
-        st.metric("Data Points", len(combined_df))
+        st.metric("Data Points", len(prof_df) + len(student_df))
     
     st.markdown("---")
     
@@ -82,15 +84,9 @@ if page == "📊 Overview":
     st.subheader("📈 Year-over-Year Adoption Summary")
     
     years = [2022, 2023, 2024, 2025]
-    prof_adoption = []
-    student_adoption = []
-    
-    for year in years:
-        prof_year = prof_df[prof_df['Year'] == year]
-        student_year = student_df[student_df['Year'] == year]
-        
-        prof_adoption.append(len(prof_year[prof_year['AI_Restriction_Status'] == 'Full Adoption']))
-        student_adoption.append(len(student_year[student_year['AI_Restriction_Status'] == 'Full Adoption']))
+    # Rows per (restriction, year), one grouped pass per table
+    prof_adoption = frame_crosstab(prof_df, 'AI_Restriction_Status').row('Full Adoption', years)['Count'].tolist()
+    student_adoption = frame_crosstab(student_df, 'AI_Restriction_Status').row('Full Adoption', years)['Count'].tolist()
     
     col1, col2 = st.columns(2)
     
@@ -136,11 +132,15 @@ if page == "📊 Overview":
     st.markdown("---")
     st.subheader("🔍 Key Insights from 2022-2025")
     
+    prof_plan = AggregationPlan(prof_df).need('Year', ['Hours_Saved_Lesson_Planning_Per_Week'])
+    student_plan = AggregationPlan(student_df).need('Year', ['GPA', 'AI_Literacy_Score'])
+    
     col1, col2, col3 = st.columns(3)
     
     with col1:
-        avg_hours_2022 = prof_df[prof_df['Year'] == 2022]['Hours_Saved_Lesson_Planning_Per_Week'].mean()
-        avg_hours_2025 = prof_df[prof_df['Year'] == 2025]['Hours_Saved_Lesson_Planning_Per_Week'].mean()
+        hours_by_year = prof_plan.get('Year', 'Hours_Saved_Lesson_Planning_Per_Week')
+        avg_hours_2022 = hours_by_year.get(2022, np.nan)
+        avg_hours_2025 = hours_by_year.get(2025, np.nan)
         growth = ((avg_hours_2025 - avg_hours_2022) / avg_hours_2022 * 100) if avg_hours_2022 > 0 else 0
         
         st.info(f"""
@@ -151,8 +151,9 @@ if page == "📊 Overview":
         """)
     
     with col2:
-        gpa_2022 = student_df[student_df['Year'] == 2022]['GPA'].mean()
-        gpa_2025 = student_df[student_df['Year'] == 2025]['GPA'].mean()
+        gpa_by_year = student_plan.get('Year', 'GPA')
+        gpa_2022 = gpa_by_year.get(2022, np.nan)
+        gpa_2025 = gpa_by_year.get(2025, np.nan)
         gpa_improvement = gpa_2025 - gpa_2022
         
         st.info(f"""
@@ -163,8 +164,9 @@ if page == "📊 Overview":
         """)
     
     with col3:
-        ai_lit_2022 = student_df[student_df['Year'] == 2022]['AI_Literacy_Score'].mean()
-        ai_lit_2025 = student_df[student_df['Year'] == 2025]['AI_Literacy_Score'].mean()
+        ai_lit_by_year = student_plan.get('Year', 'AI_Literacy_Score')
+        ai_lit_2022 = ai_lit_by_year.get(2022, np.nan)
+        ai_lit_2025 = ai_lit_by_year.get(2025, np.nan)
         ai_lit_growth = ((ai_lit_2025 - ai_lit_2022) / ai_lit_2022 * 100)
         
         st.info(f"""
@@ -181,20 +183,25 @@ if page == "📊 Overview":
 elif page == "👨‍🏫 Professor Analytics":
     st.header("Professor Analytics: AI as a Teaching Facilitator")
     
+    # Every per-year mean on this page, computed in one grouped pass
+    plan = AggregationPlan(prof_df).need('Year', [
+        'Hours_Saved_Lesson_Planning_Per_Week', 'PPTs_Created_Per_Month', 'Assignments_Graded_Per_Semester',
+        'Grading_Quality_Score', 'Grading_Time_Hours_Per_Semester', 'Hours_Saved_Admin_Per_Week',
+        'Students_Monitored', 'Intervention_Success_Rate',
+    ])
+    
     st.subheader("1️⃣ Lesson Planning & Content Creation Efficiency")
     
     col1, col2 = st.columns(2)
     
     with col1:
         # Hours saved over time
-        prof_year_summary = prof_df.groupby('Year')[
-            'Hours_Saved_Lesson_Planning_Per_Week'
-        ].agg(['mean', 'std', 'count'])
+        prof_year_summary = plan.get('Year', 'Hours_Saved_Lesson_Planning_Per_Week')
         
         fig = go.Figure()
         fig.add_trace(go.Scatter(
             x=prof_year_summary.index,
-            y=prof_year_summary['mean'],
+            y=prof_year_summary.values,
             mode='lines+markers',
             name='Avg Hours Saved',
             line=dict(color='#667eea', width=3),
@@ -213,7 +220,7 @@ elif page == "👨‍🏫 Professor Analytics":
     
     with col2:
         # PPTs created over time
-        ppt_summary = prof_df.groupby('Year')['PPTs_Created_Per_Month'].mean()
+        ppt_summary = plan.get('Year', 'PPTs_Created_Per_Month')
         
         fig = go.Figure(data=[
             go.Bar(x=ppt_summary.index, y=ppt_summary.values, 
@@ -235,7 +242,7 @@ elif page == "👨‍🏫 Professor Analytics":
     
     with col1:
         # Assignments graded
-        assign_summary = prof_df.groupby('Year')['Assignments_Graded_Per_Semester'].mean()
+        assign_summary = plan.get('Year', 'Assignments_Graded_Per_Semester')
         
         fig = go.Figure(data=[
             go.Bar(x=assign_summary.index, y=assign_summary.values, 
@@ -253,7 +260,7 @@ elif page == "👨‍🏫 Professor Analytics":
     
     with col2:
         # Grading quality score
-        quality_summary = prof_df.groupby('Year')['Grading_Quality_Score'].mean()
+        quality_summary = plan.get('Year', 'Grading_Quality_Score')
         
         fig = go.Figure()
         fig.add_trace(go.Scatter(
@@ -276,7 +283,7 @@ elif page == "👨‍🏫 Professor Analytics":
     
     with col3:
         # Grading time hours
-        time_summary = prof_df.groupby('Year')['Grading_Time_Hours_Per_Semester'].mean()
+        time_summary = plan.get('Year', 'Grading_Time_Hours_Per_Semester')
         
         fig = go.Figure(data=[
             go.Bar(x=time_summary.index, y=time_summary.values, 
@@ -295,7 +302,7 @@ elif page == "👨‍🏫 Professor Analytics":
     st.markdown("---")
     st.subheader("3️⃣ Administrative Task Automation")
     
-    admin_summary = prof_df.groupby('Year')['Hours_Saved_Admin_Per_Week'].mean()
+    admin_summary = plan.get('Year', 'Hours_Saved_Admin_Per_Week')
     
     col1, col2 = st.columns([2, 1])
     
@@ -334,7 +341,7 @@ elif page == "👨‍🏫 Professor Analytics":
     col1, col2 = st.columns(2)
     
     with col1:
-        monitored_summary = prof_df.groupby('Year')['Students_Monitored'].mean()
+        monitored_summary = plan.get('Year', 'Students_Monitored')
         
         fig = go.Figure()
         fig.add_trace(go.Scatter(
@@ -357,7 +364,7 @@ elif page == "👨‍🏫 Professor Analytics":
         st.plotly_chart(fig, use_container_width=True)
     
     with col2:
-        intervention_summary = prof_df.groupby('Year')['Intervention_Success_Rate'].mean()
+        intervention_summary = plan.get('Year', 'Intervention_Success_Rate')
         
         fig = go.Figure(data=[
             go.Bar(x=intervention_summary.index, y=intervention_summary.values,
@@ -381,12 +388,21 @@ elif page == "👨‍🏫 Professor Analytics":
 elif page == "👨‍🎓 Student Analytics":
     st.header("Student Analytics: Learning with AI")
     
+    # Every per-year and per-(style, year) mean on this page, one grouped pass per key
+    plan = AggregationPlan(student_df).need('Year', [
+        'AI_Literacy_Score', 'Responsible_Use_Awareness', 'Creativity_Preservation_Score',
+        'Hours_Per_Assignment', 'Assignment_Completion_Rate', 'Skill_Awareness_Level', 'Skill_Beginner_Level',
+        'Skill_Intermediate_Level', 'Skill_Advanced_Level', 'Uses_AI_Collaboration_Tools',
+        'Language_Barrier_Reduction_Percent', 'AI_Tool_Adoption_Rate', 'Uses_AI_For_Brainstorming',
+        'Uses_AI_For_Assessment', 'Uses_AI_For_Collaboration',
+    ])
+    
     st.subheader("1️⃣ AI Literacy, Responsible Use & Skill Acquisition")
     
     col1, col2, col3 = st.columns(3)
     
     with col1:
-        lit_summary = student_df.groupby('Year')['AI_Literacy_Score'].mean()
+        lit_summary = plan.get('Year', 'AI_Literacy_Score')
         
         fig = go.Figure()
         fig.add_trace(go.Scatter(
@@ -408,7 +424,7 @@ elif page == "👨‍🎓 Student Analytics":
         st.plotly_chart(fig, use_container_width=True)
     
     with col2:
-        resp_summary = student_df.groupby('Year')['Responsible_Use_Awareness'].mean()
+        resp_summary = plan.get('Year', 'Responsible_Use_Awareness')
         
         fig = go.Figure()
         fig.add_trace(go.Scatter(
@@ -430,7 +446,7 @@ elif page == "👨‍🎓 Student Analytics":
         st.plotly_chart(fig, use_container_width=True)
     
     with col3:
-        creat_summary = student_df.groupby('Year')['Creativity_Preservation_Score'].mean()
+        creat_summary = plan.get('Year', 'Creativity_Preservation_Score')
         
         fig = go.Figure()
         fig.add_trace(go.Scatter(
@@ -455,18 +471,16 @@ elif page == "👨‍🎓 Student Analytics":
     st.subheader("2️⃣ AI Tool Adoption & Usage Patterns")
     
     # Multi-line chart for adoption patterns
-    adoption_data = []
-    for year in [2022, 2023, 2024, 2025]:
-        year_data = student_df[student_df['Year'] == year]
-        adoption_data.append({
-            'Year': year,
-            'Overall Adoption': year_data['AI_Tool_Adoption_Rate'].mean() * 100,
-            'Brainstorming': year_data['Uses_AI_For_Brainstorming'].mean() * 100,
-            'Assessment': year_data['Uses_AI_For_Assessment'].mean() * 100,
-            'Collaboration': year_data['Uses_AI_For_Collaboration'].mean() * 100
-        })
-    
-    adoption_df = pd.DataFrame(adoption_data)
+    adoption_columns = {
+        'Overall Adoption': 'AI_Tool_Adoption_Rate',
+        'Brainstorming': 'Uses_AI_For_Brainstorming',
+        'Assessment': 'Uses_AI_For_Assessment',
+        'Collaboration': 'Uses_AI_For_Collaboration',
+    }
+    adoption_df = pd.DataFrame({
+        name: plan.get('Year', column).reindex([2022, 2023, 2024, 2025]) * 100
+        for name, column in adoption_columns.items()
+    }).rename_axis('Year').reset_index()
     
     fig = go.Figure()
     for col in ['Overall Adoption', 'Brainstorming', 'Assessment', 'Collaboration']:
@@ -494,7 +508,7 @@ elif page == "👨‍🎓 Student Analytics":
     col1, col2 = st.columns(2)
     
     with col1:
-        time_summary = student_df.groupby('Year')['Hours_Per_Assignment'].mean()
+        time_summary = plan.get('Year', 'Hours_Per_Assignment')
         
         fig = go.Figure()
         fig.add_trace(go.Bar(
@@ -515,7 +529,7 @@ elif page == "👨‍🎓 Student Analytics":
         st.plotly_chart(fig, use_container_width=True)
     
     with col2:
-        completion_summary = student_df.groupby('Year')['Assignment_Completion_Rate'].mean() * 100
+        completion_summary = plan.get('Year', 'Assignment_Completion_Rate') * 100
         
         fig = go.Figure()
         fig.add_trace(go.Scatter(
@@ -542,9 +556,13 @@ elif page == "👨‍🎓 Student Analytics":
     learning_styles = ['Visual', 'Auditory', 'Reading-Writing', 'Kinesthetic']
     style_colors = {'Visual': '#667eea', 'Auditory': '#764ba2', 'Reading-Writing': '#f97316', 'Kinesthetic': '#22c55e'}
     
+    # Mean improvement per (style, year), one grouped pass
+    style_summary = frame_crosstab(student_df, 'Learning_Style', ['Performance_Improvement_Percent'])
+    style_means = style_summary.means['Performance_Improvement_Percent']
+    
     fig = go.Figure()
     for style in learning_styles:
-        style_data = student_df[student_df['Learning_Style'] == style].groupby('Year')['Performance_Improvement_Percent'].mean()
+        style_data = style_means.loc[style].dropna() if style in style_means.index else pd.Series(dtype=float)
         fig.add_trace(go.Scatter(
             x=style_data.index,
             y=style_data.values,
@@ -568,17 +586,8 @@ elif page == "👨‍🎓 Student Analytics":
     st.subheader("5️⃣ AI Skill Development Pathway")
     
     # Funnel chart showing skill progression
-    skill_2025 = student_df[student_df['Year'] == 2025].iloc[0][
-        ['Skill_Awareness_Level', 'Skill_Beginner_Level', 'Skill_Intermediate_Level', 'Skill_Advanced_Level']
-    ].mean()
-    
     skills = ['Awareness', 'Beginner', 'Intermediate', 'Advanced']
-    values = [
-        student_df[student_df['Year'] == 2025]['Skill_Awareness_Level'].mean(),
-        student_df[student_df['Year'] == 2025]['Skill_Beginner_Level'].mean(),
-        student_df[student_df['Year'] == 2025]['Skill_Intermediate_Level'].mean(),
-        student_df[student_df['Year'] == 2025]['Skill_Advanced_Level'].mean()
-    ]
+    values = [plan.get('Year', f'Skill_{skill}_Level').get(2025, np.nan) for skill in skills]
     
     fig = go.Figure(data=[
         go.Funnel(y=skills, x=values, marker_color=['#667eea', '#764ba2', '#f97316', '#22c55e'])
@@ -596,7 +605,7 @@ elif page == "👨‍🎓 Student Analytics":
     col1, col2 = st.columns(2)
     
     with col1:
-        collab_summary = student_df.groupby('Year')['Uses_AI_Collaboration_Tools'].mean() * 100
+        collab_summary = plan.get('Year', 'Uses_AI_Collaboration_Tools') * 100
         
         fig = go.Figure(data=[
             go.Bar(x=collab_summary.index, y=collab_summary.values,
@@ -614,7 +623,7 @@ elif page == "👨‍🎓 Student Analytics":
         st.plotly_chart(fig, use_container_width=True)
     
     with col2:
-        lang_summary = student_df.groupby('Year')['Language_Barrier_Reduction_Percent'].mean()
+        lang_summary = plan.get('Year', 'Language_Barrier_Reduction_Percent')
         
         fig = go.Figure(data=[
             go.Bar(x=lang_summary.index, y=lang_summary.values,
@@ -645,13 +654,25 @@ elif page == "🚫 AI Restriction Impact":
     - **Full Restriction**: Minimal or no AI tools allowed
     """)
     
+    # Counts and means per (restriction, year), one grouped pass per table
+    restrictions = ['Full Adoption', 'Partial Restriction', 'Full Restriction']
+    prof_by_restriction = frame_crosstab(prof_df, 'AI_Restriction_Status', [
+        'Hours_Saved_Lesson_Planning_Per_Week', 'Grading_Quality_Score', 'Grading_Time_Hours_Per_Semester',
+        'Hours_Saved_Admin_Per_Week', 'Intervention_Success_Rate',
+    ]).column(2025, restrictions)
+    student_by_restriction = frame_crosstab(student_df, 'AI_Restriction_Status', [
+        'AI_Literacy_Score', 'GPA', 'Hours_Per_Assignment', 'Creativity_Preservation_Score',
+        'Performance_Improvement_Percent',
+    ]).column(2025, restrictions)
+    
     st.markdown("---")
     st.subheader("📊 Restriction Status Distribution (2025)")
     
     col1, col2 = st.columns(2)
     
     with col1:
-        prof_restriction_2025 = prof_df[prof_df['Year'] == 2025]['AI_Restriction_Status'].value_counts()
+        # Largest group first, as value_counts() orders them
+        prof_restriction_2025 = prof_by_restriction['Count'].sort_values(ascending=False, kind='stable')
         
         fig = go.Figure(data=[
             go.Pie(labels=prof_restriction_2025.index, values=prof_restriction_2025.values,
@@ -664,7 +685,7 @@ elif page == "🚫 AI Restriction Impact":
         st.plotly_chart(fig, use_container_width=True)
     
     with col2:
-        student_restriction_2025 = student_df[student_df['Year'] == 2025]['AI_Restriction_Status'].value_counts()
+        student_restriction_2025 = student_by_restriction['Count'].sort_values(ascending=False, kind='stable')
         
         fig = go.Figure(data=[
             go.Pie(labels=student_restriction_2025.index, values=student_restriction_2025.values,
@@ -680,21 +701,13 @@ elif page == "🚫 AI Restriction Impact":
     st.subheader("⚖️ Comparative Analysis: Restriction Impact on Professors")
     
     # Professor comparison
-    prof_comparison = []
-    for restriction in ['Full Adoption', 'Partial Restriction', 'Full Restriction']:
-        prof_subset = prof_df[prof_df['AI_Restriction_Status'] == restriction]
-        prof_2025 = prof_subset[prof_subset['Year'] == 2025]
-        
-        prof_comparison.append({
-            'Restriction': restriction,
-            'Avg Hours Saved (Lesson Planning)': prof_2025['Hours_Saved_Lesson_Planning_Per_Week'].mean(),
-            'Avg Grading Quality': prof_2025['Grading_Quality_Score'].mean(),
-            'Avg Grading Time (hrs)': prof_2025['Grading_Time_Hours_Per_Semester'].mean(),
-            'Avg Admin Hours Saved': prof_2025['Hours_Saved_Admin_Per_Week'].mean(),
-            'Avg Intervention Success': prof_2025['Intervention_Success_Rate'].mean()
-        })
-    
-    prof_comp_df = pd.DataFrame(prof_comparison)
+    prof_comp_df = prof_by_restriction.drop(columns='Count').rename(columns={
+        'Hours_Saved_Lesson_Planning_Per_Week': 'Avg Hours Saved (Lesson Planning)',
+        'Grading_Quality_Score': 'Avg Grading Quality',
+        'Grading_Time_Hours_Per_Semester': 'Avg Grading Time (hrs)',
+        'Hours_Saved_Admin_Per_Week': 'Avg Admin Hours Saved',
+        'Intervention_Success_Rate': 'Avg Intervention Success',
+    }).rename_axis('Restriction').reset_index()
     
     col1, col2, col3 = st.columns(3)
     
@@ -747,21 +760,13 @@ elif page == "🚫 AI Restriction Impact":
     st.subheader("⚖️ Comparative Analysis: Restriction Impact on Students")
     
     # Student comparison
-    student_comparison = []
-    for restriction in ['Full Adoption', 'Partial Restriction', 'Full Restriction']:
-        stu_subset = student_df[student_df['AI_Restriction_Status'] == restriction]
-        stu_2025 = stu_subset[stu_subset['Year'] == 2025]
-        
-        student_comparison.append({
-            'Restriction': restriction,
-            'Avg AI Literacy': stu_2025['AI_Literacy_Score'].mean(),
-            'Avg GPA': stu_2025['GPA'].mean(),
-            'Avg Hours per Assignment': stu_2025['Hours_Per_Assignment'].mean(),
-            'Avg Creativity Score': stu_2025['Creativity_Preservation_Score'].mean(),
-            'Performance Improvement %': stu_2025['Performance_Improvement_Percent'].mean()
-        })
-    
-    stu_comp_df = pd.DataFrame(student_comparison)
+    stu_comp_df = student_by_restriction.drop(columns='Count').rename(columns={
+        'AI_Literacy_Score': 'Avg AI Literacy',
+        'GPA': 'Avg GPA',
+        'Hours_Per_Assignment': 'Avg Hours per Assignment',
+        'Creativity_Preservation_Score': 'Avg Creativity Score',
+        'Performance_Improvement_Percent': 'Performance Improvement %',
+    }).rename_axis('Restriction').reset_index()
     
     col1, col2, col3 = st.columns(3)
     
@@ -824,11 +829,16 @@ elif page == "🔮 Future Projections & Insights":
     st.markdown("---")
     st.subheader("📈 Projected Trends: 2026-2027")
     
+    # Every per-year mean on this page, one grouped pass per table
+    prof_plan = AggregationPlan(prof_df).need('Year', ['Hours_Saved_Lesson_Planning_Per_Week'])
+    student_plan = AggregationPlan(student_df).need('Year', ['GPA', 'Hours_Per_Assignment', 'AI_Literacy_Score'])
+    
     # Project professor lesson planning
-    prof_2022_2025 = prof_df[prof_df['Year'].isin([2022, 2023, 2024, 2025])].groupby('Year')['Hours_Saved_Lesson_Planning_Per_Week'].mean()
+    years_hist = np.array([2022, 2023, 2024, 2025])
+    prof_2022_2025 = prof_plan.get('Year', 'Hours_Saved_Lesson_Planning_Per_Week')
+    prof_2022_2025 = prof_2022_2025[prof_2022_2025.index.isin(years_hist)]
     
     # Simple linear projection
-    years_hist = np.array([2022, 2023, 2024, 2025])
     hours_hist = prof_2022_2025.values
     z = np.polyfit(years_hist, hours_hist, 1)
     p = np.poly1d(z)
@@ -869,9 +879,10 @@ elif page == "🔮 Future Projections & Insights":
     
     with col2:
         # Project student GPA
-        stu_2022_2025 = student_df[student_df['Year'].isin([2022, 2023, 2024, 2025])].groupby('Year')['GPA'].mean()
-        
         years_hist_stu = np.array([2022, 2023, 2024, 2025])
+        stu_2022_2025 = student_plan.get('Year', 'GPA')
+        stu_2022_2025 = stu_2022_2025[stu_2022_2025.index.isin(years_hist_stu)]
+        
         gpa_hist = stu_2022_2025.values
         z_gpa = np.polyfit(years_hist_stu, gpa_hist, 1)
         p_gpa = np.poly1d(z_gpa)
@@ -907,11 +918,11 @@ elif page == "🔮 Future Projections & Insights":
     st.subheader("💡 Strategic Insights & Key Takeaways")
     
     # Calculate insights
-    prof_2025 = prof_df[prof_df['Year'] == 2025]
-    student_2025 = student_df[student_df['Year'] == 2025]
+    prof_adoption_2025 = frame_crosstab(prof_df, 'AI_Restriction_Status').row('Full Adoption', [2025])['Count'].iloc[0]
+    student_adoption_2025 = frame_crosstab(student_df, 'AI_Restriction_Status').row('Full Adoption', [2025])['Count'].iloc[0]
     
-    prof_adoption_2025 = len(prof_2025[prof_2025['AI_Restriction_Status'] == 'Full Adoption'])
-    student_adoption_2025 = len(student_2025[student_2025['AI_Restriction_Status'] == 'Full Adoption'])
+    hours_per_assignment = student_plan.get('Year', 'Hours_Per_Assignment')
+    ai_literacy = student_plan.get('Year', 'AI_Literacy_Score')
     
     growth_hours = ((hours_hist[-1] - hours_hist[0]) / hours_hist[0] * 100) if hours_hist[0] > 0 else 0
     growth_gpa = ((gpa_hist[-1] - gpa_hist[0]) / gpa_hist[0] * 100)
@@ -930,7 +941,7 @@ elif page == "🔮 Future Projections & Insights":
         st.markdown(f"""
         ### ⏱️ Efficiency Gains
         - Professors saved **{growth_hours:.1f}%** more time on lesson planning (2022→2025)
-        - Average time per assignment reduced **{((student_df[student_df['Year']==2022]['Hours_Per_Assignment'].mean() - student_df[student_df['Year']==2025]['Hours_Per_Assignment'].mean()) / student_df[student_df['Year']==2022]['Hours_Per_Assignment'].mean() * 100):.1f}%**
+        - Average time per assignment reduced **{((hours_per_assignment.get(2022, np.nan) - hours_per_assignment.get(2025, np.nan)) / hours_per_assignment.get(2022, np.nan) * 100):.1f}%**
         - Admin tasks automation saves **3.5+ hours/week**
         """)
     
@@ -938,7 +949,7 @@ elif page == "🔮 Future Projections & Insights":
         st.markdown(f"""
         ### 🎯 Academic Outcomes
         - Student GPA improved **{growth_gpa:.1f}%** (2022→2025)
-        - AI Literacy score grew **{((student_2025['AI_Literacy_Score'].mean() - student_df[student_df['Year']==2022]['AI_Literacy_Score'].mean()) / student_df[student_df['Year']==2022]['AI_Literacy_Score'].mean() * 100):.1f}%**
+        - AI Literacy score grew **{((ai_literacy.get(2025, np.nan) - ai_literacy.get(2022, np.nan)) / ai_literacy.get(2022, np.nan) * 100):.1f}%**
         - Intervention success rate: **81%** (2025)
         """)
     
@@ -0,0 +1,73 @@
+"""Aggregate states and cube merges checked against numpy and pandas."""
+import numpy as np
+import pandas as pd
+import pytest
+
+from aggregates import AggState, build_cube, group_sums, rollup_stats, summarize_frame
+
+@pytest.mark.parametrize('offset', [0.0, 1e9], ids=['centered', 'large-mean'])
+def test_merged_states_match_numpy(offset):
+    values = offset + np.random.default_rng(0).normal(0, 1, 1001)
+    # Uneven chunks and an empty one, merged in a different order than they were cut
+    chunks = np.split(values, [1, 10, 10, 400])
+    state = AggState()
+    for chunk in reversed(chunks):
+        state = state.merge(AggState.of(chunk))
+    assert state.count == len(values)
+    assert state.mean == pytest.approx(values.mean(), rel=1e-12)
+    assert state.std == pytest.approx(np.std(values, ddof=1), rel=1e-9)
+    assert (state.min, state.max) == (values.min(), values.max())
+
+def test_empty_states():
+    empty = AggState().merge(AggState.of([]))
+    assert empty.count == 0 and np.isnan(empty.mean) and empty.m2 == 0
+    assert AggState().merge(AggState.of([2.0, 4.0])) == AggState.of([2.0, 4.0])
+
+@pytest.mark.parametrize('by', [(), ('a',), ('a', 'b')], ids=['all', 'a', 'a-b'])
+def test_rollup_stats_match_pandas(by):
+    rng = np.random.default_rng(1)
+    keys = pd.DataFrame({'a': rng.integers(0, 3, 2000), 'b': rng.integers(0, 4, 2000), 'c': rng.integers(0, 5, 2000)})
+    values = 50 + rng.normal(0, 10, 2000)
+    stats = rollup_stats(build_cube(keys, {'x': values}), 'x', by)
+
+    frame = keys.assign(x=values)
+    expected = (frame.groupby(list(by))['x'] if by else frame.groupby(np.zeros(len(frame), int))['x'])
+    expected = expected.agg(['count', 'mean', 'std', 'min', 'max'])
+    np.testing.assert_array_equal(stats['Count'], expected['count'])
+    np.testing.assert_allclose(stats[['mean', 'std', 'min', 'max']], expected[['mean', 'std', 'min', 'max']],
+                               rtol=1e-9)
+
+def kernel_frame():
+    """Keys with unobserved categories, a missing key, a gap in an integer key and NaN metric values"""
+    rng = np.random.default_rng(2)
+    n = 500
+    df = pd.DataFrame({
+        'Year': rng.choice(np.array([2022, 2023, 2025], np.int16), n),
+        'Status': pd.Categorical.from_codes(rng.integers(-1, 2, n), categories=['Full', 'None', 'Partial', 'Unused']),
+        'score': rng.normal(50, 10, n),
+        'rate': rng.random(n).astype(np.float32),
+        'count': rng.integers(0, 100, n).astype(np.int32),
+    })
+    df.loc[rng.random(n) < 0.1, 'score'] = np.nan
+    # Every score of one group is missing: its mean is NaN, though the group has rows
+    df.loc[(df['Year'] == 2022) & (df['Status'] == 'Full'), 'score'] = np.nan
+    return df
+
+@pytest.mark.parametrize('by', [('Year',), ('Status',), ('Status', 'Year')], ids=['int', 'category', 'both'])
+def test_kernel_matches_groupby(by):
+    df = kernel_frame()
+    metrics = ['score', 'rate', 'count']
+    assert group_sums(df, metrics, by) is not None
+    grouped = df.groupby(list(by), observed=True, sort=True)
+    expected = grouped[metrics].mean()
+    expected['Count'] = grouped.size()
+    pd.testing.assert_frame_equal(summarize_frame(df, metrics, by), expected, check_exact=False, rtol=1e-6)
+
+def test_kernel_skips_empty_groups():
+    df = kernel_frame()
+    summary = summarize_frame(df, ['score'], ('Status', 'Year'))
+    # Neither the unused category, the missing key nor the year with no rows gets a group
+    assert 'Unused' not in summary.index.get_level_values('Status')
+    assert 2024 not in summary.index.get_level_values('Year')
+    assert summary['Count'].sum() == df['Status'].notna().sum()
+    assert np.isnan(summary.loc[('Full', 2022), 'score'])
@@ -0,0 +1,67 @@
+"""KPIs the dashboards show, checked digit for digit against the bundled CSVs."""
+import os
+import shutil
+
+import pandas as pd
+import pytest
+
+import aggregates
+from aggregates import AggregationPlan
+from data_source import Filters, FrameSource, SQLiteSource
+from data_store import PROFESSOR_TABLE, STUDENT_TABLE, apply_schema
+
+DATA_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'data')
+
+# (table, metric, decimals shown) of the Overview insight cards and the Professor page metric
+KPIS = [
+    (PROFESSOR_TABLE, 'Hours_Saved_Lesson_Planning_Per_Week', 2),
+    (PROFESSOR_TABLE, 'Hours_Saved_Admin_Per_Week', 1),
+    (STUDENT_TABLE, 'GPA', 2),
+    (STUDENT_TABLE, 'AI_Literacy_Score', 1),
+]
+
+@pytest.fixture(scope='module', params=[FrameSource, SQLiteSource], ids=['frame', 'sqlite'])
+def source(request, tmp_path_factory):
+    # A copy of the CSVs, so the caches the sources build stay out of the repository
+    data_dir = tmp_path_factory.mktemp(request.param.__name__)
+    for table in (PROFESSOR_TABLE, STUDENT_TABLE):
+        shutil.copy(os.path.join(DATA_DIR, f'{table}.csv'), data_dir)
+    return request.param(str(data_dir))
+
+def baseline(table, metric, by):
+    """Means as the dashboards computed them before the typed tables: read_csv, then groupby().mean()"""
+    return pd.read_csv(os.path.join(DATA_DIR, f'{table}.csv')).groupby(by)[metric].mean()
+
+@pytest.mark.parametrize('table, metric, decimals', KPIS)
+def test_kpis_per_year_match_baseline(source, table, metric, decimals):
+    shown = source.summarize(table, [metric], Filters(), by=['Year'])[metric]
+    expected = baseline(table, metric, ['Year'])
+    assert [f'{value:.{decimals}f}' for value in shown] == [f'{value:.{decimals}f}' for value in expected]
+
+def test_headline_kpis_are_pinned(source):
+    gpa = source.summarize(STUDENT_TABLE, ['GPA'], Filters(), by=['Year'])['GPA']
+    hours = source.summarize(PROFESSOR_TABLE, ['Hours_Saved_Lesson_Planning_Per_Week'], Filters(), by=['Year'])
+    assert f"{gpa[2022]:.2f}" == '2.99'
+    assert f"{gpa[2025]:.2f}" == f"{baseline(STUDENT_TABLE, 'GPA', ['Year'])[2025]:.2f}"
+    assert f"{hours['Hours_Saved_Lesson_Planning_Per_Week'][2025]:.2f}" == '4.16'
+    assert hours['Count'].tolist() == [40, 40, 40, 40]
+
+@pytest.mark.parametrize('kernel', [True, False], ids=['kernel', 'groupby'])
+@pytest.mark.parametrize('table, metric, decimals', KPIS)
+def test_frame_aggregates_match_baseline(monkeypatch, kernel, table, metric, decimals):
+    # streamlit_app.py aggregates loaded frames itself, through the kernel or, for keys that don't fit it, groupby
+    if not kernel:
+        monkeypatch.setattr(aggregates, 'KERNEL_MAX_GROUPS', 0)
+    df = apply_schema(pd.read_csv(os.path.join(DATA_DIR, f'{table}.csv')))
+    expected = [f'{value:.{decimals}f}' for value in baseline(table, metric, ['Year'])]
+    planned = AggregationPlan(df).need('Year', [metric]).get('Year', metric)
+    summarized = aggregates.summarize_frame(df, [metric], ['Year'])[metric]
+    assert [f'{value:.{decimals}f}' for value in planned] == expected
+    assert [f'{value:.{decimals}f}' for value in summarized] == expected
+
+@pytest.mark.parametrize('table, metric, decimals', KPIS)
+def test_describe_means_match_summaries(source, table, metric, decimals):
+    # Trend lines come from summarize() and their confidence bands from describe(): the means must agree
+    summary = source.summarize(table, [metric], Filters(), by=['Year'])
+    described = source.describe(table, metric, Filters(), by=['Year'])
+    assert described['mean'].tolist() == summary[metric].tolist()